@@ -35,7 +35,7 @@ except ImportError:
 # Local imports
 from script_editor import load_episode_script
 from voice_registry import get_voice_registry, get_voice, map_characters_to_voices
-from story_structure import get_episode
+from story_structure import get_episode, save_episode
 
 # Setup logging
 logger = logging.getLogger(__name__)
@@ -199,8 +199,7 @@ class AudioPipeline:
                 "file_path": str(episode_file) if episode_file else None
             }
             
-            with open(episode_dir / "structure.json", 'w') as f:
-                json.dump(episode, f, indent=2)
+            save_episode(episode)
             
             return generation_meta
         
@@ -344,10 +343,11 @@ class AudioPipeline:
             audio_file = temp_dir / f"line_{line_index:03d}_{safe_character}.mp3"
             
             # Generate speech
-            audio_data = self.voice_registry.generate_speech(
+            self.voice_registry.generate_speech(
                 text=content,
                 voice_identifier=voice_identifier,
-                output_path=str(audio_file)
+                output_path=str(audio_file),
+                return_bytes=False
             )
             
             # Get audio duration using ffmpeg
@@ -403,10 +403,11 @@ class AudioPipeline:
                 return None
             
             # Generate speech
-            audio_data = self.voice_registry.generate_speech(
+            self.voice_registry.generate_speech(
                 text=content,
                 voice_identifier=voice_id,
-                output_path=str(audio_file)
+                output_path=str(audio_file),
+                return_bytes=False
             )
             
             # Get audio duration using ffmpeg
@@ -258,7 +258,8 @@ def cmd_generate_audio(args):
     arguments=[
         {'name': 'episode_id', **STR_ARG, 'help': 'ID of the episode to check'},
         {'name': '--script-only', **BOOL_ARG, 'help': 'Check only the script quality'},
-        {'name': '--audio-only', **BOOL_ARG, 'help': 'Check only the audio quality'}
+        {'name': '--audio-only', **BOOL_ARG, 'help': 'Check only the audio quality'},
+        {'name': '--skip-scene-audio', **BOOL_ARG, 'help': 'Skip checking individual scene audio files'}
     ]
 )
 def cmd_check_quality(args):
@@ -267,7 +268,8 @@ def cmd_check_quality(args):
     
     check_options = {
         'check_script': not args.audio_only,
-        'check_audio': not args.script_only
+        'check_audio': not args.script_only,
+        'check_scene_audio': not args.skip_scene_audio
     }
     
     return check_episode_quality(args.episode_id, check_options)
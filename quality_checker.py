@@ -11,17 +11,16 @@ import json
 import logging
 import time
 import re
+import bisect
+from collections import Counter
+from dataclasses import dataclass, asdict
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Union
+from typing import Dict, List, Any, Optional, Tuple, Union
 import uuid
+import asyncio
+import subprocess
 
 # Try to import required libraries
-try:
-    import ffmpeg
-except ImportError:
-    logging.error("ffmpeg-python not found. Please install it with: pip install ffmpeg-python")
-    raise
-
 try:
     from openai import OpenAI
 except ImportError:
@@ -37,9 +36,78 @@ from episode_memory import get_episode_memory
 # Setup logging
 logger = logging.getLogger(__name__)
 
+@dataclass
+class AudioIssue:
+    """Represents a problem found while checking episode audio."""
+    __slots__ = ("severity", "description", "location")
+    severity: str
+    description: str
+    location: Optional[str]
+
+# ffprobe arguments that print a file's format and streams as JSON
+_FFPROBE_ARGS = ["ffprobe", "-v", "error", "-print_format", "json",
+                 "-show_format", "-show_streams"]
+
+def _ffprobe_json(path: str) -> Dict[str, Any]:
+    """Run ffprobe on a file and return its format and stream information.
+    
+    Args:
+        path: Path to the media file
+    
+    Returns:
+        Parsed ffprobe JSON output
+    
+    Raises:
+        RuntimeError: If ffprobe exits with an error
+    """
+    result = subprocess.run(_FFPROBE_ARGS + [path], capture_output=True)
+    
+    if result.returncode != 0:
+        raise RuntimeError(f"ffprobe error: {result.stderr.decode('utf-8', errors='replace').strip()}")
+    
+    return json.loads(result.stdout)
+
+async def _ffprobe_json_async(path: str) -> Dict[str, Any]:
+    """Run ffprobe on a file without blocking the event loop.
+    
+    Args:
+        path: Path to the media file
+    
+    Returns:
+        Parsed ffprobe JSON output
+    
+    Raises:
+        RuntimeError: If ffprobe exits with an error
+    """
+    process = await asyncio.create_subprocess_exec(
+        *_FFPROBE_ARGS, path,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE
+    )
+    stdout, stderr = await process.communicate()
+    
+    if process.returncode != 0:
+        raise RuntimeError(f"ffprobe error: {stderr.decode('utf-8', errors='replace').strip()}")
+    
+    return json.loads(stdout)
+
 class QualityChecker:
     """Quality verification for episodes and audio."""
     
+    # Files smaller than this hold at most a container header and no audio
+    # frames, so they are reported without probing; ffprobe judges the rest
+    MIN_PROBE_BYTES = 1024
+    
+    # Keywords in audio issue descriptions that drive recommendations
+    _RECOMMENDATION_KEYWORDS = re.compile(r"integrity|sample rate|bit rate|codec|channels|missing")
+    
+    # Lower score bounds of each letter grade, and the grades they separate
+    _GRADE_BOUNDARIES = [4.0, 5.0, 5.5, 6.0, 6.5, 7.0, 7.5, 8.0, 8.5, 9.0, 9.5]
+    _GRADES = ["F", "D", "D+", "C-", "C", "C+", "B-", "B", "B+", "A-", "A", "A+"]
+    
+    # Sort order of issue severities
+    _SEVERITY_VALUES = {"error": 3, "warning": 2, "info": 1}
+    
     def __init__(self, episodes_dir: str = "episodes"):
         """Initialize the quality checker.
         
@@ -57,6 +125,9 @@ class QualityChecker:
         
         # Initialize episode memory
         self.episode_memory = get_episode_memory()
+        
+        # Probe results keyed by path, tagged with the file's mtime and size
+        self._probe_cache = {}
     
     def check_episode_quality(self, episode_id: str, 
                             check_options: Dict[str, bool] = None) -> Dict[str, Any]:
@@ -114,7 +185,7 @@ class QualityChecker:
         
         # Check audio quality if requested
         if check_options.get("check_audio", True):
-            audio_results = self._check_audio_quality(episode_id)
+            audio_results = self._check_audio_quality(episode_id, check_options)
             results["audio_quality"] = audio_results
             
             # Add audio issues to the main issues list
@@ -227,8 +298,10 @@ class QualityChecker:
         if "recommendations" in ai_evaluation:
             results["recommendations"] = ai_evaluation["recommendations"]
         
-        # Sort issues by severity
-        results["issues"].sort(key=lambda x: self._severity_to_value(x.get("severity", "warning")), reverse=True)
+        # Sort issues by severity, reading the severity table directly
+        severity_values = self._SEVERITY_VALUES
+        results["issues"].sort(key=lambda x: severity_values.get(x.get("severity", "warning"), 0),
+                               reverse=True)
         
         return results
     
@@ -403,13 +476,16 @@ class QualityChecker:
         for memory in memories:
             memory_text = memory.get("memory", "")
             
+            # Extract the memory's entities once rather than once per script line
+            memory_entities = self._extract_entities(memory_text)
+            
             # Check for potential contradictions
             for scene in script.get("scenes", []):
                 for line in scene.get("lines", []):
                     content = line.get("content", "")
                     
                     # This is a simplified check - would need NLP for better contradiction detection
-                    if content and len(content) > 20 and self._might_contradict(content, memory_text):
+                    if content and len(content) > 20 and self._might_contradict(content, memory_text, memory_entities):
                         issues.append({
                             "severity": "warning",
                             "description": f"Possible continuity contradiction with earlier episode",
@@ -418,12 +494,14 @@ class QualityChecker:
         
         return issues
     
-    def _might_contradict(self, text_a: str, text_b: str) -> bool:
+    def _might_contradict(self, text_a: str, text_b: str,
+                          entities_b: Optional[set] = None) -> bool:
         """Simple check if two texts might contradict each other.
         
         Args:
             text_a: First text
             text_b: Second text
+            entities_b: Pre-extracted entities of text_b, if already known
         
         Returns:
             True if contradiction is possible
@@ -435,11 +513,12 @@ class QualityChecker:
         # This is prone to false positives, but it's a starting point
         
         # Extract potential entity names (capitalized words)
-        entities_a = set(re.findall(r'\b[A-Z][a-z]+\b', text_a))
-        entities_b = set(re.findall(r'\b[A-Z][a-z]+\b', text_b))
+        entities_a = self._extract_entities(text_a)
+        if entities_b is None:
+            entities_b = self._extract_entities(text_b)
         
         # Find common entities
-        common_entities = entities_a.intersection(entities_b)
+        common_entities = entities_a & entities_b
         
         if not common_entities:
             return False
@@ -461,6 +540,24 @@ class QualityChecker:
         
         return False
     
+    def _extract_entities(self, text: str) -> set:
+        """Extract potential entity names (capitalized words) from text.
+        
+        Uses a plain whitespace split and str predicates rather than a regex
+        scan, since this runs for every script line against every memory.
+        
+        Args:
+            text: Text to scan
+        
+        Returns:
+            Set of capitalized words such as "Picard"
+        """
+        return {
+            word for word in text.split()
+            if len(word) > 1 and word[0].isupper()
+            and word[1:].isalpha() and word[1:].islower()
+        }
+    
     def _get_context(self, text: str, keyword: str, window: int = 3) -> str:
         """Get context around a keyword in text.
         
@@ -779,11 +876,14 @@ class QualityChecker:
         
         return simplified
     
-    def _check_audio_quality(self, episode_id: str) -> Dict[str, Any]:
+    def _check_audio_quality(self, episode_id: str,
+                             check_options: Optional[Dict[str, bool]] = None) -> Dict[str, Any]:
         """Check the quality of episode audio.
         
         Args:
             episode_id: ID of the episode
+            check_options: Options for what to check; "check_audio_properties"
+                and "check_scene_audio" can be set to False to skip those checks
         
         Returns:
             Dictionary with audio quality check results
@@ -807,29 +907,36 @@ class QualityChecker:
             "grade": "N/A",
             "recommendations": []
         }
+        issues = []
         
         # Check audio file integrity
         integrity_issues = self._check_audio_integrity(audio_path)
-        results["issues"].extend(integrity_issues)
+        issues.extend(integrity_issues)
+        
+        if check_options is None:
+            check_options = {}
         
         # Check audio properties
-        property_issues = self._check_audio_properties(audio_path)
-        results["issues"].extend(property_issues)
+        if check_options.get("check_audio_properties", True):
+            property_issues = self._check_audio_properties(audio_path)
+            issues.extend(property_issues)
         
         # Analyze scene audio files
-        audio_dir = Path(audio_path).parent
-        scene_issues = self._check_scene_audio(audio_dir)
-        results["issues"].extend(scene_issues)
+        if check_options.get("check_scene_audio", True):
+            audio_dir = os.path.dirname(audio_path)
+            scene_issues = self._check_scene_audio(audio_dir)
+            issues.extend(scene_issues)
         
         # Calculate score based on issues
-        if results["issues"]:
+        if issues:
             # Count by severity
-            error_count = sum(1 for issue in results["issues"] if issue.get("severity") == "error")
-            warning_count = sum(1 for issue in results["issues"] if issue.get("severity") == "warning")
-            info_count = sum(1 for issue in results["issues"] if issue.get("severity") == "info")
+            severity_counts = Counter(issue.severity for issue in issues)
+            error_count = severity_counts["error"]
+            warning_count = severity_counts["warning"]
+            info_count = severity_counts["info"]
             
             # Calculate weighted score
-            total_issues = len(results["issues"])
+            total_issues = len(issues)
             weighted_total = error_count * 5 + warning_count * 2 + info_count
             
             # Base score of 10, reduced by weighted issues
@@ -842,11 +949,14 @@ class QualityChecker:
         results["grade"] = self._score_to_grade(results["score"])
         
         # Generate recommendations based on issues
-        results["recommendations"] = self._generate_audio_recommendations(results["issues"])
+        results["recommendations"] = self._generate_audio_recommendations(issues)
+        
+        # Issues leave the audio checks as plain dicts
+        results["issues"] = [asdict(issue) for issue in issues]
         
         return results
     
-    def _check_audio_integrity(self, audio_path: str) -> List[Dict[str, Any]]:
+    def _check_audio_integrity(self, audio_path: Union[str, Path]) -> List[AudioIssue]:
         """Check the integrity of an audio file.
         
         Args:
@@ -856,61 +966,213 @@ class QualityChecker:
             List of integrity issues
         """
         issues = []
+        audio_path = os.fspath(audio_path)
         
         # Check if file exists
-        if not os.path.exists(audio_path):
-            issues.append({
-                "severity": "error",
-                "description": "Audio file does not exist",
-                "location": audio_path
-            })
+        try:
+            size = os.stat(audio_path).st_size
+        except FileNotFoundError:
+            issues.append(AudioIssue(
+                severity="error",
+                description="Audio file does not exist",
+                location=audio_path
+            ))
+            return issues
+        
+        # Files that are empty or header-only need no probe
+        issues.extend(self._check_audio_size(audio_path, size))
+        if issues:
+            return issues
+        
+        probe = self._probe_many([audio_path])[audio_path]
+        return self._check_audio_integrity_from_probe(probe, audio_path)
+    
+    def _check_audio_size(self, audio_path: str, size: int) -> List[AudioIssue]:
+        """Check an audio file's size before probing it.
+        
+        Args:
+            audio_path: Path to the audio file
+            size: Size of the file in bytes
+        
+        Returns:
+            List of size issues
+        """
+        issues = []
+        
+        if size == 0:
+            issues.append(AudioIssue(
+                severity="error",
+                description="Audio file is empty (zero bytes)",
+                location=audio_path
+            ))
+        elif size < self.MIN_PROBE_BYTES:
+            issues.append(AudioIssue(
+                severity="error",
+                description=f"Audio file holds no audio data: only {size} bytes",
+                location=audio_path
+            ))
+        
+        return issues
+    
+    def _check_audio_integrity_from_probe(self, probe: Union[Dict[str, Any], Exception],
+                                          audio_path: str) -> List[AudioIssue]:
+        """Check the integrity of an audio file from its ffprobe output.
+        
+        Args:
+            probe: Probe data for the file, or the exception raised while probing it
+            audio_path: Path to the audio file
+        
+        Returns:
+            List of integrity issues
+        """
+        issues = []
+        
+        if isinstance(probe, Exception):
+            issues.append(AudioIssue(
+                severity="error",
+                description=f"Error probing audio file: {str(probe)}",
+                location=audio_path
+            ))
             return issues
         
         try:
-            # Use ffmpeg to check file integrity
-            probe = ffmpeg.probe(audio_path)
-            
             # Check for audio streams
             audio_streams = [stream for stream in probe.get("streams", []) 
                            if stream.get("codec_type") == "audio"]
             
             if not audio_streams:
-                issues.append({
-                    "severity": "error",
-                    "description": "Audio file contains no audio streams",
-                    "location": audio_path
-                })
+                issues.append(AudioIssue(
+                    severity="error",
+                    description="Audio file contains no audio streams",
+                    location=audio_path
+                ))
             
             # Check duration
             duration = float(probe.get("format", {}).get("duration", 0))
             
             if duration < 30:
-                issues.append({
-                    "severity": "error",
-                    "description": f"Audio file is too short: {duration:.1f} seconds",
-                    "location": audio_path
-                })
+                issues.append(AudioIssue(
+                    severity="error",
+                    description=f"Audio file is too short: {duration:.1f} seconds",
+                    location=audio_path
+                ))
             
             # Check if file is empty
             size = int(probe.get("format", {}).get("size", 0))
             
             if size == 0:
-                issues.append({
-                    "severity": "error",
-                    "description": "Audio file is empty (zero bytes)",
-                    "location": audio_path
-                })
+                issues.append(AudioIssue(
+                    severity="error",
+                    description="Audio file is empty (zero bytes)",
+                    location=audio_path
+                ))
             
         except Exception as e:
-            issues.append({
-                "severity": "error",
-                "description": f"Error probing audio file: {str(e)}",
-                "location": audio_path
-            })
+            issues.append(AudioIssue(
+                severity="error",
+                description=f"Error probing audio file: {str(e)}",
+                location=audio_path
+            ))
         
         return issues
     
-    def _check_audio_properties(self, audio_path: str) -> List[Dict[str, Any]]:
+    def _probe_many(self, paths: List[str]) -> Dict[str, Union[Dict[str, Any], Exception]]:
+        """Probe a batch of audio files concurrently.
+        
+        The probes run on a new event loop, so this may only be called from
+        sync code; async callers await _probe_many_async instead.
+        
+        Args:
+            paths: Paths of the audio files to probe
+        
+        Returns:
+            Dictionary mapping each path to its probe data, or to the
+            exception raised while probing it
+        """
+        if not paths:
+            return {}
+        
+        return asyncio.run(self._probe_many_async(paths))
+    
+    async def _probe_many_async(self, paths: List[str]) -> Dict[str, Union[Dict[str, Any], Exception]]:
+        """Launch ffprobe subprocesses for a batch of files and await them together.
+        
+        Args:
+            paths: Paths of the audio files to probe
+        
+        Returns:
+            Dictionary mapping each path to its probe data, or to the
+            exception raised while probing it
+        """
+        semaphore = asyncio.Semaphore(os.cpu_count() or 1)
+        
+        results = await asyncio.gather(
+            *(self._probe_once_async(path, semaphore) for path in paths),
+            return_exceptions=True
+        )
+        
+        return dict(zip(paths, results))
+    
+    def _probe_once(self, audio_path: str) -> Dict[str, Any]:
+        """Probe an audio file, reusing the previous result if it is unchanged.
+        
+        The integrity and property checks run back-to-back on the same
+        files, so caching lets them share a single ffprobe call.
+        
+        Args:
+            audio_path: Path to the audio file
+        
+        Returns:
+            Parsed ffprobe output
+        """
+        key, probe = self._cached_probe(audio_path)
+        
+        if probe is None:
+            probe = _ffprobe_json(audio_path)
+            self._probe_cache[audio_path] = (key, probe)
+        
+        return probe
+    
+    async def _probe_once_async(self, audio_path: str,
+                                semaphore: asyncio.Semaphore) -> Dict[str, Any]:
+        """Asynchronous counterpart of _probe_once.
+        
+        Args:
+            audio_path: Path to the audio file
+            semaphore: Semaphore bounding the number of concurrent ffprobe processes
+        
+        Returns:
+            Parsed ffprobe output
+        """
+        key, probe = self._cached_probe(audio_path)
+        
+        if probe is None:
+            async with semaphore:
+                probe = await _ffprobe_json_async(audio_path)
+            self._probe_cache[audio_path] = (key, probe)
+        
+        return probe
+    
+    def _cached_probe(self, audio_path: str) -> Tuple[Tuple[int, int], Optional[Dict[str, Any]]]:
+        """Look up the cached probe for a file.
+        
+        Args:
+            audio_path: Path to the audio file
+        
+        Returns:
+            Tuple of the file's cache key (mtime and size) and its cached
+            probe data, or None if the file changed or was never probed
+        """
+        stat = os.stat(audio_path)
+        key = (stat.st_mtime_ns, stat.st_size)
+        
+        cached = self._probe_cache.get(audio_path)
+        if cached and cached[0] == key:
+            return key, cached[1]
+        
+        return key, None
+    
+    def _check_audio_properties(self, audio_path: str) -> List[AudioIssue]:
         """Check the properties of an audio file.
         
         Args:
@@ -921,13 +1183,16 @@ class QualityChecker:
         """
         issues = []
         
-        # Skip if file doesn't exist
-        if not os.path.exists(audio_path):
+        # Skip if file doesn't exist or holds no audio data
+        try:
+            if os.stat(audio_path).st_size < self.MIN_PROBE_BYTES:
+                return issues
+        except FileNotFoundError:
             return issues
         
         try:
-            # Use ffmpeg to analyze audio properties
-            probe = ffmpeg.probe(audio_path)
+            # Use ffprobe to analyze audio properties
+            probe = self._probe_once(audio_path)
             
             # Get first audio stream
             audio_streams = [stream for stream in probe.get("streams", []) 
@@ -941,52 +1206,52 @@ class QualityChecker:
             # Check codec
             codec = audio_stream.get("codec_name", "")
             if codec not in ["mp3", "aac", "opus"]:
-                issues.append({
-                    "severity": "warning",
-                    "description": f"Non-standard audio codec: {codec}",
-                    "location": audio_path
-                })
+                issues.append(AudioIssue(
+                    severity="warning",
+                    description=f"Non-standard audio codec: {codec}",
+                    location=audio_path
+                ))
             
             # Check sample rate
             sample_rate = int(audio_stream.get("sample_rate", 0))
             if sample_rate < 44100:
-                issues.append({
-                    "severity": "warning",
-                    "description": f"Low sample rate: {sample_rate} Hz",
-                    "location": audio_path
-                })
+                issues.append(AudioIssue(
+                    severity="warning",
+                    description=f"Low sample rate: {sample_rate} Hz",
+                    location=audio_path
+                ))
             
             # Check channel count
             channels = int(audio_stream.get("channels", 0))
             if channels != 2:
-                issues.append({
-                    "severity": "info",
-                    "description": f"Non-stereo audio: {channels} channels",
-                    "location": audio_path
-                })
+                issues.append(AudioIssue(
+                    severity="info",
+                    description=f"Non-stereo audio: {channels} channels",
+                    location=audio_path
+                ))
             
             # Check bit rate
             bit_rate = int(probe.get("format", {}).get("bit_rate", 0))
             if bit_rate < 128000:
-                issues.append({
-                    "severity": "warning",
-                    "description": f"Low bit rate: {bit_rate // 1000} kbps",
-                    "location": audio_path
-                })
+                issues.append(AudioIssue(
+                    severity="warning",
+                    description=f"Low bit rate: {bit_rate // 1000} kbps",
+                    location=audio_path
+                ))
             
             # Check for silent parts
             # This would require more complex analysis
             
         except Exception as e:
-            issues.append({
-                "severity": "warning",
-                "description": f"Error analyzing audio properties: {str(e)}",
-                "location": audio_path
-            })
+            issues.append(AudioIssue(
+                severity="warning",
+                description=f"Error analyzing audio properties: {str(e)}",
+                location=audio_path
+            ))
         
         return issues
     
-    def _check_scene_audio(self, audio_dir: Path) -> List[Dict[str, Any]]:
+    def _check_scene_audio(self, audio_dir: Union[str, Path]) -> List[AudioIssue]:
         """Check audio files for individual scenes.
         
         Args:
@@ -997,53 +1262,72 @@ class QualityChecker:
         """
         issues = []
         
-        # Look for scene directories
-        scene_dirs = [d for d in audio_dir.glob("scene_*") if d.is_dir()]
+        # Look for scene directories, using the directory entries' cached type
+        try:
+            with os.scandir(audio_dir) as entries:
+                scene_dirs = [entry for entry in entries
+                              if entry.name.startswith("scene_") and entry.is_dir()]
+        except (FileNotFoundError, NotADirectoryError):
+            scene_dirs = []
         
         if not scene_dirs:
-            issues.append({
-                "severity": "info",
-                "description": "No scene audio directories found",
-                "location": str(audio_dir)
-            })
+            issues.append(AudioIssue(
+                severity="info",
+                description="No scene audio directories found",
+                location=os.fspath(audio_dir)
+            ))
             return issues
         
-        # Check each scene directory
+        # Collect scene audio files so they can be probed in one batch
+        scene_audio_files = []
+        
         for scene_dir in scene_dirs:
-            scene_name = scene_dir.name
-            scene_audio = scene_dir / "scene_audio.mp3"
+            scene_audio = os.path.join(scene_dir.path, "scene_audio.mp3")
             
-            if not scene_audio.exists():
-                issues.append({
-                    "severity": "warning",
-                    "description": f"Missing scene audio file for {scene_name}",
-                    "location": str(scene_dir)
-                })
+            try:
+                size = os.stat(scene_audio).st_size
+            except FileNotFoundError:
+                issues.append(AudioIssue(
+                    severity="warning",
+                    description=f"Missing scene audio file for {scene_dir.name}",
+                    location=scene_dir.path
+                ))
                 continue
             
-            # Check scene audio file
-            scene_issues = self._check_audio_integrity(str(scene_audio))
+            scene_audio_files.append((scene_dir, scene_audio, self._check_audio_size(scene_audio, size)))
+        
+        # Files that are empty or header-only are reported without a probe
+        probes = self._probe_many([path for _, path, size_issues in scene_audio_files if not size_issues])
+        
+        # Check each scene audio file
+        for scene_dir, scene_audio, size_issues in scene_audio_files:
+            scene_name = scene_dir.name
+            scene_issues = size_issues or self._check_audio_integrity_from_probe(probes[scene_audio], scene_audio)
             
             for issue in scene_issues:
-                issue["location"] = f"{scene_name}/{os.path.basename(issue['location'])}"
+                issue.location = f"{scene_name}/{os.path.basename(issue.location)}"
                 issues.append(issue)
             
             # Check for temp directory with voice clips
-            temp_dir = scene_dir / "temp"
-            if temp_dir.exists() and temp_dir.is_dir():
-                # Count voice clips
-                voice_clips = list(temp_dir.glob("*.mp3"))
-                
-                if not voice_clips:
-                    issues.append({
-                        "severity": "info",
-                        "description": f"No voice clips found for {scene_name}",
-                        "location": str(temp_dir)
-                    })
+            temp_dir = os.path.join(scene_dir.path, "temp")
+            try:
+                # Look for at least one voice clip; scanning directly avoids
+                # a separate stat to check that the directory exists
+                with os.scandir(temp_dir) as entries:
+                    has_voice_clips = any(entry.name.endswith(".mp3") for entry in entries)
+            except (FileNotFoundError, NotADirectoryError):
+                continue
+            
+            if not has_voice_clips:
+                issues.append(AudioIssue(
+                    severity="info",
+                    description=f"No voice clips found for {scene_name}",
+                    location=temp_dir
+                ))
         
         return issues
     
-    def _generate_audio_recommendations(self, issues: List[Dict[str, Any]]) -> List[str]:
+    def _generate_audio_recommendations(self, issues: List[AudioIssue]) -> List[str]:
         """Generate recommendations based on audio issues.
         
         Args:
@@ -1054,33 +1338,40 @@ class QualityChecker:
         """
         recommendations = []
         
-        # Count issues by type
-        integrity_issues = [i for i in issues if "integrity" in i.get("description", "").lower()]
-        property_issues = [i for i in issues if any(term in i.get("description", "").lower() 
-                                                 for term in ["sample rate", "bit rate", "codec", "channels"])]
-        scene_issues = [i for i in issues if "scene" in i.get("location", "").lower()]
+        # Classify issues in a single pass over their descriptions
+        has_integrity_issues = False
+        has_rate_issues = False
+        has_missing_scenes = False
+        
+        for issue in issues:
+            keywords = set(self._RECOMMENDATION_KEYWORDS.findall(issue.description.lower()))
+            if not keywords:
+                continue
+            
+            if "integrity" in keywords:
+                has_integrity_issues = True
+            if "sample rate" in keywords or "bit rate" in keywords:
+                has_rate_issues = True
+            if "missing" in keywords and "scene" in (issue.location or "").lower():
+                has_missing_scenes = True
         
         # Recommendations for integrity issues
-        if integrity_issues:
+        if has_integrity_issues:
             recommendations.append(
                 "Regenerate audio files that have integrity issues to ensure playability."
             )
         
         # Recommendations for property issues
-        if property_issues:
-            rate_issues = [i for i in property_issues if "rate" in i.get("description", "").lower()]
-            if rate_issues:
-                recommendations.append(
-                    "Increase audio quality settings (sample rate, bit rate) for better sound fidelity."
-                )
+        if has_rate_issues:
+            recommendations.append(
+                "Increase audio quality settings (sample rate, bit rate) for better sound fidelity."
+            )
         
         # Recommendations for scene issues
-        if scene_issues:
-            missing_scenes = [i for i in scene_issues if "missing" in i.get("description", "").lower()]
-            if missing_scenes:
-                recommendations.append(
-                    "Generate audio for all scenes to ensure complete episode coverage."
-                )
+        if has_missing_scenes:
+            recommendations.append(
+                "Generate audio for all scenes to ensure complete episode coverage."
+            )
         
         # Generic recommendation if none specific
         if not recommendations:
@@ -1099,30 +1390,7 @@ class QualityChecker:
         Returns:
             Letter grade
         """
-        if score >= 9.5:
-            return "A+"
-        elif score >= 9.0:
-            return "A"
-        elif score >= 8.5:
-            return "A-"
-        elif score >= 8.0:
-            return "B+"
-        elif score >= 7.5:
-            return "B"
-        elif score >= 7.0:
-            return "B-"
-        elif score >= 6.5:
-            return "C+"
-        elif score >= 6.0:
-            return "C"
-        elif score >= 5.5:
-            return "C-"
-        elif score >= 5.0:
-            return "D+"
-        elif score >= 4.0:
-            return "D"
-        else:
-            return "F"
+        return self._GRADES[bisect.bisect_right(self._GRADE_BOUNDARIES, score)]
     
     def _severity_to_value(self, severity: str) -> int:
         """Convert severity string to numerical value for sorting.
@@ -1133,14 +1401,7 @@ class QualityChecker:
         Returns:
             Numerical value
         """
-        if severity == "error":
-            return 3
-        elif severity == "warning":
-            return 2
-        elif severity == "info":
-            return 1
-        else:
-            return 0
+        return self._SEVERITY_VALUES.get(severity, 0)
     
     def _save_quality_check(self, episode_id: str, results: Dict[str, Any]) -> None:
         """Save quality check results to file.
@@ -1153,8 +1414,8 @@ class QualityChecker:
         quality_file = episode_dir / "quality_check.json"
         
         try:
-            with open(quality_file, 'w') as f:
-                json.dump(results, f, indent=2)
+            with open(quality_file, 'w', encoding='utf-8') as f:
+                f.write(json.dumps(results, indent=2, ensure_ascii=False))
             
             logger.info(f"Quality check results saved to {quality_file}")
         except Exception as e:
@@ -10,6 +10,7 @@ import os
 import json
 import logging
 import time
+import hashlib
 from pathlib import Path
 from typing import Dict, List, Any, Optional, Union
 import concurrent.futures
@@ -25,6 +26,12 @@ logger = logging.getLogger(__name__)
 class ReferenceMemorySync:
     """Synchronizes reference materials with vector memory database."""
     
+    # Minimum seconds between intermediate sync status snapshots
+    SYNC_STATUS_FLUSH_INTERVAL = 5.0
+    
+    # Number of books synced concurrently by sync_all_books
+    BOOK_SYNC_PARALLELISM = 4
+    
     def __init__(self):
         """Initialize the reference memory sync."""
         self.epub_processor = get_processor()
@@ -47,13 +54,24 @@ class ReferenceMemorySync:
         # Check if book is already synced
         sync_file = self.sync_dir / f"{book_id}_sync.json"
         
+        # Hashes of sections synced by a previous run, mapped to their memory IDs
+        previous_hashes = {}
+        
         if sync_file.exists() and not force:
             try:
-                with open(sync_file, 'r') as f:
+                with open(sync_file, 'r', encoding='utf-8') as f:
                     sync_status = json.load(f)
-                    if sync_status.get("completed", False):
-                        logger.info(f"Book {book_id} already synced. Use force=True to resync.")
-                        return sync_status
+                
+                # Skip the book entirely unless its sections were re-processed
+                # after the last completed sync
+                sections_file = self.epub_processor.books_dir / book_id / "sections.json"
+                if sync_status.get("completed", False) and (
+                        not sections_file.exists() or
+                        sections_file.stat().st_mtime <= sync_status.get("completed_at", 0)):
+                    logger.info(f"Book {book_id} already synced. Use force=True to resync.")
+                    return sync_status
+                
+                previous_hashes = sync_status.get("section_hashes", {})
             except Exception as e:
                 logger.error(f"Error reading sync status: {e}")
         
@@ -69,11 +87,15 @@ class ReferenceMemorySync:
         logger.info(f"Syncing book '{title}' by {author} (ID: {book_id}) to memory")
         
         # Get book sections
-        sections = self.epub_processor.get_book_sections(book_id)
-        if not sections or not sections.get('sections'):
+        sections = self.epub_processor.get_book_sections(book_id).get('sections')
+        if not sections:
             logger.error(f"No sections found for book {book_id}")
             return {"error": "No sections found"}
         
+        # Sections are popped off the end as they are submitted, so each
+        # section's content can be freed once it has been synced
+        sections.reverse()
+        
         # Initialize sync status
         sync_status = {
             "book_id": book_id,
@@ -81,65 +103,88 @@ class ReferenceMemorySync:
             "author": author,
             "started_at": time.time(),
             "completed": False,
-            "total_sections": len(sections.get('sections', [])),
+            "total_sections": len(sections),
             "synced_sections": 0,
             "failed_sections": 0,
-            "memory_ids": []
+            "unchanged_sections": 0,
+            "memory_ids": [],
+            "section_hashes": {}
         }
         
         # Save initial sync status
-        try:
-            with open(sync_file, 'w') as f:
-                json.dump(sync_status, f, indent=2)
-        except Exception as e:
-            logger.error(f"Error saving sync status: {e}")
+        self._save_sync_status(sync_file, sync_status)
+        last_flush = time.monotonic()
         
-        # Process each section in parallel
-        section_results = []
+        # Process each section in parallel, keeping at most
+        # max_in_flight submissions queued at any time
+        max_workers = 8
+        max_in_flight = max_workers * 2
+        in_flight = set()
         
-        with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
-            futures = []
-            for section in sections.get('sections', []):
-                section_content = section.get('content', '')
-                section_title = section.get('section_title', '')
-                chapter_title = section.get('chapter_title', '')
-                
-                futures.append(
-                    executor.submit(
-                        self._add_section_to_memory,
-                        book_id=book_id,
-                        title=title,
-                        author=author,
-                        section_content=section_content,
-                        section_title=section_title,
-                        chapter_title=chapter_title
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor, \
+             tqdm(total=sync_status["total_sections"], desc=f"Syncing {title}") as progress:
+            while True:
+                # Top up the in-flight submissions
+                while sections and len(in_flight) < max_in_flight:
+                    section = sections.pop()
+                    content_hash = self._section_hash(section.get('content', ''))
+                    
+                    # Sections unchanged since the last sync need no embedding
+                    if content_hash in previous_hashes:
+                        memory_id = previous_hashes[content_hash]
+                        sync_status["synced_sections"] += 1
+                        sync_status["unchanged_sections"] += 1
+                        sync_status["memory_ids"].append(memory_id)
+                        sync_status["section_hashes"][content_hash] = memory_id
+                        progress.update(1)
+                        continue
+                    
+                    in_flight.add(
+                        executor.submit(
+                            self._add_section_to_memory,
+                            book_id=book_id,
+                            title=title,
+                            author=author,
+                            section_content=section.get('content', ''),
+                            section_title=section.get('section_title', ''),
+                            chapter_title=section.get('chapter_title', ''),
+                            content_hash=content_hash
+                        )
                     )
+                
+                if not in_flight:
+                    break
+                
+                # Process results as they complete
+                done, in_flight = concurrent.futures.wait(
+                    in_flight, return_when=concurrent.futures.FIRST_COMPLETED
                 )
-            
-            # Process results as they complete
-            for future in tqdm(concurrent.futures.as_completed(futures),
-                             total=len(futures),
-                             desc=f"Syncing {title}"):
-                try:
-                    result = future.result()
-                    section_results.append(result)
+                
+                for future in done:
+                    progress.update(1)
                     
-                    # Update sync status
-                    if result.get("success"):
-                        sync_status["synced_sections"] += 1
-                        sync_status["memory_ids"].append(result.get("memory_id"))
-                    else:
-                        sync_status["failed_sections"] += 1
+                    try:
+                        result = future.result()
+                        
+                        # Update sync status
+                        if result.get("success"):
+                            sync_status["synced_sections"] += 1
+                            sync_status["memory_ids"].append(result.get("memory_id"))
+                            sync_status["section_hashes"][result["content_hash"]] = result.get("memory_id")
+                        else:
+                            sync_status["failed_sections"] += 1
                     
-                    # Periodically save sync status
-                    if (sync_status["synced_sections"] + 
-                        sync_status["failed_sections"]) % 10 == 0:
-                        with open(sync_file, 'w') as f:
-                            json.dump(sync_status, f, indent=2)
+                    except Exception as e:
+                        logger.error(f"Error processing section: {e}")
+                        sync_status["failed_sections"] += 1
                 
-                except Exception as e:
-                    logger.error(f"Error processing section: {e}")
-                    sync_status["failed_sections"] += 1
+                # Periodically save sync status
+                if time.monotonic() - last_flush >= self.SYNC_STATUS_FLUSH_INTERVAL:
+                    self._save_sync_status(sync_file, sync_status)
+                    last_flush = time.monotonic()
+        
+        if sync_status["unchanged_sections"]:
+            logger.info(f"Skipped {sync_status['unchanged_sections']} unchanged sections of '{title}'")
         
         # Update and save final sync status
         sync_status["completed"] = True
@@ -148,17 +193,38 @@ class ReferenceMemorySync:
                                       sync_status["total_sections"] 
                                       if sync_status["total_sections"] > 0 else 0)
         
-        try:
-            with open(sync_file, 'w') as f:
-                json.dump(sync_status, f, indent=2)
-        except Exception as e:
-            logger.error(f"Error saving final sync status: {e}")
+        self._save_sync_status(sync_file, sync_status)
         
         return sync_status
     
+    def _section_hash(self, section_content: str) -> str:
+        """Hash a section's content to detect unchanged sections on resync.
+        
+        Args:
+            section_content: Content of the section
+        
+        Returns:
+            Hex digest of the content
+        """
+        return hashlib.blake2b(section_content.encode('utf-8'), digest_size=16).hexdigest()
+    
+    def _save_sync_status(self, sync_file: Path, sync_status: Dict[str, Any]) -> None:
+        """Write a book's sync status to disk.
+        
+        Args:
+            sync_file: Path of the sync status file
+            sync_status: Sync status to save
+        """
+        try:
+            # Compact output lets json use its C encoder in a single pass
+            with open(sync_file, 'w', encoding='utf-8') as f:
+                f.write(json.dumps(sync_status, ensure_ascii=False))
+        except Exception as e:
+            logger.error(f"Error saving sync status: {e}")
+    
     def _add_section_to_memory(self, book_id: str, title: str, author: str,
                               section_content: str, section_title: str,
-                              chapter_title: str) -> Dict[str, Any]:
+                              chapter_title: str, content_hash: str) -> Dict[str, Any]:
         """Add a section to vector memory.
         
         Args:
@@ -168,6 +234,7 @@ class ReferenceMemorySync:
             section_content: Content of the section
             section_title: Title of the section
             chapter_title: Title of the chapter
+            content_hash: Hash of the section content
         
         Returns:
             Dictionary with result information
@@ -193,6 +260,7 @@ class ReferenceMemorySync:
                 "success": True,
                 "book_id": book_id,
                 "section_title": section_title,
+                "content_hash": content_hash,
                 "memory_id": result.get("id") if isinstance(result, dict) else None
             }
         
@@ -221,16 +289,23 @@ class ReferenceMemorySync:
             logger.warning("No books found to sync")
             return {"error": "No books found"}
         
-        # Process each book
+        # Process books concurrently; each sync is dominated by mem0 network calls
+        book_ids = [book.get("book_id") for book in books if book.get("book_id")]
         results = {}
         
-        for book in books:
-            book_id = book.get("book_id")
-            if not book_id:
-                continue
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self.BOOK_SYNC_PARALLELISM) as executor:
+            futures = {
+                executor.submit(self.sync_book, book_id, force=force): book_id
+                for book_id in book_ids
+            }
             
-            result = self.sync_book(book_id, force=force)
-            results[book_id] = result
+            for future in concurrent.futures.as_completed(futures):
+                book_id = futures[future]
+                try:
+                    results[book_id] = future.result()
+                except Exception as e:
+                    logger.error(f"Error syncing book {book_id}: {e}")
+                    results[book_id] = {"error": str(e)}
         
         # Create a summary
         summary = {
@@ -246,11 +321,11 @@ class ReferenceMemorySync:
         
         # Save overall sync status
         try:
-            with open(self.sync_dir / "all_books_sync.json", 'w') as f:
-                json.dump({
+            with open(self.sync_dir / "all_books_sync.json", 'w', encoding='utf-8') as f:
+                f.write(json.dumps({
                     "summary": summary,
                     "book_results": results
-                }, f, indent=2)
+                }, ensure_ascii=False))
         except Exception as e:
             logger.error(f"Error saving all books sync status: {e}")
         
@@ -276,7 +351,7 @@ class ReferenceMemorySync:
                 return {"book_id": book_id, "synced": False, "error": "Not synced"}
             
             try:
-                with open(sync_file, 'r') as f:
+                with open(sync_file, 'r', encoding='utf-8') as f:
                     return json.load(f)
             except Exception as e:
                 logger.error(f"Error reading sync status: {e}")
@@ -287,7 +362,7 @@ class ReferenceMemorySync:
             
             if all_sync_file.exists():
                 try:
-                    with open(all_sync_file, 'r') as f:
+                    with open(all_sync_file, 'r', encoding='utf-8') as f:
                         return json.load(f)
                 except Exception as e:
                     logger.error(f"Error reading all books sync status: {e}")
@@ -299,7 +374,7 @@ class ReferenceMemorySync:
                     continue
                 
                 try:
-                    with open(sync_file, 'r') as f:
+                    with open(sync_file, 'r', encoding='utf-8') as f:
                         book_status = json.load(f)
                         book_id = book_status.get("book_id")
                         if book_id:
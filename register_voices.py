@@ -4,92 +4,241 @@ Script to register voices for Stardock Podium characters.
 """
 
 import os
-from dotenv import load_dotenv
-from voice_registry import VoiceRegistry
-
-# Load environment variables
-load_dotenv()
-
-# Character voice descriptions
-CHARACTER_VOICES = [
-    {
-        "name": "Aria T'Vel",
-        "description": "A Vulcan female voice that is smooth, calm, and precise in articulation. The voice should have an undercurrent of warmth that suggests a deeper understanding of emotion, while maintaining the characteristic Vulcan logical tone. The voice should be clear and measured, with perfect enunciation.",
-        "settings": {
-            "stability": 0.5,
-            "similarity_boost": 0.75,
-            "style": 0.0,
-            "use_speaker_boost": True
-        }
-    },
-    {
-        "name": "Jalen",
-        "description": "A male Trill voice that is warm and enthusiastic, carrying the wisdom of multiple lifetimes through the symbiont. The voice should have a natural eagerness that can accelerate when excited, while maintaining a sense of ancient knowledge. The tone should be friendly but authoritative, with a slight musical quality.",
-        "settings": {
-            "stability": 0.5,
-            "similarity_boost": 0.75,
-            "style": 0.0,
-            "use_speaker_boost": True
-        }
-    },
-    {
-        "name": "Naren",
-        "description": "A female Bajoran voice that is strong and confident, with the ability to shift between commanding authority and spiritual serenity. The voice should carry the weight of experience and resilience, with a slight accent that reflects her Bajoran heritage. The tone should be firm but compassionate.",
-        "settings": {
-            "stability": 0.5,
-            "similarity_boost": 0.75,
-            "style": 0.0,
-            "use_speaker_boost": True
-        }
-    },
-    {
-        "name": "Elara",
-        "description": "A female Caitian voice that is softly musical with a purring undertone. The voice should be soothing and gentle, with a playful lilt that can become serious when needed. The tone should reflect her species' feline nature while maintaining clear, professional articulation.",
-        "settings": {
-            "stability": 0.5,
-            "similarity_boost": 0.75,
-            "style": 0.0,
-            "use_speaker_boost": True
-        }
-    },
-    {
-        "name": "Sarik",
-        "description": "A male El-Aurian voice that is gentle and reflective, carrying an aura of wisdom beyond his years. The voice should be deliberate and thoughtful, with a comforting, almost lyrical quality. The tone should reflect his species' long lifespan and natural empathy.",
-        "settings": {
-            "stability": 0.5,
-            "similarity_boost": 0.75,
-            "style": 0.0,
-            "use_speaker_boost": True
-        }
-    }
-]
+import re
+import json
+import logging
+import time
+import random
+import hashlib
+import functools
+import concurrent.futures
+from pathlib import Path
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Tuple, TYPE_CHECKING
+from dataclasses import dataclass
 
-def main():
-    """Create and register voices for all characters."""
-    print("Creating and registering voices for characters...")
+if TYPE_CHECKING:
+    from voice_registry import VoiceRegistry
+
+# Setup logging
+logger = logging.getLogger(__name__)
+
+# ElevenLabs voice design description length limits
+MIN_DESCRIPTION_LENGTH = 20
+MAX_DESCRIPTION_LENGTH = 1000
+
+@dataclass(frozen=True)
+class CharacterVoice:
+    """Voice definition for a Stardock Podium character."""
+    __slots__ = ("name", "description", "settings")
+    name: str
+    description: str
+    settings: Mapping[str, Any]
     
-    registry = VoiceRegistry()
+    def __post_init__(self):
+        """Reject definitions the ElevenLabs API would refuse."""
+        if not (MIN_DESCRIPTION_LENGTH <= len(self.description) <= MAX_DESCRIPTION_LENGTH):
+            raise ValueError(
+                f"Voice description for {self.name} must be {MIN_DESCRIPTION_LENGTH}-"
+                f"{MAX_DESCRIPTION_LENGTH} characters, got {len(self.description)}"
+            )
+        
+        for key in ("stability", "similarity_boost", "style"):
+            value = self.settings.get(key, 0.0)
+            if not 0.0 <= value <= 1.0:
+                raise ValueError(f"Voice setting {key} for {self.name} must be in [0, 1], got {value}")
+        
+        if not isinstance(self.settings.get("use_speaker_boost", True), bool):
+            raise ValueError(f"Voice setting use_speaker_boost for {self.name} must be a boolean")
+
+# Voice settings shared by all characters
+DEFAULT_VOICE_SETTINGS = MappingProxyType({
+    "stability": 0.5,
+    "similarity_boost": 0.75,
+    "style": 0.0,
+    "use_speaker_boost": True
+})
+
+# Character voice descriptions, loaded on first use
+CHARACTER_VOICES_FILE = Path(__file__).with_name("data") / "character_voices.json"
+
+@functools.lru_cache(maxsize=1)
+def load_character_voices() -> Tuple[CharacterVoice, ...]:
+    """Load and validate the character voice definitions.
+    
+    Entries without explicit settings use DEFAULT_VOICE_SETTINGS.
+    
+    Returns:
+        Tuple of character voice definitions
+    """
+    with open(CHARACTER_VOICES_FILE, 'r', encoding='utf-8') as f:
+        entries = json.load(f)
+    
+    return tuple(
+        CharacterVoice(
+            name=entry['name'],
+            description=entry['description'],
+            settings=MappingProxyType(entry['settings']) if 'settings' in entry else DEFAULT_VOICE_SETTINGS
+        )
+        for entry in entries
+    )
+
+# Voice creation retry policy for transient ElevenLabs failures
+CREATE_ATTEMPTS = 4
+RETRY_INITIAL_DELAY = 1.0
+RETRY_MAX_DELAY = 8.0
+_TRANSIENT_ERROR = re.compile(r'\b(429|503)\b|rate limit|too many requests', re.IGNORECASE)
+
+def voice_cache_key(voice: CharacterVoice) -> str:
+    """Compute a content hash identifying a character voice definition.
+    
+    Args:
+        voice: Character voice definition
+    
+    Returns:
+        Hex digest of the voice definition
+    """
+    payload = json.dumps(
+        [voice.name, voice.description, dict(voice.settings)],
+        sort_keys=True
+    )
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+def load_voice_cache(cache_file: Path) -> Dict[str, str]:
+    """Load the voice definition hash to voice registry ID cache.
+    
+    Args:
+        cache_file: Path of the cache file
+    
+    Returns:
+        Dictionary mapping voice definition hashes to voice registry IDs
+    """
+    if cache_file.exists():
+        try:
+            with open(cache_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except Exception as e:
+            logger.error(f"Error loading voice cache: {e}")
+    
+    return {}
+
+def save_voice_cache(cache_file: Path, cache: Dict[str, str]) -> None:
+    """Atomically save the voice definition hash to voice registry ID cache.
     
-    for voice_data in CHARACTER_VOICES:
-        print(f"\nCreating voice for {voice_data['name']}...")
+    Args:
+        cache_file: Path of the cache file
+        cache: Dictionary mapping voice definition hashes to voice registry IDs
+    """
+    tmp_file = cache_file.with_suffix('.json.tmp')
+    
+    try:
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump(cache, f, indent=2)
+        os.replace(tmp_file, cache_file)
+    except Exception as e:
+        logger.error(f"Error saving voice cache: {e}")
+
+def create_voice_with_retry(registry: 'VoiceRegistry', voice: CharacterVoice) -> Dict[str, Any]:
+    """Create a character voice, retrying transient rate-limit failures.
+    
+    Rate-limit (429) and unavailable (503) errors are retried with jittered
+    exponential backoff, so one sporadic failure doesn't drop the voice and
+    force a full re-run. Other errors are returned immediately.
+    
+    Args:
+        registry: Voice registry to create the voice in
+        voice: Character voice definition
+    
+    Returns:
+        Created voice data, or the last error
+    """
+    delay = RETRY_INITIAL_DELAY
+    
+    for attempt in range(1, CREATE_ATTEMPTS + 1):
         result = registry.create_voice_from_description(
-            name=voice_data['name'],
-            description=voice_data['description']
+            name=voice.name,
+            description=voice.description,
+            settings=dict(voice.settings)
         )
         
-        if "error" in result:
-            print(f"Error creating voice for {voice_data['name']}: {result['error']}")
+        error = result.get('error')
+        if error is None or attempt == CREATE_ATTEMPTS:
+            return result
+        if not _TRANSIENT_ERROR.search(str(error)):
+            return result
+        
+        time.sleep(random.uniform(0, delay))
+        delay = min(delay * 2, RETRY_MAX_DELAY)
+    
+    return result
+
+def register_all(registry: 'VoiceRegistry') -> None:
+    """Create and register voices for all characters concurrently.
+    
+    Voices whose definition is unchanged since a previous successful run
+    are skipped, unless NO_VOICE_CACHE=1 is set to force regeneration.
+    The remaining voices are created on a thread pool, since each creation
+    blocks on ElevenLabs round trips, and results are reported as they
+    complete.
+    
+    Args:
+        registry: Voice registry to register the voices in
+    """
+    cache_file = registry.voices_dir / "voice_cache.json"
+    cache = load_voice_cache(cache_file)
+    use_cache = os.getenv("NO_VOICE_CACHE") != "1"
+    
+    pending = {}
+    for voice in load_character_voices():
+        key = voice_cache_key(voice)
+        cached_id = cache.get(key) if use_cache else None
+        
+        if cached_id and registry.get_voice(cached_id):
+            logger.info(f"Voice for {voice.name} already registered (cached)")
         else:
-            print(f"Successfully created and registered voice for {voice_data['name']}")
-            # Update voice settings
-            if 'settings' in voice_data:
-                registry.update_voice(
-                    result['voice_registry_id'],
-                    {'settings': voice_data['settings']}
-                )
-                print(f"Updated voice settings for {voice_data['name']}")
-    
-    print("\nVoice creation and registration complete!")
+            pending[key] = voice
+    
+    if pending:
+        logger.info(f"Creating voices for {', '.join(voice.name for voice in pending.values())}...")
+        
+        with concurrent.futures.ThreadPoolExecutor(max_workers=len(pending)) as executor:
+            futures = {
+                executor.submit(create_voice_with_retry, registry, voice): key
+                for key, voice in pending.items()
+            }
+            
+            for future in concurrent.futures.as_completed(futures):
+                key = futures[future]
+                voice = pending[key]
+                result = future.result()
+                error = result.get('error')
+                
+                if error is not None:
+                    logger.error(f"Error creating voice for {voice.name}: {error}")
+                else:
+                    cache[key] = result['voice_registry_id']
+                    logger.info(f"Successfully created and registered voice for {voice.name}")
+    
+    # Write the registry before the cache that refers to its entries
+    registry.flush()
+    save_voice_cache(cache_file, cache)
+
+def main():
+    """Create and register voices for all characters."""
+    # Deferred so importing this module (e.g. for load_character_voices) stays cheap
+    from dotenv import load_dotenv
+    from voice_registry import VoiceRegistry
+    
+    # Load environment variables
+    load_dotenv()
+    
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    logger.info("Creating and registering voices for characters...")
+    
+    registry = VoiceRegistry()
+    register_all(registry)
+    
+    logger.info("Voice creation and registration complete!")
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
@@ -11,16 +11,24 @@ import json
 import logging
 import time
 import re
+import copy
+import difflib
+import hashlib
+import functools
+import concurrent.futures
+from collections import Counter
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Union
+from typing import Dict, List, Any, Iterator, Optional, Tuple, Union
 import uuid
+import secrets
+import asyncio
 import tempfile
 import subprocess
 import shutil
 
 # Try to import OpenAI
 try:
-    from openai import OpenAI
+    from openai import OpenAI, AsyncOpenAI
 except ImportError:
     logging.error("OpenAI not found. Please install it with: pip install openai")
     raise
@@ -31,9 +39,189 @@ from story_structure import get_story_structure, get_episode, generate_character
 # Setup logging
 logger = logging.getLogger(__name__)
 
+def _read_json(path: Path) -> Any:
+    """Read and parse a JSON file.
+    
+    The file is read as raw bytes, which json decodes as UTF-8 itself,
+    skipping the text layer's decoding and newline translation.
+    
+    Args:
+        path: Path of the JSON file
+    
+    Returns:
+        Parsed JSON data
+    """
+    with open(path, 'rb') as f:
+        return json.loads(f.read())
+
+def _write_json(path: Path, data: Any, indent: Optional[int] = 2) -> None:
+    """Atomically serialize data to a JSON file in a single write.
+    
+    The data is written to a temporary file that then replaces the target,
+    so an interrupted save never leaves a truncated file behind.
+    
+    Args:
+        path: Path of the JSON file
+        data: Data to serialize
+        indent: Indentation level, or None for compact output (which uses
+            json's C encoder and is several times faster)
+    """
+    tmp_path = path.with_suffix(path.suffix + '.tmp')
+    
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(json.dumps(data, indent=indent, ensure_ascii=False))
+    
+    os.replace(tmp_path, path)
+
+# Patterns for parsing generated scene scripts
+_PARAGRAPH_SPLIT = re.compile(r'\n{2,}')
+_BRACKETED = re.compile(r'\[(.*?)\]')
+_PARENTHESIZED = re.compile(r'\((.*?)\)')
+# The name run already absorbs trailing whitespace, so no \s* precedes the
+# parenthetical; overlapping whitespace quantifiers backtrack quadratically
+_DIALOGUE = re.compile(r'([A-Z][A-Z\s]+)(?:\(.*?\))?\:\s*(.*)')
+
+# Framing lines of the human-readable script format
+_READABLE_START_MARKER = "=== SCRIPT START (DO NOT EDIT THIS LINE) ==="
+_READABLE_END_MARKER = "=== SCRIPT END (DO NOT EDIT THIS LINE) ==="
+_READABLE_END_SCENE = "### END SCENE ###"
+
+# Line prefixes used in the human-readable script format, by line type
+_READABLE_LINE_PREFIXES = {
+    'description': '[DESCRIPTION]',
+    'sound_effect': '(SOUND)',
+    'narration': 'NARRATOR:'
+}
+
+# (prefix, prefix length, line type) in the order prefixes are checked
+_READABLE_PREFIX_TYPES = tuple(
+    (prefix, len(prefix), line_type) for line_type, prefix in _READABLE_LINE_PREFIXES.items()
+)
+
+# Patterns for parsing the human-readable script format
+_READABLE_BODY = re.compile(
+    re.escape(_READABLE_START_MARKER) + r"\n(.*?)\n" + re.escape(_READABLE_END_MARKER),
+    re.DOTALL
+)
+_READABLE_SCENE = re.compile(
+    r"### SCENE (\d+): (.*?) ###\n(.*?)(?=" + re.escape(_READABLE_END_SCENE) + ")",
+    re.DOTALL
+)
+_READABLE_SETTING_PREFIX = "SETTING: "
+_READABLE_SETTING = re.compile(re.escape(_READABLE_SETTING_PREFIX) + r"(.*?)(?:\n\n|\Z)")
+_READABLE_PARAGRAPH = re.compile(r"\S[^\n]*(?:\n(?!\n)[^\n]*)*")
+
+# Prompt for regenerating a single scene
+_REGENERATION_PROMPT = """
+You are tasked with regenerating a scene for a Star Trek-style podcast episode.
+
+CONTEXT:
+{context}
+
+{special_instructions}
+
+Please write a detailed scene script that maintains the same setting and beat as the original scene,
+but potentially improves the dialogue, pacing, and dramatic elements.
+
+Format the scene script as follows:
+1. Brief setting descriptions in [brackets]
+2. Character names in ALL CAPS, followed by their dialogue
+3. Sound effects in (parentheses)
+4. Narrator sections marked as NARRATOR
+"""
+
+# Append-only revision metadata index kept in each revisions directory
+REVISION_INDEX_FILE = "index.jsonl"
+
+# Delta revisions chain onto the previous revision; every Nth revision is a
+# full snapshot so reconstruction never walks more than N files
+REVISION_SNAPSHOT_INTERVAL = 10
+_BASE_SCENE_REF = "$base"
+
+# Thread pool settings for reading revision files when rebuilding the index
+PARALLEL_REVISION_READ_THRESHOLD = 4
+REVISION_READ_WORKERS = 8
+
+# Revision metadata written ahead of the embedded script by save_script
+_REVISION_HEADER = re.compile(
+    r'"revision_id"\s*:\s*"([^"]+)"\s*,\s*"timestamp"\s*:\s*([0-9.eE+-]+)'
+)
+_REVISION_HEADER_BYTES = 256
+
+def _read_revision_metadata(revision_file: Path) -> Dict[str, Any]:
+    """Read the ID and timestamp of a revision without parsing its script.
+    
+    Falls back to a full parse if the header isn't in the expected layout.
+    
+    Args:
+        revision_file: Path of the revision file
+    
+    Returns:
+        Dictionary with revision_id and timestamp
+    """
+    with open(revision_file, 'r', encoding='utf-8') as f:
+        head = f.read(_REVISION_HEADER_BYTES)
+    
+    match = _REVISION_HEADER.search(head)
+    if match:
+        return {"revision_id": match.group(1), "timestamp": float(match.group(2))}
+    
+    revision = _read_json(revision_file)
+    return {"revision_id": revision.get("revision_id"), "timestamp": revision.get("timestamp")}
+
+def _scene_hash(scene: Dict[str, Any]) -> str:
+    """Compute a content hash identifying a scene.
+    
+    Args:
+        scene: Scene data
+    
+    Returns:
+        Hex digest of the scene's canonical JSON
+    """
+    payload = json.dumps(scene, sort_keys=True, ensure_ascii=False)
+    return hashlib.blake2b(payload.encode('utf-8'), digest_size=16).hexdigest()
+
+@functools.lru_cache(maxsize=64)
+def _read_revision(revision_file: Path) -> Dict[str, Any]:
+    """Read a revision, reconstructing its script if it is stored as a delta.
+    
+    Delta revisions store unchanged scenes as {"$base": index} references
+    into their base revision's scenes. Revision files are never rewritten
+    once saved, so reconstructed revisions are cached and shared between
+    callers.
+    
+    Args:
+        revision_file: Path of the revision file
+    
+    Returns:
+        Revision data with the full script, its scene hashes and chain depth
+    """
+    revision = _read_json(revision_file)
+    script = revision.get("script", {})
+    
+    base_id = revision.get("base_revision")
+    if base_id:
+        base_scenes = _read_revision(revision_file.with_name(f"{base_id}.json"))["script"].get('scenes', [])
+        script['scenes'] = [
+            base_scenes[scene[_BASE_SCENE_REF]] if _BASE_SCENE_REF in scene else scene
+            for scene in script.get('scenes', [])
+        ]
+    
+    if 'scene_hashes' not in revision:
+        revision['scene_hashes'] = [_scene_hash(scene) for scene in script.get('scenes', [])]
+    
+    revision.setdefault('depth', 0)
+    return revision
+
 class ScriptEditor:
     """Editor for episode scripts with revision history and scene regeneration."""
     
+    # Sync OpenAI clients shared by all editors, keyed by API key, so each
+    # editor reuses the same pooled connections. Async clients are bound to
+    # the event loop that opened their connections, so they are created per
+    # regeneration run instead.
+    _clients: Dict[Optional[str], Any] = {}
+    
     def __init__(self, episodes_dir: str = "episodes"):
         """Initialize the script editor.
         
@@ -47,7 +235,10 @@ class ScriptEditor:
         if not api_key:
             logger.warning("OPENAI_API_KEY not found in environment variables")
         
-        self.client = OpenAI(api_key=api_key)
+        if api_key not in ScriptEditor._clients:
+            ScriptEditor._clients[api_key] = OpenAI(api_key=api_key)
+        self.client = ScriptEditor._clients[api_key]
+        self._api_key = api_key
         
         # Initialize story structure
         self.story_structure = get_story_structure()
@@ -69,10 +260,7 @@ class ScriptEditor:
             return {}
         
         try:
-            with open(script_file, 'r') as f:
-                script = json.load(f)
-            
-            return script
+            return _read_json(script_file)
         except Exception as e:
             logger.error(f"Error loading script: {e}")
             return {}
@@ -106,20 +294,23 @@ class ScriptEditor:
         if script_file.exists():
             try:
                 # Create revision of current script
-                with open(script_file, 'r') as f:
-                    current_script = json.load(f)
+                current_script = _read_json(script_file)
                 
                 # Generate revision ID and timestamp
                 revision = {
                     "revision_id": f"rev_{uuid.uuid4().hex[:8]}",
-                    "timestamp": time.time(),
-                    "script": current_script
+                    "timestamp": time.time()
                 }
+                revision.update(self._build_revision_delta(revisions_dir, current_script))
                 
                 # Save revision
                 revision_file = revisions_dir / f"{revision['revision_id']}.json"
-                with open(revision_file, 'w') as f:
-                    json.dump(revision, f, indent=2)
+                _write_json(revision_file, revision, indent=None)
+                self._append_revision_index(revisions_dir, {
+                    "revision_id": revision['revision_id'],
+                    "timestamp": revision['timestamp'],
+                    "file": revision_file.name
+                })
                 
                 logger.info(f"Created script revision: {revision['revision_id']}")
             
@@ -131,8 +322,7 @@ class ScriptEditor:
             # Update modified timestamp
             script['updated_at'] = time.time()
             
-            with open(script_file, 'w') as f:
-                json.dump(script, f, indent=2)
+            _write_json(script_file, script)
             
             logger.info(f"Saved script for episode {episode_id}")
             return True
@@ -141,6 +331,58 @@ class ScriptEditor:
             logger.error(f"Error saving script: {e}")
             return False
     
+    def _build_revision_delta(self, revisions_dir: Path, script: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the stored form of a script snapshot for a new revision.
+        
+        Scenes unchanged since the latest revision are stored as references
+        to that revision's scenes. A full snapshot is stored when there is
+        no earlier revision or the delta chain reaches
+        REVISION_SNAPSHOT_INTERVAL.
+        
+        Args:
+            revisions_dir: Directory containing the revision files
+            script: Script to snapshot
+        
+        Returns:
+            Revision fields: script, scene_hashes, and base_revision and
+            depth for delta revisions
+        """
+        scenes = script.get('scenes', [])
+        scene_hashes = [_scene_hash(scene) for scene in scenes]
+        snapshot = {"script": script, "scene_hashes": scene_hashes}
+        
+        revisions = self._load_revision_index(revisions_dir)
+        if not revisions:
+            return snapshot
+        
+        latest = max(revisions, key=lambda r: r.get("timestamp", 0))
+        try:
+            base = _read_revision((revisions_dir / latest["file"]).resolve())
+        except Exception as e:
+            logger.warning(f"Couldn't read base revision {latest.get('revision_id')}, storing full snapshot: {e}")
+            return snapshot
+        
+        depth = base['depth'] + 1
+        if depth >= REVISION_SNAPSHOT_INTERVAL:
+            return snapshot
+        
+        # Map base scene hashes to their positions, keeping the first of any duplicates
+        base_positions = {}
+        for index, scene_hash in enumerate(base['scene_hashes']):
+            base_positions.setdefault(scene_hash, index)
+        
+        delta_scenes = [
+            {_BASE_SCENE_REF: base_positions[scene_hash]} if scene_hash in base_positions else scene
+            for scene, scene_hash in zip(scenes, scene_hashes)
+        ]
+        
+        return {
+            "base_revision": latest["revision_id"],
+            "depth": depth,
+            "script": dict(script, scenes=delta_scenes),
+            "scene_hashes": scene_hashes
+        }
+    
     def preview_scene_flow(self, script: Dict[str, Any]) -> List[str]:
         """Generate a preview of the scene flow in the script.
         
@@ -163,17 +405,15 @@ class ScriptEditor:
             setting = scene.get('setting', 'Unknown setting')
             
             # Count dialogue lines by character
-            character_lines = {}
-            for line in scene.get('lines', []):
-                if line.get('type') == 'dialogue':
-                    character = line.get('character', 'Unknown')
-                    if character not in character_lines:
-                        character_lines[character] = 0
-                    character_lines[character] += 1
+            character_lines = Counter(
+                line.get('character', 'Unknown')
+                for line in scene.get('lines', [])
+                if line.get('type') == 'dialogue'
+            )
             
             # Create character summary
-            character_summary = ", ".join([f"{char} ({count} lines)" 
-                                         for char, count in character_lines.items()])
+            character_summary = ", ".join(f"{char} ({count} lines)"
+                                          for char, count in character_lines.items())
             
             # Create scene summary
             summary = f"Scene {scene_number}: {beat} - {setting}"
@@ -276,6 +516,20 @@ class ScriptEditor:
         Returns:
             Updated script with regenerated scene
         """
+        return asyncio.run(self.regenerate_scenes(episode_id, [scene_index], instructions))
+    
+    async def regenerate_scenes(self, episode_id: str, scene_indices: List[int],
+                                instructions: Optional[str] = None) -> Dict[str, Any]:
+        """Regenerate several scenes concurrently with optional instructions.
+        
+        Args:
+            episode_id: ID of the episode
+            scene_indices: Indices of the scenes to regenerate
+            instructions: Optional special instructions for regeneration
+        
+        Returns:
+            Updated script with regenerated scenes
+        """
         # Load episode and script
         episode = get_episode(episode_id)
         if not episode:
@@ -287,22 +541,75 @@ class ScriptEditor:
             logger.error(f"Script not found for episode: {episode_id}")
             return {}
         
-        # Validate scene index
+        # Validate scene indices
         if 'scenes' not in script:
             logger.error("Invalid script data: missing scenes")
             return script
         
-        if scene_index < 0 or scene_index >= len(script['scenes']):
-            logger.error(f"Invalid scene index: {scene_index}")
-            return script
+        for scene_index in scene_indices:
+            if scene_index < 0 or scene_index >= len(script['scenes']):
+                logger.error(f"Invalid scene index: {scene_index}")
+                return script
         
-        # Get the scene to regenerate
-        scene = script['scenes'][scene_index]
+        async_client = AsyncOpenAI(api_key=self._api_key)
+        try:
+            results = await asyncio.gather(
+                *(self._generate_scene_lines(async_client, episode, script['scenes'][scene_index],
+                                             scene_index, instructions)
+                  for scene_index in scene_indices),
+                return_exceptions=True
+            )
+        finally:
+            await async_client.close()
+        
+        regenerated = False
+        for scene_index, new_lines in zip(scene_indices, results):
+            if isinstance(new_lines, Exception):
+                logger.error(f"Error regenerating scene {scene_index}: {new_lines}")
+                continue
+            
+            # Update the scene
+            scene = script['scenes'][scene_index]
+            scene['lines'] = new_lines
+            scene.pop('needs_regeneration', None)  # Remove regeneration flag
+            
+            # Add to edit history
+            if 'edit_history' not in scene:
+                scene['edit_history'] = []
+            
+            scene['edit_history'].append({
+                "timestamp": time.time(),
+                "type": "regenerated",
+                "instructions": instructions
+            })
+            regenerated = True
+        
+        # Save the updated script
+        if regenerated:
+            self.save_script(script)
+        
+        return script
+    
+    async def _generate_scene_lines(self, async_client: AsyncOpenAI, episode: Dict[str, Any],
+                                    scene: Dict[str, Any], scene_index: int,
+                                    instructions: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Generate new lines for a scene, parsing paragraphs as they stream in.
+        
+        Args:
+            async_client: Async OpenAI client bound to the running event loop
+            episode: Episode data
+            scene: Scene to regenerate
+            scene_index: Index of the scene
+            instructions: Optional special instructions for regeneration
         
+        Returns:
+            List of line dictionaries
+        """
         # Get character information
-        character_info = ""
-        for char in episode.get('characters', []):
-            character_info += f"{char.get('name', '')}: {char.get('species', '')} - {char.get('role', '')}\n"
+        character_info = "".join(
+            f"{char.get('name', '')}: {char.get('species', '')} - {char.get('role', '')}\n"
+            for char in episode.get('characters', [])
+        )
         
         # Create context for regeneration
         context = (
@@ -320,62 +627,36 @@ class ScriptEditor:
             special_instructions = f"Special Instructions: {instructions}\n\n"
         
         # Construct prompt
-        prompt = f"""
-        You are tasked with regenerating a scene for a Star Trek-style podcast episode.
-        
-        CONTEXT:
-        {context}
-        
-        {special_instructions}
-        
-        Please write a detailed scene script that maintains the same setting and beat as the original scene,
-        but potentially improves the dialogue, pacing, and dramatic elements.
-        
-        Format the scene script as follows:
-        1. Brief setting descriptions in [brackets]
-        2. Character names in ALL CAPS, followed by their dialogue
-        3. Sound effects in (parentheses)
-        4. Narrator sections marked as NARRATOR
-        """
+        prompt = _REGENERATION_PROMPT.format(context=context, special_instructions=special_instructions)
+        
+        # Generate new scene content
+        stream = await async_client.chat.completions.create(
+            model="gpt-4o",
+            messages=[
+                {"role": "system", "content": "You are an expert screenwriter for audio dramas."},
+                {"role": "user", "content": prompt}
+            ],
+            temperature=0.7,
+            max_tokens=2000,
+            stream=True
+        )
         
-        try:
-            # Generate new scene content
-            response = self.client.chat.completions.create(
-                model="gpt-4o",
-                messages=[
-                    {"role": "system", "content": "You are an expert screenwriter for audio dramas."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.7,
-                max_tokens=2000
-            )
-            
-            # Parse the generated content
-            new_content = response.choices[0].message.content
-            new_lines = self._parse_script_lines(new_content)
-            
-            # Update the scene
-            scene['lines'] = new_lines
-            scene.pop('needs_regeneration', None)  # Remove regeneration flag
-            
-            # Add to edit history
-            if 'edit_history' not in scene:
-                scene['edit_history'] = []
-            
-            scene['edit_history'].append({
-                "timestamp": time.time(),
-                "type": "regenerated",
-                "instructions": instructions
-            })
-            
-            # Save the updated script
-            self.save_script(script)
+        # Parse complete paragraphs while the rest of the scene is still generating
+        lines = []
+        buffer = ""
+        async for chunk in stream:
+            if not chunk.choices:
+                continue
+            buffer += chunk.choices[0].delta.content or ""
             
-            return script
+            boundary = buffer.rfind("\n\n")
+            if boundary != -1:
+                lines.extend(self._parse_script_lines(buffer[:boundary]))
+                buffer = buffer[boundary:]
         
-        except Exception as e:
-            logger.error(f"Error regenerating scene: {e}")
-            return script
+        lines.extend(self._parse_script_lines(buffer))
+        
+        return lines
     
     def _parse_script_lines(self, script_content: str) -> List[Dict[str, Any]]:
         """Parse script content into structured lines.
@@ -389,7 +670,7 @@ class ScriptEditor:
         lines = []
         
         # Split script into paragraphs
-        paragraphs = re.split(r'\n{2,}', script_content)
+        paragraphs = _PARAGRAPH_SPLIT.split(script_content)
         
         scene_description = ""
         
@@ -399,11 +680,11 @@ class ScriptEditor:
                 continue
             
             # Check for scene description in brackets
-            description_match = re.search(r'\[(.*?)\]', paragraph)
+            description_match = _BRACKETED.search(paragraph) if '[' in paragraph else None
             if description_match:
                 scene_description = description_match.group(1).strip()
                 # Check if there's content after the description
-                remaining = re.sub(r'\[(.*?)\]', '', paragraph).strip()
+                remaining = _BRACKETED.sub('', paragraph).strip()
                 if not remaining:
                     lines.append({
                         "type": "description",
@@ -413,7 +694,7 @@ class ScriptEditor:
                 paragraph = remaining
             
             # Check for sound effect in parentheses
-            sound_effect_match = re.search(r'\((.*?)\)', paragraph)
+            sound_effect_match = _PARENTHESIZED.search(paragraph) if '(' in paragraph else None
             if sound_effect_match and len(sound_effect_match.group(0)) > len(paragraph) * 0.7:
                 lines.append({
                     "type": "sound_effect",
@@ -422,7 +703,10 @@ class ScriptEditor:
                 continue
             
             # Check for character dialogue
-            dialogue_match = re.search(r'^([A-Z][A-Z\s]+)(?:\s*\(.*?\))?\:\s*(.*)', paragraph)
+            # Dialogue starts with an uppercase name and always has a colon
+            dialogue_match = None
+            if 'A' <= paragraph[0] <= 'Z' and ':' in paragraph:
+                dialogue_match = _DIALOGUE.match(paragraph)
             if dialogue_match:
                 character = dialogue_match.group(1).strip()
                 dialogue = dialogue_match.group(2).strip()
@@ -464,28 +748,96 @@ class ScriptEditor:
         if not revisions_dir.exists():
             return []
         
-        revisions = []
+        revisions = self._load_revision_index(revisions_dir)
+        
+        # Sort by timestamp
+        revisions.sort(key=lambda r: r.get("timestamp", 0), reverse=True)
+        
+        return revisions
+    
+    def _load_revision_index(self, revisions_dir: Path) -> List[Dict[str, Any]]:
+        """Load revision metadata from the revision index.
+        
+        The index is rebuilt from the revision files if it doesn't exist.
+        
+        Args:
+            revisions_dir: Directory containing the revision files
         
-        for revision_file in revisions_dir.glob("*.json"):
+        Returns:
+            List of revision metadata
+        """
+        index_file = revisions_dir / REVISION_INDEX_FILE
+        
+        if index_file.exists():
             try:
-                with open(revision_file, 'r') as f:
-                    revision = json.load(f)
-                
-                # Extract metadata only
-                revisions.append({
-                    "revision_id": revision.get("revision_id"),
-                    "timestamp": revision.get("timestamp"),
-                    "file": revision_file.name
-                })
-            
+                with open(index_file, 'r', encoding='utf-8') as f:
+                    return [json.loads(line) for line in f if line.strip()]
             except Exception as e:
-                logger.error(f"Error reading revision file {revision_file}: {e}")
+                logger.error(f"Error reading revision index {index_file}, rebuilding: {e}")
+        
+        with os.scandir(revisions_dir) as entries:
+            revision_files = [
+                Path(entry.path) for entry in entries
+                if entry.name.endswith('.json') and entry.is_file()
+            ]
+        
+        # Overlap the file reads once there are enough to amortize the pool
+        if len(revision_files) >= PARALLEL_REVISION_READ_THRESHOLD:
+            with concurrent.futures.ThreadPoolExecutor(max_workers=REVISION_READ_WORKERS) as executor:
+                results = list(executor.map(self._read_revision_index_entry, revision_files))
+        else:
+            results = [self._read_revision_index_entry(revision_file) for revision_file in revision_files]
         
-        # Sort by timestamp
-        revisions.sort(key=lambda r: r.get("timestamp", 0), reverse=True)
+        revisions = [revision for revision in results if revision is not None]
+        
+        try:
+            with open(index_file, 'w', encoding='utf-8') as f:
+                f.writelines(json.dumps(revision) + "\n" for revision in revisions)
+        except Exception as e:
+            logger.error(f"Error writing revision index {index_file}: {e}")
         
         return revisions
     
+    def _read_revision_index_entry(self, revision_file: Path) -> Optional[Dict[str, Any]]:
+        """Read the index entry for a revision file.
+        
+        Args:
+            revision_file: Path of the revision file
+        
+        Returns:
+            Revision metadata, or None if the file can't be read
+        """
+        try:
+            # Extract metadata only
+            revision = _read_revision_metadata(revision_file)
+            revision["file"] = revision_file.name
+            return revision
+        
+        except Exception as e:
+            logger.error(f"Error reading revision file {revision_file}: {e}")
+            return None
+    
+    def _append_revision_index(self, revisions_dir: Path, revision: Dict[str, Any]) -> None:
+        """Append a revision's metadata to the revision index.
+        
+        A missing index is left to be rebuilt on the next listing, so that
+        revisions written before the index existed aren't lost from it.
+        
+        Args:
+            revisions_dir: Directory containing the revision files
+            revision: Revision metadata
+        """
+        index_file = revisions_dir / REVISION_INDEX_FILE
+        
+        if not index_file.exists():
+            return
+        
+        try:
+            with open(index_file, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(revision) + "\n")
+        except Exception as e:
+            logger.error(f"Error updating revision index {index_file}: {e}")
+    
     def load_revision(self, episode_id: str, revision_id: str) -> Dict[str, Any]:
         """Load a specific revision of a script.
         
@@ -504,10 +856,7 @@ class ScriptEditor:
             return {}
         
         try:
-            with open(revision_file, 'r') as f:
-                revision = json.load(f)
-            
-            return revision.get("script", {})
+            return copy.deepcopy(_read_revision(revision_file.resolve())["script"])
         
         except Exception as e:
             logger.error(f"Error loading revision: {e}")
@@ -549,23 +898,26 @@ class ScriptEditor:
         Returns:
             Dictionary with comparison results
         """
-        # Load first revision
-        script_a = self.load_revision(episode_id, revision_id_a)
+        # Load both revisions (or revision A and the current script) concurrently
+        with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+            future_a = executor.submit(self.load_revision, episode_id, revision_id_a)
+            if revision_id_b:
+                future_b = executor.submit(self.load_revision, episode_id, revision_id_b)
+            else:
+                future_b = executor.submit(self.load_episode_script, episode_id)
+            script_a = future_a.result()
+            script_b = future_b.result()
+        
         if not script_a:
             logger.error(f"Failed to load revision A: {revision_id_a}")
             return {"error": f"Failed to load revision A: {revision_id_a}"}
         
-        # Load second revision or current script
-        if revision_id_b:
-            script_b = self.load_revision(episode_id, revision_id_b)
-            if not script_b:
+        if not script_b:
+            if revision_id_b:
                 logger.error(f"Failed to load revision B: {revision_id_b}")
                 return {"error": f"Failed to load revision B: {revision_id_b}"}
-        else:
-            script_b = self.load_episode_script(episode_id)
-            if not script_b:
-                logger.error(f"Failed to load current script for episode: {episode_id}")
-                return {"error": f"Failed to load current script for episode: {episode_id}"}
+            logger.error(f"Failed to load current script for episode: {episode_id}")
+            return {"error": f"Failed to load current script for episode: {episode_id}"}
         
         # Compare scenes
         comparison = {
@@ -587,21 +939,28 @@ class ScriptEditor:
         total_scenes = max(len(a_scenes), len(b_scenes))
         matched_scenes = 0
         
-        for i in range(total_scenes):
-            if i < len(a_scenes) and i < len(b_scenes):
-                # Both scripts have this scene
-                scene_a = a_scenes[i]
-                scene_b = b_scenes[i]
-                
+        # Align scenes by beat and setting so an inserted scene doesn't shift every later one
+        matcher = difflib.SequenceMatcher(
+            None,
+            [(scene.get('beat'), scene.get('setting')) for scene in a_scenes],
+            [(scene.get('beat'), scene.get('setting')) for scene in b_scenes],
+            autojunk=False
+        )
+        
+        for tag, a_start, a_end, b_start, b_end in matcher.get_opcodes():
+            # Equal and replaced runs are compared pairwise
+            paired = min(a_end - a_start, b_end - b_start) if tag in ('equal', 'replace') else 0
+            
+            for offset in range(paired):
                 # Compare scene attributes
-                scene_comparison = self._compare_scenes(scene_a, scene_b)
+                scene_comparison = self._compare_scenes(a_scenes[a_start + offset], b_scenes[b_start + offset])
                 comparison["scene_changes"].append(scene_comparison)
                 
                 # Update matched scenes count
                 if scene_comparison.get("similarity", 0) > 0.7:
                     matched_scenes += 1
             
-            elif i < len(a_scenes):
+            for i in range(a_start + paired, a_end):
                 # Scene exists in A but not in B
                 comparison["scene_changes"].append({
                     "scene_number": i + 1,
@@ -610,7 +969,7 @@ class ScriptEditor:
                     "details": f"Scene {i + 1} from revision A is not present in revision B"
                 })
             
-            else:
+            for i in range(b_start + paired, b_end):
                 # Scene exists in B but not in A
                 comparison["scene_changes"].append({
                     "scene_number": i + 1,
@@ -636,6 +995,16 @@ class ScriptEditor:
         """
         scene_number = scene_a.get('scene_number', 0)
         
+        # Identical scenes (shared outright between delta revisions) need no line diff
+        if scene_a is scene_b or scene_a == scene_b:
+            return {
+                "scene_number": scene_number,
+                "action": "unchanged",
+                "similarity": 1.0,
+                "attribute_changes": [],
+                "line_changes": []
+            }
+        
         # Check for basic attribute changes
         attribute_changes = []
         for attr in ['beat', 'setting']:
@@ -654,68 +1023,56 @@ class ScriptEditor:
         
         # Count total lines in both scenes
         total_lines = max(len(lines_a), len(lines_b))
-        matched_lines = 0
         
-        for i in range(total_lines):
-            if i < len(lines_a) and i < len(lines_b):
-                # Both scenes have this line
-                line_a = lines_a[i]
-                line_b = lines_b[i]
-                
-                # Check if line type changed
-                type_changed = line_a.get('type') != line_b.get('type')
-                
-                # Check if content changed
-                content_changed = line_a.get('content') != line_b.get('content')
+        # Align lines so an inserted or removed line only affects itself
+        matcher = difflib.SequenceMatcher(
+            None,
+            [self._line_key(line) for line in lines_a],
+            [self._line_key(line) for line in lines_b],
+            autojunk=False
+        )
+        matched_lines = sum(block.size for block in matcher.get_matching_blocks())
+        
+        for tag, a_start, a_end, b_start, b_end in matcher.get_opcodes():
+            if tag == 'equal':
+                continue
+            
+            # Replaced runs are reported as changed lines, pairwise
+            paired = min(a_end - a_start, b_end - b_start) if tag == 'replace' else 0
+            
+            for offset in range(paired):
+                line_a = lines_a[a_start + offset]
+                line_b = lines_b[b_start + offset]
+                type_a, type_b = line_a.get('type'), line_b.get('type')
                 
                 # Check if character changed (for dialogue)
                 character_changed = False
-                if line_a.get('type') == 'dialogue' and line_b.get('type') == 'dialogue':
+                if type_a == 'dialogue' and type_b == 'dialogue':
                     character_changed = line_a.get('character') != line_b.get('character')
                 
-                if type_changed or content_changed or character_changed:
-                    line_changes.append({
-                        "line_number": i + 1,
-                        "type_changed": type_changed,
-                        "content_changed": content_changed,
-                        "character_changed": character_changed,
-                        "previous": {
-                            "type": line_a.get('type'),
-                            "content": line_a.get('content')[:50] + "..." if len(line_a.get('content', '')) > 50 else line_a.get('content', ''),
-                            "character": line_a.get('character') if line_a.get('type') == 'dialogue' else None
-                        },
-                        "current": {
-                            "type": line_b.get('type'),
-                            "content": line_b.get('content')[:50] + "..." if len(line_b.get('content', '')) > 50 else line_b.get('content', ''),
-                            "character": line_b.get('character') if line_b.get('type') == 'dialogue' else None
-                        }
-                    })
-                else:
-                    # Lines are the same
-                    matched_lines += 1
+                line_changes.append({
+                    "line_number": b_start + offset + 1,
+                    "type_changed": type_a != type_b,
+                    "content_changed": line_a.get('content') != line_b.get('content'),
+                    "character_changed": character_changed,
+                    "previous": self._summarize_line(line_a),
+                    "current": self._summarize_line(line_b)
+                })
             
-            elif i < len(lines_a):
+            for i in range(a_start + paired, a_end):
                 # Line exists in A but not in B
                 line_changes.append({
                     "line_number": i + 1,
                     "action": "removed",
-                    "previous": {
-                        "type": lines_a[i].get('type'),
-                        "content": lines_a[i].get('content')[:50] + "..." if len(lines_a[i].get('content', '')) > 50 else lines_a[i].get('content', ''),
-                        "character": lines_a[i].get('character') if lines_a[i].get('type') == 'dialogue' else None
-                    }
+                    "previous": self._summarize_line(lines_a[i])
                 })
             
-            else:
+            for i in range(b_start + paired, b_end):
                 # Line exists in B but not in A
                 line_changes.append({
                     "line_number": i + 1,
                     "action": "added",
-                    "current": {
-                        "type": lines_b[i].get('type'),
-                        "content": lines_b[i].get('content')[:50] + "..." if len(lines_b[i].get('content', '')) > 50 else lines_b[i].get('content', ''),
-                        "character": lines_b[i].get('character') if lines_b[i].get('type') == 'dialogue' else None
-                    }
+                    "current": self._summarize_line(lines_b[i])
                 })
         
         # Calculate line similarity
@@ -743,6 +1100,37 @@ class ScriptEditor:
             "line_changes": line_changes
         }
     
+    @staticmethod
+    def _line_key(line: Dict[str, Any]) -> tuple:
+        """Build the comparison key for a script line.
+        
+        Args:
+            line: Line dictionary
+        
+        Returns:
+            Tuple of the line's type, character (for dialogue) and content
+        """
+        character = line.get('character') if line.get('type') == 'dialogue' else None
+        return (line.get('type'), character, line.get('content'))
+    
+    @staticmethod
+    def _summarize_line(line: Dict[str, Any]) -> Dict[str, Any]:
+        """Summarize a script line for a comparison report.
+        
+        Args:
+            line: Line dictionary
+        
+        Returns:
+            Dictionary with the line's type, truncated content and character
+        """
+        line_type = line.get('type')
+        content = line.get('content') or ''
+        return {
+            "type": line_type,
+            "content": content[:50] + "..." if len(content) > 50 else content,
+            "character": line.get('character') if line_type == 'dialogue' else None
+        }
+    
     def edit_episode_script(self, episode_id: str) -> bool:
         """Open the script in a text editor for manual editing.
         If the script or scenes are missing, auto-generate characters and scenes first.
@@ -764,7 +1152,6 @@ class ScriptEditor:
             episode = get_episode(episode_id)
             if episode is not None and not episode.get('scenes'):
                 logger.info(f"Generating scenes for episode: {episode_id}")
-                import asyncio
                 asyncio.run(generate_scenes(episode_id))
             # Generate script
             logger.info(f"Generating script for episode: {episode_id}")
@@ -783,10 +1170,9 @@ class ScriptEditor:
                 logger.error(f"Failed to auto-generate script for episode: {episode_id}")
                 return False
         # Continue as before...
-        readable_script = self._create_readable_script(script)
         with tempfile.NamedTemporaryFile(suffix=".txt", mode="w+", delete=False) as tmp:
             tmp_path = tmp.name
-            tmp.write(readable_script)
+            tmp.writelines(self._iter_readable_script(script))
         try:
             editor = os.environ.get("EDITOR", "notepad" if os.name == "nt" else "nano")
             subprocess.run([editor, tmp_path], check=True)
@@ -803,8 +1189,10 @@ class ScriptEditor:
             logger.error(f"Error editing script: {e}")
             return False
         finally:
-            if os.path.exists(tmp_path):
+            try:
                 os.unlink(tmp_path)
+            except FileNotFoundError:
+                pass
     
     def _create_readable_script(self, script: Dict[str, Any]) -> str:
         """Create a human-readable version of the script.
@@ -815,39 +1203,75 @@ class ScriptEditor:
         Returns:
             Human-readable script string
         """
-        readable = f"TITLE: {script.get('title', 'Untitled')}\n"
-        readable += f"EPISODE ID: {script.get('episode_id', 'unknown')}\n\n"
-        readable += "=== SCRIPT START (DO NOT EDIT THIS LINE) ===\n\n"
+        return "".join(self._iter_readable_script(script))
+    
+    def _iter_readable_script(self, script: Dict[str, Any]) -> Iterator[str]:
+        """Generate the human-readable version of the script piece by piece.
+        
+        Args:
+            script: Script data
+        
+        Yields:
+            Consecutive fragments of the human-readable script
+        """
+        yield f"TITLE: {script.get('title', 'Untitled')}\n"
+        yield f"EPISODE ID: {script.get('episode_id', 'unknown')}\n\n"
+        yield f"{_READABLE_START_MARKER}\n\n"
         
         for i, scene in enumerate(script.get('scenes', [])):
             scene_number = scene.get('scene_number', i + 1)
             beat = scene.get('beat', 'Unknown beat')
             setting = scene.get('setting', 'Unknown setting')
             
-            readable += f"### SCENE {scene_number}: {beat} ###\n"
-            readable += f"SETTING: {setting}\n\n"
+            yield f"### SCENE {scene_number}: {beat} ###\n"
+            yield f"{_READABLE_SETTING_PREFIX}{setting}\n\n"
             
             for line in scene.get('lines', []):
                 line_type = line.get('type', 'unknown')
                 content = line.get('content', '')
                 
-                if line_type == 'description':
-                    readable += f"[DESCRIPTION] {content}\n\n"
-                elif line_type == 'dialogue':
-                    character = line.get('character', 'UNKNOWN')
-                    readable += f"{character}: {content}\n\n"
-                elif line_type == 'sound_effect':
-                    readable += f"(SOUND) {content}\n\n"
-                elif line_type == 'narration':
-                    readable += f"NARRATOR: {content}\n\n"
+                # Dialogue is the bulk of most scenes, so it is checked first
+                if line_type == 'dialogue':
+                    yield f"{line.get('character', 'UNKNOWN')}: {content}\n\n"
+                    continue
+                
+                prefix = _READABLE_LINE_PREFIXES.get(line_type)
+                if prefix is not None:
+                    yield f"{prefix} {content}\n\n"
                 else:
-                    readable += f"[{line_type.upper()}] {content}\n\n"
+                    yield f"[{line_type.upper()}] {content}\n\n"
             
-            readable += "### END SCENE ###\n\n"
+            yield f"{_READABLE_END_SCENE}\n\n"
         
-        readable += "=== SCRIPT END (DO NOT EDIT THIS LINE) ===\n"
+        yield f"{_READABLE_END_MARKER}\n"
+    
+    @staticmethod
+    def _split_readable_setting(scene_content: str) -> Tuple[str, str]:
+        """Split the SETTING line off a readable scene body.
         
-        return readable
+        The setting normally opens the scene body, so that case is handled
+        with plain string operations; anything else falls back to a search.
+        
+        Args:
+            scene_content: Scene body following the scene header
+        
+        Returns:
+            Tuple of the setting and the remaining scene content
+        """
+        if scene_content.startswith(_READABLE_SETTING_PREFIX):
+            start = len(_READABLE_SETTING_PREFIX)
+            line_end = scene_content.find('\n', start)
+            if line_end == -1:
+                return scene_content[start:].strip(), ""
+            if scene_content.startswith('\n\n', line_end):
+                return scene_content[start:line_end].strip(), scene_content[line_end + 2:]
+        
+        setting_match = _READABLE_SETTING.search(scene_content)
+        if not setting_match:
+            return "", scene_content
+        
+        start, end = setting_match.span()
+        return setting_match.group(1).strip(), scene_content[:start] + scene_content[end:]
     
     def _parse_readable_script(self, readable_script: str, original_script: Dict[str, Any]) -> Dict[str, Any]:
         """Parse a human-readable script back to structured format.
@@ -869,8 +1293,7 @@ class ScriptEditor:
         }
         
         # Extract content between start and end markers
-        pattern = r"=== SCRIPT START \(DO NOT EDIT THIS LINE\) ===\n(.*?)\n=== SCRIPT END \(DO NOT EDIT THIS LINE\) ==="
-        match = re.search(pattern, readable_script, re.DOTALL)
+        match = _READABLE_BODY.search(readable_script)
         
         if not match:
             logger.error("Failed to find script content markers")
@@ -878,95 +1301,68 @@ class ScriptEditor:
         
         content = match.group(1)
         
+        # Map original scene numbers to scene IDs, keeping the first of any duplicates
+        original_ids = {}
+        for original_scene in original_script.get('scenes', []):
+            original_ids.setdefault(original_scene.get('scene_number'), original_scene.get('scene_id'))
+        
         # Split into scenes
-        scene_pattern = r"### SCENE (\d+): (.*?) ###\n(.*?)(?=### END SCENE ###)"
-        scene_matches = re.finditer(scene_pattern, content, re.DOTALL)
+        scene_matches = _READABLE_SCENE.finditer(content)
         
         for scene_match in scene_matches:
             scene_number = int(scene_match.group(1))
             beat = scene_match.group(2).strip()
             scene_content = scene_match.group(3)
             
-            # Extract setting
-            setting_match = re.search(r"SETTING: (.*?)(?:\n\n|\Z)", scene_content)
-            setting = setting_match.group(1).strip() if setting_match else ""
-            
-            # Remove setting line from content
-            if setting_match:
-                scene_content = scene_content.replace(setting_match.group(0), "", 1)
+            # Extract setting and remove it from content
+            setting, scene_content = self._split_readable_setting(scene_content)
             
             # Parse lines
             lines = []
             
-            # Split content into lines/paragraphs
-            paragraphs = re.split(r'\n\n', scene_content.strip())
-            
-            for paragraph in paragraphs:
-                paragraph = paragraph.strip()
-                if not paragraph:
-                    continue
+            # Scan paragraphs (blank-line separated, starting at non-whitespace) in one pass
+            for paragraph_match in _READABLE_PARAGRAPH.finditer(scene_content):
+                paragraph = paragraph_match.group(0).rstrip()
                 
                 # Check line type
-                if paragraph.startswith('[DESCRIPTION]'):
-                    content = paragraph[len('[DESCRIPTION]'):].strip()
-                    lines.append({
-                        "type": "description",
-                        "content": content
-                    })
-                
-                elif paragraph.startswith('(SOUND)'):
-                    content = paragraph[len('(SOUND)'):].strip()
-                    lines.append({
-                        "type": "sound_effect",
-                        "content": content
-                    })
-                
-                elif paragraph.startswith('NARRATOR:'):
-                    content = paragraph[len('NARRATOR:'):].strip()
-                    lines.append({
-                        "type": "narration",
-                        "content": content
-                    })
-                
-                elif ':' in paragraph:
-                    # Dialogue
-                    parts = paragraph.split(':', 1)
-                    character = parts[0].strip()
-                    content = parts[1].strip()
-                    
-                    lines.append({
-                        "type": "dialogue",
-                        "character": character,
-                        "content": content
-                    })
-                
+                for prefix, prefix_length, line_type in _READABLE_PREFIX_TYPES:
+                    if paragraph.startswith(prefix):
+                        lines.append({
+                            "type": line_type,
+                            "content": paragraph[prefix_length:].strip()
+                        })
+                        break
                 else:
-                    # Default to description
-                    lines.append({
-                        "type": "description",
-                        "content": paragraph
-                    })
+                    if ':' in paragraph:
+                        # Dialogue
+                        character, content = paragraph.split(':', 1)
+                        lines.append({
+                            "type": "dialogue",
+                            "character": character.strip(),
+                            "content": content.strip()
+                        })
+                    else:
+                        # Default to description
+                        lines.append({
+                            "type": "description",
+                            "content": paragraph
+                        })
             
-            # Create scene
+            # Create scene, reusing its ID from the original script if it has one
             scene = {
-                "scene_id": f"scene_{uuid.uuid4().hex[:8]}",
+                "scene_id": original_ids.get(scene_number) or f"scene_{secrets.token_hex(4)}",
                 "scene_number": scene_number,
                 "beat": beat,
                 "setting": setting,
                 "lines": lines
             }
             
-            # Check if this scene has an ID in the original script
-            if 'scenes' in original_script:
-                for original_scene in original_script['scenes']:
-                    if original_scene.get('scene_number') == scene_number:
-                        scene['scene_id'] = original_scene.get('scene_id', scene['scene_id'])
-                        break
-            
             new_script['scenes'].append(scene)
         
-        # Sort scenes by scene number
-        new_script['scenes'].sort(key=lambda s: s.get('scene_number', 0))
+        # Sort scenes by scene number, unless they are already in order as usual
+        scenes = new_script['scenes']
+        if any(a['scene_number'] > b['scene_number'] for a, b in zip(scenes, scenes[1:])):
+            scenes.sort(key=lambda s: s['scene_number'])
         
         return new_script
 
@@ -1034,6 +1430,33 @@ def update_line(scene_index: int, line_index: int, new_text: str,
         logger.error(f"Failed to save updated script for episode: {episode_id}")
         return script
 
+def update_lines(changes: List[Tuple[int, int, str]], episode_id: str) -> Dict[str, Any]:
+    """Update several lines in the script with a single load and save.
+    
+    Args:
+        changes: List of (scene_index, line_index, new_text) tuples
+        episode_id: ID of the episode
+    
+    Returns:
+        Updated script
+    """
+    editor = get_script_editor()
+    script = editor.load_episode_script(episode_id)
+    
+    if not script:
+        logger.error(f"Failed to load script for episode: {episode_id}")
+        return {}
+    
+    updated_script = script
+    for scene_index, line_index, new_text in changes:
+        updated_script = editor.update_line(updated_script, scene_index, line_index, new_text)
+    
+    if editor.save_script(updated_script):
+        return updated_script
+    else:
+        logger.error(f"Failed to save updated script for episode: {episode_id}")
+        return script
+
 def mark_scene_for_regeneration(scene_index: int, episode_id: str) -> Dict[str, Any]:
     """Mark a scene for regeneration.
     
@@ -1074,6 +1497,21 @@ def regenerate_scene(episode_id: str, scene_index: int,
     editor = get_script_editor()
     return editor.regenerate_scene(episode_id, scene_index, instructions)
 
+async def regenerate_scenes(episode_id: str, scene_indices: List[int],
+                            instructions: Optional[str] = None) -> Dict[str, Any]:
+    """Regenerate several scenes concurrently with optional instructions.
+    
+    Args:
+        episode_id: ID of the episode
+        scene_indices: Indices of the scenes to regenerate
+        instructions: Optional special instructions for regeneration
+    
+    Returns:
+        Updated script with regenerated scenes
+    """
+    editor = get_script_editor()
+    return await editor.regenerate_scenes(episode_id, scene_indices, instructions)
+
 def save_script(script: Dict[str, Any]) -> bool:
     """Save a script to file, with revision history.
     
@@ -13,13 +13,27 @@ import time
 import uuid
 import random
 import re
+import hashlib
+import shutil
+import statistics
+import functools
+import operator
+import importlib.util
+import weakref
+import threading
+import concurrent.futures
+from collections import deque
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, List, Any, Optional, Tuple, Callable, Awaitable
 import asyncio
 
 # Try to import required libraries
 try:
-    from openai import OpenAI, AsyncOpenAI
+    from openai import (
+        OpenAI, AsyncOpenAI, RateLimitError, APIConnectionError,
+        APITimeoutError, InternalServerError
+    )
+    import httpx
 except ImportError:
     logging.error("OpenAI not found. Please install it with: pip install openai")
     raise
@@ -31,6 +45,252 @@ from reference_memory_sync import search_references
 # Setup logging
 logger = logging.getLogger(__name__)
 
+# Scene generation limits, kept under the account's OpenAI rate limits
+SCENE_MAX_CONCURRENCY = int(os.environ.get("SCENE_MAX_CONCURRENCY", "8"))
+OPENAI_REQUESTS_PER_MINUTE = int(os.environ.get("OPENAI_REQUESTS_PER_MINUTE", "500"))
+OPENAI_TOKENS_PER_MINUTE = int(os.environ.get("OPENAI_TOKENS_PER_MINUTE", "30000"))
+
+# Episode and script files are written compactly (json's C encoder);
+# set PRETTY_JSON=1 to indent them for reading by hand
+SAVE_JSON_INDENT = 2 if os.environ.get("PRETTY_JSON") == "1" else None
+
+# Per-episode directory holding scenes generated by an unfinished run
+SCENE_CHECKPOINT_DIR = "scene_checkpoints"
+
+# On-disk completion cache for title and character prompts
+LLM_CACHE_TTL = 30 * 86400
+LLM_CACHE_MAX_TEMPERATURE = 0.9
+
+# Batch API polling interval bounds, in seconds
+BATCH_POLL_INITIAL_DELAY = 30
+BATCH_POLL_MAX_DELAY = 600
+
+SCENE_SYSTEM_PROMPT = "You are an expert screenwriter specializing in science fiction and Star Trek."
+
+# Connection pool limits for the async OpenAI/OpenRouter clients
+HTTP_MAX_CONNECTIONS = 64
+HTTP_MAX_KEEPALIVE_CONNECTIONS = 32
+
+# Number of recent times to first token per provider used to route scene requests
+PROVIDER_LATENCY_WINDOW = 20
+
+# Threads reading episode structures when the episode index is rebuilt
+INDEX_REBUILD_WORKERS = 16
+
+# Scene script max_tokens levels; each scene gets the smallest level that
+# covers its predicted length, so none gets less than the former flat 2000
+SCENE_SCRIPT_TOKEN_BINS = (2000, 3000, 4000)
+
+# Predicted scene script tokens per second of target scene length (spoken
+# dialogue at ~150 words a minute, plus descriptions and sound effects)
+SCENE_SCRIPT_TOKENS_PER_SECOND = 6
+
+# Scene prompt context limits, in characters
+SCENE_CHARACTER_INFO_LIMIT = 400
+SCENE_REFERENCE_LIMIT = 400
+
+# Keys requested from the model for JSON character profiles and scene outlines
+CHARACTER_FIELDS = ("name", "species", "role", "personality", "backstory", "voice_description")
+SCENE_FIELDS = ("setting", "characters", "plot", "dialogue", "atmosphere", "sound_effects")
+
+def _load_json_object(text: str) -> Optional[Dict[str, Any]]:
+    """Decode generated text as a JSON object.
+    
+    Args:
+        text: Generated text
+    
+    Returns:
+        Decoded object, or None if the text is not a JSON object
+    """
+    try:
+        data = json.loads(text)
+    except (TypeError, ValueError):
+        return None
+    
+    return data if isinstance(data, dict) else None
+
+# Header line of a labeled field, e.g. "Setting: ...", "**Plot:**" or "2. Mood -"
+_FIELD_HEADER = re.compile(r'^\s*(?:\d+\.\s*)?[*#\-\s]*([A-Za-z][A-Za-z /]{0,30}?)\s*\**\s*:\**\s*(.*)$')
+
+def _extract_fields(text: str) -> Dict[str, str]:
+    """Split free-form generated text into labeled fields in one pass.
+    
+    Each header line starts a field that continues until the next header.
+    Text before the first header is ignored, and only the first occurrence
+    of a label is kept.
+    
+    Args:
+        text: Generated text
+    
+    Returns:
+        Dictionary mapping lowercased labels to their stripped values
+    """
+    fields = {}
+    label = None
+    lines = []
+    
+    for line in text.splitlines():
+        header = _FIELD_HEADER.match(line)
+        if header:
+            if label is not None and label not in fields:
+                fields[label] = "\n".join(lines).strip()
+            label = header.group(1).strip().lower()
+            lines = [header.group(2)]
+        elif label is not None:
+            lines.append(line)
+    
+    if label is not None and label not in fields:
+        fields[label] = "\n".join(lines).strip()
+    
+    return fields
+
+def _field_value(fields: Dict[str, str], *prefixes: str) -> Optional[str]:
+    """Return the first non-empty field whose label starts with a prefix.
+    
+    Prefixes are tried in order, so earlier ones take precedence.
+    
+    Args:
+        fields: Fields from _extract_fields
+        *prefixes: Lowercase label prefixes
+    
+    Returns:
+        Field value, or None if no field matches
+    """
+    for prefix in prefixes:
+        for label, value in fields.items():
+            if value and label.startswith(prefix):
+                return value
+    
+    return None
+
+# Patterns for parsing generated character profiles
+_CHARACTER_SECTION_SPLIT = re.compile(r'\n\s*\n|\n\d+\.\s+')
+_CHARACTER_NAME = re.compile(r'^[*#]*\s*(?:Name:?\s*)?([A-Za-z\s\'\"]+)', re.MULTILINE)
+_CHARACTER_NAME_FALLBACK = re.compile(r'^([A-Z][A-Za-z\'\s]+)(?:\n|\:)')
+
+# Separator between names in a scene's character list
+_SCENE_CHARACTER_SPLIT = re.compile(r',|\n')
+
+# Patterns for parsing generated scene scripts
+_PARAGRAPH_SPLIT = re.compile(r'\n{2,}')
+_BRACKETED = re.compile(r'\[(.*?)\]')
+_PARENTHESIZED = re.compile(r'\((.*?)\)')
+# The name run already absorbs trailing whitespace, so no \s* precedes the
+# parenthetical; overlapping whitespace quantifiers backtrack quadratically
+_DIALOGUE = re.compile(r'([A-Z][A-Z\s]+)(?:\(.*?\))?\:\s*(.*)')
+
+# Scene fields and the label prefixes they are read from in text outlines
+_SCENE_FIELD_LABELS = (
+    ("setting", ("setting",)),
+    ("characters", ("character",)),
+    ("plot", ("plot",)),
+    ("dialogue", ("dialogue",)),
+    ("atmosphere", ("atmosphere", "mood")),
+    ("sound_effects", ("sound",))
+)
+
+def _complete_text_outline(text: str) -> Optional[str]:
+    """Return the complete part of a partially streamed text scene outline.
+    
+    A text outline is complete once every scene field has appeared and been
+    closed by a blank line. JSON outlines are never cut short.
+    
+    Args:
+        text: Outline text streamed so far
+    
+    Returns:
+        Text up to the blank line closing the last field, or None if the
+        outline is not complete yet
+    """
+    if text.lstrip().startswith("{"):
+        return None
+    
+    end = text.rfind("\n\n")
+    if end == -1:
+        return None
+    
+    fields = _extract_fields(text[:end])
+    if all(_field_value(fields, *prefixes) for _, prefixes in _SCENE_FIELD_LABELS):
+        return text[:end]
+    
+    return None
+
+# Retry policy for transient OpenAI failures (rate limits, 5xx, network)
+OPENAI_RETRY_ATTEMPTS = 5
+OPENAI_RETRY_MAX_DELAY = 30
+_TRANSIENT_OPENAI_ERRORS = (RateLimitError, APIConnectionError, APITimeoutError, InternalServerError)
+
+def _retry_delay(attempt: int) -> float:
+    """Exponential backoff with jitter for the given zero-based attempt."""
+    return min(2 ** attempt + random.random(), OPENAI_RETRY_MAX_DELAY)
+
+async def _with_retry(coro_factory: Callable[[], Awaitable[Any]],
+                      attempts: int = OPENAI_RETRY_ATTEMPTS) -> Any:
+    """Await a fresh coroutine from coro_factory, retrying transient errors.
+    
+    Args:
+        coro_factory: Callable returning the coroutine to await
+        attempts: Maximum number of attempts
+    
+    Returns:
+        Result of the first successful attempt
+    """
+    for attempt in range(attempts):
+        try:
+            return await coro_factory()
+        except _TRANSIENT_OPENAI_ERRORS as e:
+            if attempt == attempts - 1:
+                raise
+            delay = _retry_delay(attempt)
+            logger.warning(f"Transient OpenAI error ({e}), retrying in {delay:.1f}s")
+            await asyncio.sleep(delay)
+
+class RateLimiter:
+    """Token bucket limiting requests and tokens per minute."""
+    
+    def __init__(self, requests_per_minute: int, tokens_per_minute: int):
+        """Initialize the rate limiter with full buckets.
+        
+        Args:
+            requests_per_minute: Maximum requests per minute
+            tokens_per_minute: Maximum tokens per minute
+        """
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self._requests = float(requests_per_minute)
+        self._tokens = float(tokens_per_minute)
+        self._updated = time.monotonic()
+    
+    def _refill(self) -> None:
+        """Refill both buckets for the time elapsed since the last refill."""
+        now = time.monotonic()
+        minutes = (now - self._updated) / 60
+        self._updated = now
+        
+        self._requests = min(self.requests_per_minute, self._requests + minutes * self.requests_per_minute)
+        self._tokens = min(self.tokens_per_minute, self._tokens + minutes * self.tokens_per_minute)
+    
+    async def acquire(self, tokens: int) -> None:
+        """Wait until one request and the given number of tokens are available.
+        
+        Args:
+            tokens: Estimated tokens the request will consume
+        """
+        tokens = min(tokens, self.tokens_per_minute)
+        
+        while True:
+            self._refill()
+            if self._requests >= 1 and self._tokens >= tokens:
+                self._requests -= 1
+                self._tokens -= tokens
+                return
+            
+            wait = max(
+                (1 - self._requests) * 60 / self.requests_per_minute,
+                (tokens - self._tokens) * 60 / self.tokens_per_minute
+            )
+            await asyncio.sleep(wait)
+
 class StoryStructure:
     """Handles story structure using Save the Cat beat sheet approach."""
     
@@ -128,6 +388,14 @@ class StoryStructure:
         }
     ]
     
+    # Per-beat (name, description, duration factor, start fraction, end fraction)
+    _BEAT_TIMINGS = tuple(
+        (beat["name"], beat["description"], beat["duration_factor"],
+         beat["percentage"] - (beat["duration_factor"] / 2),
+         beat["percentage"] + (beat["duration_factor"] / 2))
+        for beat in BEAT_SHEET
+    )
+    
     def __init__(self, episodes_dir: str = "episodes"):
         """Initialize the story structure module.
         
@@ -136,6 +404,12 @@ class StoryStructure:
         """
         self.episodes_dir = Path(episodes_dir)
         self.episodes_dir.mkdir(exist_ok=True)
+        self.llm_cache_dir = self.episodes_dir / ".llm_cache"
+        self.index_file = self.episodes_dir / "_index.json"
+        self._index: Optional[Dict[str, Dict[str, Any]]] = None
+        # Episodes are saved from executor threads, so index loads, updates
+        # and saves are serialized
+        self._index_lock = threading.RLock()
         
         # Get mem0 client
         self.mem0_client = get_mem0_client()
@@ -145,24 +419,100 @@ class StoryStructure:
         if not api_key:
             logger.warning("OPENAI_API_KEY not found in environment variables")
         
-        self.client = OpenAI(api_key=api_key)
-        self.async_client = AsyncOpenAI(api_key=api_key)
-        
-        # Initialize OpenRouter client (fallback)
-        openrouter_key = os.environ.get("OPENROUTER_API_KEY")
-        if openrouter_key:
-            self.using_openrouter = True
-            self.openrouter_client = OpenAI(
-                base_url="https://openrouter.ai/api/v1",
-                api_key=openrouter_key
-            )
-            self.async_openrouter_client = AsyncOpenAI(
-                base_url="https://openrouter.ai/api/v1",
-                api_key=openrouter_key
-            )
-        else:
-            self.using_openrouter = False
+        # Clients share a connection pool sized for concurrent scene
+        # generation (httpx defaults to 10 connections); HTTP/2 multiplexing
+        # is used when the optional h2 package is installed. Async pools are
+        # bound to the event loop that opened their connections, so one is
+        # created per running loop (see _loop_clients).
+        self._http_options = {
+            "limits": httpx.Limits(max_connections=HTTP_MAX_CONNECTIONS,
+                                   max_keepalive_connections=HTTP_MAX_KEEPALIVE_CONNECTIONS),
+            "http2": importlib.util.find_spec("h2") is not None,
+            "timeout": httpx.Timeout(60.0, connect=5.0)
+        }
+        self._sync_http = httpx.Client(**self._http_options)
+        self._api_key = api_key
+        self.client = OpenAI(api_key=api_key, http_client=self._sync_http)
+        self._async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, Any]]" = \
+            weakref.WeakKeyDictionary()
+        
+        # OpenRouter is used as a fallback when configured
+        self._openrouter_key = os.environ.get("OPENROUTER_API_KEY")
+        self.using_openrouter = bool(self._openrouter_key)
+        if not self.using_openrouter:
             logger.warning("OPENROUTER_API_KEY not found in environment variables")
+        
+        # Recent scene outline times to first token, used to route between providers
+        self._provider_latencies = {
+            "openai": deque(maxlen=PROVIDER_LATENCY_WINDOW),
+            "openrouter": deque(maxlen=PROVIDER_LATENCY_WINDOW)
+        }
+        self.rate_limiter = RateLimiter(OPENAI_REQUESTS_PER_MINUTE, OPENAI_TOKENS_PER_MINUTE)
+        
+        # Reference search results by (query, limit)
+        self._reference_cache: Dict[Tuple[str, int], List[Dict[str, Any]]] = {}
+    
+    def _loop_clients(self) -> Dict[str, Any]:
+        """Get the async clients bound to the running event loop.
+        
+        Returns:
+            Dictionary with the loop's httpx pool and OpenAI/OpenRouter clients
+        """
+        loop = asyncio.get_running_loop()
+        clients = self._async_clients.get(loop)
+        if clients is None:
+            http = httpx.AsyncClient(**self._http_options)
+            clients = {
+                "http": http,
+                "openai": AsyncOpenAI(api_key=self._api_key, http_client=http),
+                "openrouter": AsyncOpenAI(
+                    base_url="https://openrouter.ai/api/v1",
+                    api_key=self._openrouter_key,
+                    http_client=http
+                ) if self._openrouter_key else None
+            }
+            self._async_clients[loop] = clients
+        return clients
+    
+    @property
+    def async_client(self) -> AsyncOpenAI:
+        """Async OpenAI client for the running event loop."""
+        return self._loop_clients()["openai"]
+    
+    @property
+    def async_openrouter_client(self) -> Optional[AsyncOpenAI]:
+        """Async OpenRouter client for the running event loop, if configured."""
+        return self._loop_clients()["openrouter"]
+    
+    async def aclose(self) -> None:
+        """Close the connection pool opened on the running event loop."""
+        clients = self._async_clients.pop(asyncio.get_running_loop(), None)
+        if clients is not None:
+            await clients["http"].aclose()
+    
+    def close(self) -> None:
+        """Close the sync client's connection pool."""
+        self._sync_http.close()
+    
+    def _run(self, coro: Awaitable[Any]) -> Any:
+        """Run a coroutine on a new event loop from sync code.
+        
+        The loop's connection pool is closed before the loop is, so no
+        connections outlive it.
+        
+        Args:
+            coro: Coroutine to run
+        
+        Returns:
+            Result of the coroutine
+        """
+        async def run_and_close():
+            try:
+                return await coro
+            finally:
+                await self.aclose()
+        
+        return asyncio.run(run_and_close())
     
     def generate_episode_structure(self, episode_data: Dict[str, Any]) -> Dict[str, Any]:
         """Generate the structure for a new podcast episode.
@@ -179,9 +529,14 @@ class StoryStructure:
         # Get episode number
         episode_number = episode_data.get("episode_number")
         if episode_number is None:
-            # Auto-increment from existing episodes
-            existing_episodes = self.list_episodes(series=episode_data.get("series"))
-            episode_number = max([ep.get("episode_number", 0) for ep in existing_episodes], default=0) + 1
+            # Auto-increment from the highest episode number saved so far
+            series = episode_data.get("series")
+            episode_number = max(
+                (summary.get("episode_number") or 0
+                 for summary in self._load_index().values()
+                 if not series or summary.get("series") == series),
+                default=0
+            ) + 1
         
         # Get or generate title
         title = episode_data.get("title")
@@ -229,32 +584,37 @@ class StoryStructure:
         """
         total_seconds = target_duration * 60
         
-        beats = []
-        for beat in self.BEAT_SHEET:
-            beat_duration = int(total_seconds * beat["duration_factor"])
-            
-            # Calculate timepoints for the beat
-            start_percent = beat["percentage"] - (beat["duration_factor"] / 2)
-            end_percent = beat["percentage"] + (beat["duration_factor"] / 2)
-            
-            start_time = int(total_seconds * start_percent)
-            end_time = int(total_seconds * end_percent)
-            
-            beats.append({
-                "name": beat["name"],
-                "description": beat["description"],
-                "duration_seconds": beat_duration,
-                "start_time": start_time,
-                "end_time": end_time
-            })
-        
-        return beats
+        return [
+            {
+                "name": name,
+                "description": description,
+                "duration_seconds": int(total_seconds * duration_factor),
+                "start_time": int(total_seconds * start_percent),
+                "end_time": int(total_seconds * end_percent)
+            }
+            for name, description, duration_factor, start_percent, end_percent in self._BEAT_TIMINGS
+        ]
     
     def _generate_title(self, theme: Optional[str] = None, 
                       series: Optional[str] = None,
                       episode_number: Optional[int] = None) -> str:
         """Generate a title for the episode.
         
+        Args:
+            theme: Optional theme for the episode
+            series: Optional series name
+            episode_number: Optional episode number
+        
+        Returns:
+            Generated title
+        """
+        return self._run(self._generate_title_async(theme, series, episode_number))
+    
+    async def _generate_title_async(self, theme: Optional[str] = None, 
+                                  series: Optional[str] = None,
+                                  episode_number: Optional[int] = None) -> str:
+        """Generate a title for the episode with the async client.
+        
         Args:
             theme: Optional theme for the episode
             series: Optional series name
@@ -279,7 +639,7 @@ class StoryStructure:
             prompt += ". The title should be catchy, intriguing, and reference sci-fi concepts."
             
             # Query the AI
-            response = self.client.chat.completions.create(
+            content = await self._cached_completion(
                 model="gpt-4o",
                 messages=[
                     {"role": "system", "content": "You are a professional sci-fi writer specializing in Star Trek."},
@@ -290,7 +650,7 @@ class StoryStructure:
             )
             
             # Extract and clean the title
-            title = response.choices[0].message.content.strip()
+            title = content.strip()
             
             # Remove quotes if present
             if title.startswith('"') and title.endswith('"'):
@@ -312,6 +672,49 @@ class StoryStructure:
             
             return fallback
     
+    async def _cached_completion(self, **request: Any) -> str:
+        """Return the completion for a chat request, reusing cached responses.
+        
+        Responses are cached on disk keyed by a hash of the full request, so
+        regenerating a title or cast from an identical prompt skips the API.
+        Requests above LLM_CACHE_MAX_TEMPERATURE are never cached, and
+        NO_LLM_CACHE=1 bypasses the cache entirely.
+        
+        Args:
+            **request: Keyword arguments for chat.completions.create
+        
+        Returns:
+            Generated message content
+        """
+        payload = json.dumps(request, sort_keys=True)
+        cache_file = self.llm_cache_dir / f"{hashlib.sha256(payload.encode('utf-8')).hexdigest()}.json"
+        use_cache = (os.getenv("NO_LLM_CACHE") != "1" and
+                     request.get("temperature", 1.0) <= LLM_CACHE_MAX_TEMPERATURE)
+        
+        if use_cache:
+            try:
+                with open(cache_file, 'r', encoding='utf-8') as f:
+                    entry = json.load(f)
+                if time.time() - entry["created_at"] < LLM_CACHE_TTL:
+                    return entry["content"]
+            except (OSError, ValueError, KeyError):
+                pass
+        
+        response = await _with_retry(lambda: self.async_client.chat.completions.create(**request))
+        content = response.choices[0].message.content
+        
+        if use_cache:
+            try:
+                self.llm_cache_dir.mkdir(exist_ok=True)
+                tmp_file = cache_file.with_suffix('.json.tmp')
+                with open(tmp_file, 'w', encoding='utf-8') as f:
+                    json.dump({"created_at": time.time(), "content": content}, f)
+                os.replace(tmp_file, cache_file)
+            except Exception as e:
+                logger.error(f"Error caching completion: {e}")
+        
+        return content
+    
     def _add_episode_to_memory(self, episode: Dict[str, Any]) -> None:
         """Add episode structure to memory for future reference.
         
@@ -319,16 +722,6 @@ class StoryStructure:
             episode: Episode structure dictionary
         """
         try:
-            # Convert to string for storage
-            episode_str = json.dumps(episode)
-            
-            metadata = {
-                "episode_id": episode["episode_id"],
-                "title": episode["title"],
-                "series": episode["series"],
-                "episode_number": episode["episode_number"]
-            }
-            
             # Add to memory
             self.mem0_client.add_story_structure(
                 structure_data=episode,
@@ -340,29 +733,238 @@ class StoryStructure:
         except Exception as e:
             logger.error(f"Error adding episode to memory: {e}")
     
-    def _save_episode(self, episode: Dict[str, Any]) -> None:
-        """Save episode data to file.
+    def _save_episode(self, episode: Dict[str, Any], serialized: Optional[str] = None) -> None:
+        """Atomically save episode data to file.
+        
+        The structure is written to a temporary file that then replaces the
+        target, so an interrupted save never leaves a truncated file behind.
         
         Args:
             episode: Episode data
+            serialized: Episode data already encoded as JSON, if available
         """
+        # Refresh the index before creating the episode directory, which
+        # would otherwise make the index look stale
+        self._load_index()
+        
         episode_dir = self.episodes_dir / episode["episode_id"]
         episode_dir.mkdir(exist_ok=True)
         
         episode_file = episode_dir / "structure.json"
+        tmp_file = episode_file.with_suffix('.json.tmp')
         
         try:
-            with open(episode_file, 'w') as f:
-                json.dump(episode, f, indent=2)
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                f.write(serialized or json.dumps(episode, indent=SAVE_JSON_INDENT))
+            os.replace(tmp_file, episode_file)
             
             logger.info(f"Saved episode structure to {episode_file}")
         
         except Exception as e:
             logger.error(f"Error saving episode structure: {e}")
+            return
+        
+        self._update_index(episode)
+    
+    async def _search_references_cached(self, query: str, limit: int) -> List[Dict[str, Any]]:
+        """Search reference materials, reusing results for repeated queries.
+        
+        The search blocks on mem0, so it runs on the default executor.
+        
+        Args:
+            query: The search query
+            limit: Maximum number of results to return
+        
+        Returns:
+            List of relevant reference materials
+        """
+        key = (query, limit)
+        if key not in self._reference_cache:
+            loop = asyncio.get_event_loop()
+            self._reference_cache[key] = await loop.run_in_executor(
+                None, functools.partial(search_references, query, limit=limit)
+            )
+        
+        return self._reference_cache[key]
+    
+    async def _save_episode_async(self, episode: Dict[str, Any]) -> None:
+        """Save episode data on the default executor.
+        
+        Used from async paths so the blocking encode and write don't stall
+        in-flight requests on the event loop.
+        
+        Args:
+            episode: Episode data
+        """
+        loop = asyncio.get_event_loop()
+        await loop.run_in_executor(None, self._save_episode, episode)
+    
+    @staticmethod
+    def _episode_summary(episode: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the summary listed for an episode.
+        
+        Args:
+            episode: Episode data
+        
+        Returns:
+            Episode summary dictionary
+        """
+        return {
+            "episode_id": episode.get("episode_id"),
+            "title": episode.get("title"),
+            "series": episode.get("series"),
+            "episode_number": episode.get("episode_number"),
+            "status": episode.get("status", "draft"),
+            "created_at": episode.get("created_at"),
+            "has_script": bool(episode.get("script")),
+            "has_audio": bool(episode.get("audio"))
+        }
+    
+    def _load_index(self) -> Dict[str, Dict[str, Any]]:
+        """Load the episode summary index.
+        
+        The index is rebuilt from the saved episode structures if it is
+        missing, unreadable, or older than the episodes directory (an
+        episode directory was added or removed without going through
+        _save_episode).
+        
+        Returns:
+            Dictionary mapping episode IDs to episode summaries
+        """
+        with self._index_lock:
+            try:
+                index_mtime = os.stat(self.index_file).st_mtime_ns
+                if os.stat(self.episodes_dir).st_mtime_ns > index_mtime:
+                    logger.info("Episode index is out of date, rebuilding")
+                    self._index = None
+                elif self._index is None:
+                    with open(self.index_file, 'rb') as f:
+                        self._index = json.loads(f.read())
+            except FileNotFoundError:
+                self._index = None
+            except Exception as e:
+                logger.error(f"Error loading episode index, rebuilding: {e}")
+                self._index = None
+            
+            if self._index is None:
+                self.rebuild_index()
+            
+            return self._index
+    
+    def _save_index(self) -> None:
+        """Atomically save the episode summary index.
+        
+        The index mtime is aligned with the episodes directory after the
+        rename, so _load_index only sees it as stale once the directory
+        changes again.
+        """
+        tmp_file = self.index_file.with_name(f"{self.index_file.name}.{uuid.uuid4().hex}.tmp")
+        
+        with self._index_lock:
+            try:
+                with open(tmp_file, 'w', encoding='utf-8') as f:
+                    f.write(json.dumps(self._index, separators=(',', ':')))
+                os.replace(tmp_file, self.index_file)
+                
+                dir_mtime = os.stat(self.episodes_dir).st_mtime_ns
+                os.utime(self.index_file, ns=(dir_mtime, dir_mtime))
+            except Exception as e:
+                logger.error(f"Error saving episode index: {e}")
+                tmp_file.unlink(missing_ok=True)
+    
+    def _update_index(self, episode: Dict[str, Any]) -> None:
+        """Insert or replace an episode's entry in the summary index.
+        
+        Uses the index loaded by _save_episode before it created the
+        episode directory.
+        
+        Args:
+            episode: Episode data
+        """
+        summary = self._episode_summary(episode)
+        
+        with self._index_lock:
+            index = self._index if self._index is not None else self._load_index()
+            if index.get(episode["episode_id"]) != summary:
+                # Replace rather than mutate, so indexes already returned by
+                # _load_index can be iterated while episodes are saved
+                self._index = dict(index)
+                self._index[episode["episode_id"]] = summary
+                self._save_index()
+    
+    def _read_episode_summary(self, structure_file: str) -> Optional[Dict[str, Any]]:
+        """Read an episode structure file and build its summary.
+        
+        Args:
+            structure_file: Path of the episode's structure.json
+        
+        Returns:
+            Episode summary dictionary, or None if the file is missing or
+            unreadable
+        """
+        try:
+            with open(structure_file, 'rb') as f:
+                return self._episode_summary(json.loads(f.read()))
+        
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.error(f"Error reading episode structure from {structure_file}: {e}")
+            return None
+    
+    def rebuild_index(self) -> Dict[str, Dict[str, Any]]:
+        """Rebuild the episode summary index from the saved episode structures.
+        
+        Returns:
+            Dictionary mapping episode IDs to episode summaries
+        """
+        # scandir entries carry their type, so no extra stat per directory
+        with os.scandir(self.episodes_dir) as entries:
+            structure_files = [os.path.join(entry.path, "structure.json")
+                               for entry in entries if entry.is_dir()]
+        
+        # The reads are I/O bound and release the GIL, so they overlap on threads
+        with concurrent.futures.ThreadPoolExecutor(max_workers=INDEX_REBUILD_WORKERS) as executor:
+            summaries = executor.map(self._read_episode_summary, structure_files)
+            index = {
+                summary["episode_id"] or os.path.basename(os.path.dirname(structure_file)): summary
+                for structure_file, summary in zip(structure_files, summaries)
+                if summary is not None
+            }
+        
+        with self._index_lock:
+            self._index = index
+            self._save_index()
+        return index
     
     def generate_character_cast(self, episode_id: str) -> List[Dict[str, Any]]:
         """Generate a cast of characters for the episode.
         
+        Args:
+            episode_id: ID of the episode
+        
+        Returns:
+            List of character dictionaries
+        """
+        return self._run(self.generate_character_cast_async(episode_id))
+    
+    async def generate_character_casts(self, episode_ids: List[str]) -> Dict[str, List[Dict[str, Any]]]:
+        """Generate character casts for several episodes concurrently.
+        
+        Args:
+            episode_ids: IDs of the episodes
+        
+        Returns:
+            Dictionary mapping episode IDs to their character lists
+        """
+        casts = await asyncio.gather(*(
+            self.generate_character_cast_async(episode_id) for episode_id in episode_ids
+        ))
+        return dict(zip(episode_ids, casts))
+    
+    async def generate_character_cast_async(self, episode_id: str) -> List[Dict[str, Any]]:
+        """Generate a cast of characters for the episode with the async client.
+        
         Args:
             episode_id: ID of the episode
         
@@ -419,29 +1021,30 @@ class StoryStructure:
             - A medical or counselor role
             - 1-2 additional specialists or guest characters
             
-            Format each character as a detailed profile that can be used for voice casting and character development.
+            Write each character as a detailed profile that can be used for voice casting and character development.
+            
+            Return a JSON object of the form {{"characters": [...]}} where each character is an object with
+            the string keys: name, species, role, personality, backstory, voice_description.
             """
             
             # Query the AI
-            response = self.client.chat.completions.create(
+            character_text = await self._cached_completion(
                 model="gpt-4o",
                 messages=[
                     {"role": "system", "content": "You are a Star Trek universe expert and character creator."},
                     {"role": "user", "content": prompt}
                 ],
                 temperature=0.8,
-                max_tokens=2000
+                max_tokens=2000,
+                response_format={"type": "json_object"}
             )
             
-            # Extract character data from response
-            character_text = response.choices[0].message.content
-            
             # Parse characters from the text
             characters = self._parse_characters(character_text)
             
             # Update episode with characters
             episode["characters"] = characters
-            self._save_episode(episode)
+            await self._save_episode_async(episode)
             
             return characters
         
@@ -452,6 +1055,42 @@ class StoryStructure:
     def _parse_characters(self, character_text: str) -> List[Dict[str, Any]]:
         """Parse character descriptions from generated text.
         
+        The model is asked for a JSON object with a "characters" list; free-form
+        profiles that aren't valid JSON fall back to the text parser.
+        
+        Args:
+            character_text: Generated character descriptions
+        
+        Returns:
+            List of parsed character dictionaries
+        """
+        data = _load_json_object(character_text)
+        if data is None or not isinstance(data.get("characters"), list):
+            return self._parse_characters_text(character_text)
+        
+        characters = []
+        for entry in data["characters"]:
+            if not isinstance(entry, dict):
+                continue
+            
+            char = {
+                key: str(entry[key]).strip()
+                for key in CHARACTER_FIELDS
+                if entry.get(key)
+            }
+            
+            # Add character ID
+            char["character_id"] = f"char_{uuid.uuid4().hex[:8]}"
+            
+            # Add to characters list if we have the minimum info
+            if "name" in char and ("role" in char or "personality" in char):
+                characters.append(char)
+        
+        return characters
+    
+    def _parse_characters_text(self, character_text: str) -> List[Dict[str, Any]]:
+        """Parse free-form character profiles into labeled fields.
+        
         Args:
             character_text: Generated character descriptions
         
@@ -461,7 +1100,7 @@ class StoryStructure:
         characters = []
         
         # Split by double newlines or numbered sections
-        sections = re.split(r'\n\s*\n|\n\d+\.\s+', character_text)
+        sections = _CHARACTER_SECTION_SPLIT.split(character_text)
         
         for section in sections:
             if not section.strip():
@@ -469,54 +1108,35 @@ class StoryStructure:
             
             # Extract character data
             char = {}
+            fields = _extract_fields(section)
             
             # Extract name - usually at the beginning of the section
-            name_match = re.search(r'^[*#]*\s*(?:Name:?\s*)?([A-Za-z\s\'\"]+)', section, re.MULTILINE)
-            if name_match:
-                char["name"] = name_match.group(1).strip()
+            name = _field_value(fields, "name")
+            if name:
+                char["name"] = name.splitlines()[0].strip("*# ")
             else:
-                # Try to find a capitalized name at the beginning
-                name_match = re.search(r'^([A-Z][A-Za-z\'\s]+)(?:\n|\:)', section)
+                name_match = _CHARACTER_NAME.search(section) or _CHARACTER_NAME_FALLBACK.search(section)
                 if name_match:
-                    char["name"] = name_match.group(1).strip()
+                    char["name"] = name_match.group(1).strip().splitlines()[0]
                 else:
                     # Skip if no name found
                     continue
             
-            # Extract species
-            species_match = re.search(r'Species:?\s*([A-Za-z\s\-]+)', section, re.IGNORECASE)
-            if species_match:
-                char["species"] = species_match.group(1).strip()
-            
-            # Extract role
-            role_match = re.search(r'Role:?\s*([^\n]+)', section, re.IGNORECASE)
-            if not role_match:
-                role_match = re.search(r'Position:?\s*([^\n]+)', section, re.IGNORECASE)
-            
-            if role_match:
-                char["role"] = role_match.group(1).strip()
-            
-            # Extract personality
-            personality_match = re.search(r'Personality:?\s*([^\n]+(?:\n[^\n]+)*?)(?:\n\s*[A-Za-z]+:|\Z)', 
-                                         section, re.IGNORECASE)
-            if personality_match:
-                char["personality"] = personality_match.group(1).strip()
-            
-            # Extract backstory
-            backstory_match = re.search(r'Backstory:?\s*([^\n]+(?:\n[^\n]+)*?)(?:\n\s*[A-Za-z]+:|\Z)', 
-                                       section, re.IGNORECASE)
-            if not backstory_match:
-                backstory_match = re.search(r'Background:?\s*([^\n]+(?:\n[^\n]+)*?)(?:\n\s*[A-Za-z]+:|\Z)', 
-                                           section, re.IGNORECASE)
-            
-            if backstory_match:
-                char["backstory"] = backstory_match.group(1).strip()
-            
-            # Extract voice description
-            voice_match = re.search(r'Voice:?\s*([^\n]+(?:\n[^\n]+)*?)(?:\n\s*[A-Za-z]+:|\Z)', 
-                                   section, re.IGNORECASE)
-            if voice_match:
-                char["voice_description"] = voice_match.group(1).strip()
+            # Species and role are single-line fields
+            species = _field_value(fields, "species")
+            if species:
+                char["species"] = species.splitlines()[0]
+            
+            role = _field_value(fields, "role", "position")
+            if role:
+                char["role"] = role.splitlines()[0]
+            
+            for key, prefixes in (("personality", ("personality",)),
+                                  ("backstory", ("backstory", "background")),
+                                  ("voice_description", ("voice",))):
+                value = _field_value(fields, *prefixes)
+                if value:
+                    char[key] = value
             
             # Add character ID
             char["character_id"] = f"char_{uuid.uuid4().hex[:8]}"
@@ -530,6 +1150,10 @@ class StoryStructure:
     async def generate_scenes(self, episode_id: str) -> List[Dict[str, Any]]:
         """Generate scenes for an episode based on its structure and characters.
         
+        Each scene is checkpointed to disk as soon as it is generated, so if
+        the run is interrupted, the next call only generates the missing
+        scenes. The checkpoints are removed once the episode is saved.
+        
         Args:
             episode_id: ID of the episode
         
@@ -545,61 +1169,53 @@ class StoryStructure:
         # Ensure characters exist
         if not episode.get("characters"):
             logger.warning(f"No characters found for episode {episode_id}. Generating characters first.")
-            characters = self.generate_character_cast(episode_id)
+            characters = await self.generate_character_cast_async(episode_id)
             episode["characters"] = characters
         
         try:
-            # Calculate number of scenes based on beats and target duration
-            target_seconds = episode.get("target_duration_minutes", 30) * 60
-            beats = episode.get("beats", [])
-            
-            # Aim for scenes averaging 2-3 minutes
-            target_scenes = max(5, min(15, target_seconds // 150))
-            
-            # Determine number of scenes per beat based on duration ratios
-            scenes_per_beat = {}
-            for beat in beats:
-                # Calculate scenes proportional to beat duration
-                scene_count = max(1, int((beat["duration_seconds"] / target_seconds) * target_scenes))
-                scenes_per_beat[beat["name"]] = scene_count
-            
-            # Search for relevant reference materials
-            query = f"Star Trek {episode.get('theme', '')}"
-            references = search_references(query, limit=3)
+            # Generate scene outlines for each beat, a bounded number at a time
+            semaphore = asyncio.Semaphore(SCENE_MAX_CONCURRENCY)
             
-            # Extract reference text
-            reference_text = "\n".join([ref.get("memory", "") for ref in references])
+            async def generate_outline(**kwargs):
+                async with semaphore:
+                    return await self._generate_scene_outline(episode=episode, **kwargs)
             
-            # Prepare character information
-            character_info = "\n".join([
-                f"{char.get('name', 'Unknown')}: {char.get('species', 'Unknown')} - {char.get('role', 'Unknown')}"
-                for char in episode.get("characters", [])
-            ])
+            # Resume from scenes checkpointed by an interrupted run
+            checkpoint_dir = self.episodes_dir / episode_id / SCENE_CHECKPOINT_DIR
+            checkpoint_dir.mkdir(exist_ok=True)
             
-            # Generate scene outlines for each beat
             all_scenes = []
-            tasks = []
-            
-            for beat in beats:
-                num_scenes = scenes_per_beat.get(beat["name"], 1)
-                for i in range(num_scenes):
-                    task = self._generate_scene_outline(
-                        episode=episode,
-                        beat=beat,
-                        scene_number=len(tasks) + 1,
-                        total_scenes=sum(scenes_per_beat.values()),
-                        reference_text=reference_text,
-                        character_info=character_info
-                    )
-                    tasks.append(task)
+            for checkpoint_file in checkpoint_dir.glob("scene_*.json"):
+                with open(checkpoint_file, 'r', encoding='utf-8') as f:
+                    all_scenes.append(json.load(f))
+            
+            if all_scenes:
+                logger.info(f"Resuming scene generation with {len(all_scenes)} checkpointed scenes")
+            
+            done = {scene["scene_number"] for scene in all_scenes}
+            tasks = [
+                generate_outline(**plan)
+                for plan in await self._plan_scenes(episode)
+                if plan["scene_number"] not in done
+            ]
+            
+            # Run scene generation concurrently, checkpointing scenes as they complete
+            for task in asyncio.as_completed(tasks):
+                scene = await task
+                if not scene:
+                    continue
+                
+                checkpoint_file = checkpoint_dir / f"scene_{scene['scene_number']:03d}.json"
+                with open(checkpoint_file, 'w', encoding='utf-8') as f:
+                    f.write(json.dumps(scene))
+                all_scenes.append(scene)
             
-            # Run scene generation concurrently
-            scene_results = await asyncio.gather(*tasks)
-            all_scenes = [scene for scene in scene_results if scene]
+            all_scenes.sort(key=lambda scene: scene["scene_number"])
             
             # Update episode with scenes
             episode["scenes"] = all_scenes
-            self._save_episode(episode)
+            await self._save_episode_async(episode)
+            shutil.rmtree(checkpoint_dir, ignore_errors=True)
             
             return all_scenes
         
@@ -607,99 +1223,387 @@ class StoryStructure:
             logger.error(f"Error generating scenes: {e}")
             return []
     
-    async def _generate_scene_outline(self, episode: Dict[str, Any], beat: Dict[str, Any],
-                                    scene_number: int, total_scenes: int,
-                                    reference_text: str, character_info: str) -> Dict[str, Any]:
-        """Generate a single scene outline.
+    async def generate_scenes_batch(self, episode_id: str) -> List[Dict[str, Any]]:
+        """Generate scenes for an episode through the OpenAI Batch API.
+        
+        Batch requests cost half as much as realtime ones but may take up to
+        24 hours, so this suits nightly or regeneration jobs. The batch ID is
+        stored in the episode metadata, so calling this again after a restart
+        resumes polling the same batch instead of submitting a new one.
         
         Args:
-            episode: Episode data
-            beat: The story beat this scene belongs to
-            scene_number: Number of this scene in the overall sequence
-            total_scenes: Total number of scenes in the episode
-            reference_text: Relevant reference material text
-            character_info: Character information string
+            episode_id: ID of the episode
         
         Returns:
-            Scene dictionary
+            List of scene dictionaries
         """
+        # Load episode data
+        episode = self.get_episode(episode_id)
+        if not episode:
+            logger.error(f"Episode not found: {episode_id}")
+            return []
+        
+        # Ensure characters exist
+        if not episode.get("characters"):
+            logger.warning(f"No characters found for episode {episode_id}. Generating characters first.")
+            characters = await self.generate_character_cast_async(episode_id)
+            episode["characters"] = characters
+        
         try:
-            # Calculate approximate duration for this scene
-            target_seconds = episode.get("target_duration_minutes", 30) * 60
-            scene_duration = int(target_seconds / total_scenes)
+            metadata = episode.setdefault("metadata", {})
             
-            # Determine approximate position
-            progress = scene_number / total_scenes
+            if "scene_batch" not in metadata:
+                metadata["scene_batch"] = await self._submit_scene_batch(episode)
+                await self._save_episode_async(episode)
             
-            # Create prompt for scene generation
-            prompt = f"""
-            Create a detailed scene outline for a Star Trek-style podcast episode.
+            scene_batch = metadata["scene_batch"]
+            batch = await self._wait_for_batch(scene_batch["batch_id"])
             
-            EPISODE INFORMATION:
-            Title: {episode.get('title')}
-            Theme: {episode.get('theme', 'Not specified')}
+            if batch.status != "completed" or not batch.output_file_id:
+                logger.error(f"Scene batch {batch.id} ended with status {batch.status}")
+                del metadata["scene_batch"]
+                await self._save_episode_async(episode)
+                return []
             
-            STORY BEAT: {beat.get('name')}
-            Beat Description: {beat.get('description')}
-            Scene Number: {scene_number} of {total_scenes}
-            Progress: {progress*100:.0f}% through the story
+            output = await self.async_client.files.content(batch.output_file_id)
             
-            CHARACTERS:
-            {character_info}
+            contents = {}
+            for line in output.text.splitlines():
+                if not line.strip():
+                    continue
+                
+                result = json.loads(line)
+                response = result.get("response") or {}
+                
+                if result.get("error") or response.get("status_code") != 200:
+                    logger.error(f"Scene request {result.get('custom_id')} failed: {result.get('error') or response.get('status_code')}")
+                    continue
+                
+                contents[result["custom_id"]] = response["body"]["choices"][0]["message"]["content"]
             
-            REFERENCE MATERIAL:
-            {reference_text[:500] if reference_text else "No specific reference material."}
+            all_scenes = [
+                self._build_scene(contents[request["custom_id"]], request["beat"],
+                                  request["scene_number"], request["duration_seconds"])
+                for request in scene_batch["requests"]
+                if request["custom_id"] in contents
+            ]
             
-            Create a detailed scene outline with:
-            1. Setting (where the scene takes place)
-            2. Character participants (who is in this scene)
-            3. Plot (what happens in this scene)
-            4. Dialogue suggestions (key lines or exchanges)
-            5. Atmosphere/mood
-            6. Sound effects/music suggestions
+            # Update episode with scenes
+            del metadata["scene_batch"]
+            episode["scenes"] = all_scenes
+            await self._save_episode_async(episode)
             
-            The scene should be appropriate for the beat it's in, advancing the story in a compelling way.
-            Target scene length: {scene_duration//60} minutes {scene_duration%60} seconds.
-            """
+            return all_scenes
+        
+        except Exception as e:
+            logger.error(f"Error generating scenes in batch: {e}")
+            return []
+    
+    async def _submit_scene_batch(self, episode: Dict[str, Any]) -> Dict[str, Any]:
+        """Upload the scene outline requests for an episode and start a batch.
+        
+        Args:
+            episode: Episode data
+        
+        Returns:
+            Batch record with the batch ID and the requests it contains
+        """
+        requests = []
+        lines = []
+        
+        for plan in await self._plan_scenes(episode):
+            custom_id = f"{episode['episode_id']}:{plan['scene_number']}"
+            requests.append({
+                "custom_id": custom_id,
+                "beat": plan["beat"]["name"],
+                "scene_number": plan["scene_number"],
+                "duration_seconds": self._scene_duration(episode, plan["total_scenes"])
+            })
+            lines.append(json.dumps({
+                "custom_id": custom_id,
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {
+                    "model": "gpt-4o",
+                    "messages": self._scene_outline_messages(episode=episode, **plan),
+                    "temperature": 0.7,
+                    "max_tokens": 1000,
+                    "response_format": {"type": "json_object"}
+                }
+            }))
+        
+        batch_input = "\n".join(lines).encode("utf-8")
+        input_file = await _with_retry(lambda: self.async_client.files.create(
+            file=(f"{episode['episode_id']}_scenes.jsonl", batch_input),
+            purpose="batch"
+        ))
+        batch = await _with_retry(lambda: self.async_client.batches.create(
+            input_file_id=input_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h"
+        ))
+        
+        logger.info(f"Submitted scene batch {batch.id} with {len(requests)} requests")
+        return {"batch_id": batch.id, "requests": requests}
+    
+    async def _wait_for_batch(self, batch_id: str) -> Any:
+        """Poll a batch with backoff until it reaches a terminal status.
+        
+        Args:
+            batch_id: ID of the batch
+        
+        Returns:
+            Final batch object
+        """
+        delay = BATCH_POLL_INITIAL_DELAY
+        
+        while True:
+            batch = await _with_retry(lambda: self.async_client.batches.retrieve(batch_id))
+            if batch.status in ("completed", "failed", "expired", "cancelled"):
+                return batch
+            
+            logger.info(f"Scene batch {batch_id} is {batch.status}, checking again in {delay}s")
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, BATCH_POLL_MAX_DELAY)
+    
+    async def _plan_scenes(self, episode: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Plan the scenes of an episode across its beats.
+        
+        Args:
+            episode: Episode data
+        
+        Returns:
+            List of scene outline arguments (beat, scene number, totals and context)
+        """
+        # Calculate number of scenes based on beats and target duration
+        target_seconds = episode.get("target_duration_minutes", 30) * 60
+        beats = episode.get("beats", [])
+        
+        # Aim for scenes averaging 2-3 minutes
+        target_scenes = max(5, min(15, target_seconds // 150))
+        
+        # Determine number of scenes per beat based on duration ratios
+        scenes_per_beat = {}
+        for beat in beats:
+            # Calculate scenes proportional to beat duration
+            scene_count = max(1, int((beat["duration_seconds"] / target_seconds) * target_scenes))
+            scenes_per_beat[beat["name"]] = scene_count
+        
+        # Search for reference materials relevant to each beat concurrently
+        theme = episode.get("theme") or ""
+        beat_references = await asyncio.gather(*(
+            self._search_references_cached(f"Star Trek {theme} {beat['name']}", limit=2)
+            for beat in beats
+        ))
+        
+        # Extract reference text per beat
+        reference_texts = {
+            beat["name"]: "\n".join([ref.get("memory", "") for ref in references])
+            for beat, references in zip(beats, beat_references)
+        }
+        
+        # Prepare character information, dropping species for large casts
+        characters = episode.get("characters", [])
+        character_info = "\n".join([
+            f"{char.get('name', 'Unknown')}: {char.get('species', 'Unknown')} - {char.get('role', 'Unknown')}"
+            for char in characters
+        ])
+        if len(character_info) > SCENE_CHARACTER_INFO_LIMIT:
+            character_info = "\n".join([
+                f"{char.get('name', 'Unknown')} - {char.get('role', 'Unknown')}"
+                for char in characters
+            ])
+        
+        total_scenes = sum(scenes_per_beat.values())
+        plans = []
+        
+        for beat in beats:
+            for i in range(scenes_per_beat.get(beat["name"], 1)):
+                plans.append({
+                    "beat": beat,
+                    "scene_number": len(plans) + 1,
+                    "total_scenes": total_scenes,
+                    "reference_text": reference_texts[beat["name"]],
+                    "character_info": character_info
+                })
+        
+        return plans
+    
+    def _scene_duration(self, episode: Dict[str, Any], total_scenes: int) -> int:
+        """Calculate the approximate duration of each scene in seconds."""
+        target_seconds = episode.get("target_duration_minutes", 30) * 60
+        return int(target_seconds / total_scenes)
+    
+    def _scene_outline_messages(self, episode: Dict[str, Any], beat: Dict[str, Any],
+                                scene_number: int, total_scenes: int,
+                                reference_text: str, character_info: str) -> List[Dict[str, str]]:
+        """Build the chat messages for a single scene outline.
+        
+        Everything shared by the scenes of an episode goes in the system
+        message and the beat-specific details and references in the user
+        message, so the identical prefix can be served from OpenAI's prompt
+        cache.
+        
+        Args:
+            episode: Episode data
+            beat: The story beat this scene belongs to
+            scene_number: Number of this scene in the overall sequence
+            total_scenes: Total number of scenes in the episode
+            reference_text: Relevant reference material text
+            character_info: Character information string
+        
+        Returns:
+            System and user messages
+        """
+        scene_duration = self._scene_duration(episode, total_scenes)
+        
+        # Determine approximate position
+        progress = scene_number / total_scenes
+        
+        system = (
+            f"{SCENE_SYSTEM_PROMPT}\n"
+            f"You write scene outlines for the Star Trek-style podcast episode "
+            f"\"{episode.get('title')}\" (theme: {episode.get('theme') or 'Not specified'}).\n\n"
+            f"CHARACTERS:\n{character_info}\n\n"
+            f"Each outline covers the setting, the characters in the scene, the plot, dialogue "
+            f"suggestions, atmosphere/mood and sound effects/music, and advances the story in a way "
+            f"that fits its beat. Return a JSON object with the keys: setting, characters (a list of "
+            f"names), plot, dialogue, atmosphere, sound_effects."
+        )
+        user = (
+            f"Beat: {beat.get('name')} - {beat.get('description')}\n"
+            f"Scene {scene_number} of {total_scenes} ({progress*100:.0f}% through the story), "
+            f"target length {scene_duration//60} minutes {scene_duration%60} seconds.\n\n"
+            f"REFERENCE MATERIAL:\n{reference_text[:SCENE_REFERENCE_LIMIT] or 'No specific reference material.'}"
+        )
+        
+        return [
+            {"role": "system", "content": system},
+            {"role": "user", "content": user}
+        ]
+    
+    def _build_scene(self, scene_content: str, beat_name: str,
+                     scene_number: int, duration_seconds: int) -> Dict[str, Any]:
+        """Parse a generated scene outline and add its metadata.
+        
+        Args:
+            scene_content: Generated scene description
+            beat_name: Name of the story beat the scene belongs to
+            scene_number: Number of this scene in the overall sequence
+            duration_seconds: Approximate scene duration
+        
+        Returns:
+            Scene dictionary
+        """
+        # Parse scene into structured format
+        scene = self._parse_scene(scene_content)
+        
+        # Add scene metadata
+        scene["scene_id"] = f"scene_{uuid.uuid4().hex[:8]}"
+        scene["scene_number"] = scene_number
+        scene["beat"] = beat_name
+        scene["duration_seconds"] = duration_seconds
+        
+        return scene
+    
+    def _pick_scene_provider(self, scene_number: int) -> str:
+        """Choose the provider for a scene outline request.
+        
+        When OpenRouter is configured, the provider with the lower median of
+        its recent time-to-first-token is chosen, so a slow provider is
+        quickly avoided. Time to first token is comparable across providers
+        even though OpenAI outlines stream in full and OpenRouter ones can
+        stop early.
+        Providers without samples count as fastest, and ties alternate by
+        scene number so both providers get measured.
+        
+        Args:
+            scene_number: Number of the scene being generated
+        
+        Returns:
+            "openai" or "openrouter"
+        """
+        if not self.using_openrouter:
+            return "openai"
+        
+        providers = ("openai", "openrouter") if scene_number % 2 else ("openrouter", "openai")
+        return min(providers, key=lambda name: statistics.median(self._provider_latencies[name])
+                   if self._provider_latencies[name] else 0.0)
+    
+    async def _generate_scene_outline(self, episode: Dict[str, Any], beat: Dict[str, Any],
+                                    scene_number: int, total_scenes: int,
+                                    reference_text: str, character_info: str) -> Dict[str, Any]:
+        """Generate a single scene outline.
+        
+        Args:
+            episode: Episode data
+            beat: The story beat this scene belongs to
+            scene_number: Number of this scene in the overall sequence
+            total_scenes: Total number of scenes in the episode
+            reference_text: Relevant reference material text
+            character_info: Character information string
+        
+        Returns:
+            Scene dictionary
+        """
+        try:
+            # Create prompt for scene generation
+            messages = self._scene_outline_messages(episode, beat, scene_number, total_scenes,
+                                                    reference_text, character_info)
+            prompt_length = sum(len(message["content"]) for message in messages)
             
             # Decide whether to use OpenAI or OpenRouter
-            use_openrouter = self.using_openrouter and random.random() < 0.3  # 30% chance to use OpenRouter if available
+            provider = self._pick_scene_provider(scene_number)
             
-            # Query the AI
-            if use_openrouter:
-                response = await self.async_openrouter_client.chat.completions.create(
-                    model="anthropic/claude-3-opus",
-                    messages=[
-                        {"role": "system", "content": "You are an expert screenwriter specializing in science fiction and Star Trek."},
-                        {"role": "user", "content": prompt}
-                    ],
-                    temperature=0.7,
-                    max_tokens=1000
-                )
+            # JSON mode is only requested from OpenAI; OpenRouter replies fall
+            # back to the text parser if they aren't valid JSON
+            if provider == "openrouter":
+                client, model, extra = self.async_openrouter_client, "anthropic/claude-3-opus", {}
             else:
-                response = await self.async_client.chat.completions.create(
-                    model="gpt-4o",
-                    messages=[
-                        {"role": "system", "content": "You are an expert screenwriter specializing in science fiction and Star Trek."},
-                        {"role": "user", "content": prompt}
-                    ],
+                client, model, extra = self.async_client, "gpt-4o", {"response_format": {"type": "json_object"}}
+            
+            async def request():
+                await self.rate_limiter.acquire(prompt_length // 4 + 1000)
+                
+                # Timed from here, so rate limiting and retry backoff don't
+                # count against the provider
+                start = time.perf_counter()
+                stream = await client.chat.completions.create(
+                    model=model,
+                    messages=messages,
                     temperature=0.7,
-                    max_tokens=1000
+                    max_tokens=1000,
+                    stream=True,
+                    **extra
                 )
+                
+                # Stop reading once a text outline has all its fields, which
+                # cancels the rest of the generation
+                chunks = []
+                try:
+                    async for chunk in stream:
+                        if not chunk.choices or not chunk.choices[0].delta.content:
+                            continue
+                        
+                        delta = chunk.choices[0].delta.content
+                        if not chunks:
+                            self._provider_latencies[provider].append(time.perf_counter() - start)
+                        chunks.append(delta)
+                        
+                        if "\n" in delta:
+                            outline = _complete_text_outline("".join(chunks))
+                            if outline is not None:
+                                return outline
+                finally:
+                    await stream.close()
+                
+                return "".join(chunks)
             
-            # Extract scene content
-            scene_content = response.choices[0].message.content
-            
-            # Parse scene into structured format
-            scene = self._parse_scene(scene_content)
-            
-            # Add scene metadata
-            scene["scene_id"] = f"scene_{uuid.uuid4().hex[:8]}"
-            scene["scene_number"] = scene_number
-            scene["beat"] = beat["name"]
-            scene["duration_seconds"] = scene_duration
+            # Query the AI
+            scene_content = await _with_retry(request)
             
-            return scene
+            return self._build_scene(scene_content, beat["name"], scene_number,
+                                     self._scene_duration(episode, total_scenes))
         
         except Exception as e:
             logger.error(f"Error generating scene outline: {e}")
@@ -708,58 +1612,59 @@ class StoryStructure:
     def _parse_scene(self, scene_content: str) -> Dict[str, Any]:
         """Parse scene description from generated text.
         
+        The model is asked for a JSON object; free-form outlines that aren't
+        valid JSON fall back to the text parser.
+        
         Args:
             scene_content: Generated scene description
         
         Returns:
             Parsed scene dictionary
         """
+        data = _load_json_object(scene_content)
+        if data is None:
+            return self._parse_scene_text(scene_content)
+        
         scene = {}
+        for key in SCENE_FIELDS:
+            value = data.get(key)
+            if not value:
+                continue
+            
+            if key == "characters":
+                if isinstance(value, str):
+                    value = _SCENE_CHARACTER_SPLIT.split(value)
+                scene["characters"] = [str(char).strip() for char in value if str(char).strip()]
+            elif isinstance(value, list):
+                scene[key] = "\n".join(str(item).strip() for item in value)
+            else:
+                scene[key] = str(value).strip()
+        
+        # If we couldn't parse structured data, save the whole content
+        if len(scene) <= 1:
+            scene["content"] = scene_content
+        
+        return scene
+    
+    def _parse_scene_text(self, scene_content: str) -> Dict[str, Any]:
+        """Parse a free-form scene outline into labeled fields.
+        
+        Args:
+            scene_content: Generated scene description
+        
+        Returns:
+            Parsed scene dictionary
+        """
+        scene = {}
+        fields = _extract_fields(scene_content)
         
-        # Extract setting
-        setting_match = re.search(r'Setting:?\s*([^\n]+(?:\n[^\n]+)*?)(?:\n\s*[A-Za-z]+:|\Z)', 
-                                scene_content, re.IGNORECASE)
-        if setting_match:
-            scene["setting"] = setting_match.group(1).strip()
-        
-        # Extract characters
-        characters_match = re.search(r'Characters?:?\s*([^\n]+(?:\n[^\n]+)*?)(?:\n\s*[A-Za-z]+:|\Z)', 
-                                   scene_content, re.IGNORECASE)
-        if characters_match:
-            characters_text = characters_match.group(1).strip()
-            scene["characters"] = [char.strip() for char in re.split(r',|\n', characters_text) if char.strip()]
-        
-        # Extract plot
-        plot_match = re.search(r'Plot:?\s*([^\n]+(?:\n[^\n]+)*?)(?:\n\s*[A-Za-z]+:|\Z)', 
-                             scene_content, re.IGNORECASE)
-        if plot_match:
-            scene["plot"] = plot_match.group(1).strip()
-        
-        # Extract dialogue
-        dialogue_match = re.search(r'Dialogue:?\s*([^\n]+(?:\n[^\n]+)*?)(?:\n\s*[A-Za-z]+:|\Z)', 
-                                 scene_content, re.IGNORECASE)
-        if dialogue_match:
-            scene["dialogue"] = dialogue_match.group(1).strip()
-        
-        # Extract atmosphere
-        atmosphere_match = re.search(r'Atmosphere:?\s*([^\n]+(?:\n[^\n]+)*?)(?:\n\s*[A-Za-z]+:|\Z)', 
-                                   scene_content, re.IGNORECASE)
-        if not atmosphere_match:
-            atmosphere_match = re.search(r'Mood:?\s*([^\n]+(?:\n[^\n]+)*?)(?:\n\s*[A-Za-z]+:|\Z)', 
-                                       scene_content, re.IGNORECASE)
-        
-        if atmosphere_match:
-            scene["atmosphere"] = atmosphere_match.group(1).strip()
-        
-        # Extract sound effects
-        sound_match = re.search(r'Sound Effects:?\s*([^\n]+(?:\n[^\n]+)*?)(?:\n\s*[A-Za-z]+:|\Z)', 
-                              scene_content, re.IGNORECASE)
-        if not sound_match:
-            sound_match = re.search(r'Sound:?\s*([^\n]+(?:\n[^\n]+)*?)(?:\n\s*[A-Za-z]+:|\Z)', 
-                                  scene_content, re.IGNORECASE)
-        
-        if sound_match:
-            scene["sound_effects"] = sound_match.group(1).strip()
+        for key, prefixes in _SCENE_FIELD_LABELS:
+            value = _field_value(fields, *prefixes)
+            if value:
+                scene[key] = value
+        
+        if "characters" in scene:
+            scene["characters"] = [char.strip() for char in _SCENE_CHARACTER_SPLIT.split(scene["characters"]) if char.strip()]
         
         # If we couldn't parse structured data, save the whole content
         if len(scene) <= 1:
@@ -770,6 +1675,17 @@ class StoryStructure:
     def generate_episode_script(self, episode_id: str) -> Dict[str, Any]:
         """Generate a complete script for an episode.
         
+        Args:
+            episode_id: ID of the episode
+        
+        Returns:
+            Dictionary with complete script
+        """
+        return self._run(self.generate_episode_script_async(episode_id))
+    
+    async def generate_episode_script_async(self, episode_id: str) -> Dict[str, Any]:
+        """Generate a complete script for an episode, scenes concurrently.
+        
         Args:
             episode_id: ID of the episode
         
@@ -784,7 +1700,8 @@ class StoryStructure:
             return {}
         
         # Ensure scenes exist
-        if not episode.get("scenes"):
+        scenes = episode.get("scenes") or []
+        if not scenes:
             logger.warning(f"No scenes found for episode {episode_id}. Generate scenes first.")
             return {}
         
@@ -798,25 +1715,48 @@ class StoryStructure:
                 "scenes": []
             }
             
-            # Process each scene to generate detailed script
-            total_scenes = len(episode.get("scenes", []))
+            # Generate the detailed script of every scene, a bounded number at a time
+            total_scenes = len(scenes)
             logger.info(f"Generating script for {total_scenes} scenes...")
+            semaphore = asyncio.Semaphore(SCENE_MAX_CONCURRENCY)
+            
+            # Scenes often share a beat and setting, so look up each distinct
+            # reference query once up front
+            await asyncio.gather(*(
+                self._search_references_cached(query, limit=3)
+                for query in {
+                    f"{scene.get('beat', '')} {scene.get('setting', '')}"
+                    for scene in scenes
+                }
+            ))
             
-            for i, scene in enumerate(episode.get("scenes", []), 1):
-                logger.info(f"Generating script for scene {i}/{total_scenes}: {scene.get('beat', 'Unknown beat')}")
-                # Generate script for this scene
-                scene_script = self._generate_scene_script(episode, scene)
-                script["scenes"].append(scene_script)
-                logger.info(f"Completed scene {i}/{total_scenes}")
+            # Built once so every scene request starts with the same bytes
+            system_prompt = self._scene_script_prefix(episode)
             
-            # Update episode with script
-            logger.info("Updating episode with generated script...")
-            episode["script"] = script
-            self._save_episode(episode)
+            async def generate_scene_script(scene, max_tokens):
+                async with semaphore:
+                    return await self._generate_scene_script_async(
+                        episode, scene, system_prompt, max_tokens
+                    )
             
-            # Save script to separate file for easier editing
-            logger.info("Saving script to file...")
-            self._save_script(episode_id, script)
+            # Bin scenes by predicted length and start the longest first, so
+            # they don't trail behind a pool of finished short scenes
+            max_tokens = [self._scene_script_max_tokens(scene) for scene in scenes]
+            order = sorted(range(total_scenes), key=lambda i: -max_tokens[i])
+            results = await asyncio.gather(*(
+                generate_scene_script(scenes[i], max_tokens[i]) for i in order
+            ))
+            
+            script["scenes"] = [None] * total_scenes
+            for i, scene_script in zip(order, results):
+                script["scenes"][i] = scene_script
+            
+            # Update episode with script, and save the script to a separate
+            # file for easier editing
+            logger.info("Saving episode and script...")
+            episode["script"] = script
+            loop = asyncio.get_event_loop()
+            await loop.run_in_executor(None, self._save_episode_script, episode)
             
             logger.info(f"Script generation completed for episode: {episode.get('title')}")
             return script
@@ -825,75 +1765,143 @@ class StoryStructure:
             logger.error(f"Error generating episode script: {e}")
             return {}
     
-    def _generate_scene_script(self, episode: Dict[str, Any], scene: Dict[str, Any]) -> Dict[str, Any]:
-        """Generate detailed script for a scene.
+    def _scene_script_prefix(self, episode: Dict[str, Any]) -> str:
+        """Build the system message shared by every scene script of an episode.
+        
+        Keeping the episode header and instructions in an identical prefix
+        lets OpenAI serve it from the prompt cache for all but the first
+        scene.
         
         Args:
             episode: Episode data
-            scene: Scene data
         
         Returns:
-            Dictionary with scene script
+            System message content
         """
-        logger.info(f"Preparing to generate script for scene: {scene.get('beat', 'Unknown beat')}")
-        
         # Get character information
-        character_info = ""
-        for char in episode.get('characters', []):
-            character_info += f"{char.get('name', '')}: {char.get('species', '')} - {char.get('role', '')}\n"
-        
-        # Create context for generation
-        logger.info("Creating context for scene generation...")
-        context = (
+        character_info = "".join([
+            f"{char.get('name', '')}: {char.get('species', '')} - {char.get('role', '')}\n"
+            for char in episode.get('characters', [])
+        ])
+        
+        return (
+            f"You are an expert screenwriter for audio dramas.\n"
+            f"You write detailed scene scripts for the Star Trek audio drama episode below.\n\n"
             f"Title: {episode.get('title', '')}\n"
-            f"Theme: {episode.get('theme', '')}\n"
-            f"Beat: {scene.get('beat', '')}\n"
-            f"Setting: {scene.get('setting', '')}\n"
-            f"Scene Number: {scene.get('scene_number', '')}\n\n"
+            f"Theme: {episode.get('theme', '')}\n\n"
             f"Character Information:\n{character_info}\n"
+            f"Each scene includes:\n"
+            f"1. Scene description\n"
+            f"2. Character dialogue\n"
+            f"3. Sound effects\n"
+            f"4. Narration where needed\n\n"
+            f"Format the output with clear scene headings and character names."
         )
+    
+    def _scene_script_max_tokens(self, scene: Dict[str, Any]) -> int:
+        """Pick the max_tokens bin for a scene script from its target length.
+        
+        Every scene of an episode gets the same target length (see
+        _scene_duration); the beat only decides how many scenes it has.
+        
+        Args:
+            scene: Scene data
+        
+        Returns:
+            Smallest SCENE_SCRIPT_TOKEN_BINS level covering the scene's
+            predicted length; the largest level for longer or unknown lengths
+        """
+        duration_seconds = scene.get('duration_seconds')
+        if not duration_seconds:
+            return SCENE_SCRIPT_TOKEN_BINS[-1]
+        
+        predicted = duration_seconds * SCENE_SCRIPT_TOKENS_PER_SECOND
+        return next((tokens for tokens in SCENE_SCRIPT_TOKEN_BINS if tokens >= predicted),
+                    SCENE_SCRIPT_TOKEN_BINS[-1])
+    
+    async def _generate_scene_script_async(self, episode: Dict[str, Any], scene: Dict[str, Any],
+                                           system_prompt: Optional[str] = None,
+                                           max_tokens: Optional[int] = None) -> Dict[str, Any]:
+        """Generate detailed script for a scene with the async client.
+        
+        Args:
+            episode: Episode data
+            scene: Scene data
+            system_prompt: Shared episode prefix from _scene_script_prefix,
+                built here if not given
+            max_tokens: Completion token limit, from _scene_script_max_tokens
+                if not given
+        
+        Returns:
+            Dictionary with scene script
+        """
+        # Per-scene progress is logged lazily, since this runs for every scene
+        # of the fan-out
+        logger.debug("Preparing to generate script for scene: %s", scene.get('beat', 'Unknown beat'))
+        
+        if system_prompt is None:
+            system_prompt = self._scene_script_prefix(episode)
+        if max_tokens is None:
+            max_tokens = self._scene_script_max_tokens(scene)
         
         # Get reference material
-        logger.info("Searching for relevant reference material...")
-        reference_text = search_references(
-            query=f"{scene.get('beat', '')} {scene.get('setting', '')}",
-            limit=3
+        logger.debug("Searching for relevant reference material...")
+        reference_text = await self._search_references_cached(
+            f"{scene.get('beat', '')} {scene.get('setting', '')}", limit=3
         )
         
-        # Create prompt
-        logger.info("Creating generation prompt...")
+        # Scene-specific details go last, after the shared prefix
         prompt = (
-            f"Generate a detailed script for a Star Trek audio drama scene.\n\n"
-            f"Context:\n{context}\n"
-            f"Reference Material:\n{reference_text}\n\n"
-            f"Generate a scene that includes:\n"
-            f"1. Scene description\n"
-            f"2. Character dialogue\n"
-            f"3. Sound effects\n"
-            f"4. Narration where needed\n\n"
-            f"Format the output with clear scene headings and character names."
+            f"Generate the script for this scene.\n\n"
+            f"Beat: {scene.get('beat', '')}\n"
+            f"Setting: {scene.get('setting', '')}\n"
+            f"Scene Number: {scene.get('scene_number', '')}\n\n"
+            f"Reference Material:\n{reference_text}"
         )
         
         try:
             # Generate scene content
-            logger.info("Sending request to AI model...")
-            response = self.client.chat.completions.create(
-                model="gpt-4o",
-                messages=[
-                    {"role": "system", "content": "You are an expert screenwriter for audio dramas."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.7,
-                max_tokens=2000
-            )
+            logger.debug("Sending request to AI model...")
+            
+            async def request():
+                await self.rate_limiter.acquire((len(system_prompt) + len(prompt)) // 4 + max_tokens)
+                stream = await self.async_client.chat.completions.create(
+                    model="gpt-4o",
+                    messages=[
+                        {"role": "system", "content": system_prompt},
+                        {"role": "user", "content": prompt}
+                    ],
+                    temperature=0.7,
+                    max_tokens=max_tokens,
+                    stream=True,
+                    # Routes the episode's scene requests to the same prompt cache
+                    extra_body={"prompt_cache_key": episode.get('episode_id')}
+                )
+                
+                # Parse each paragraph as soon as the one after it starts, so
+                # parsing overlaps with receiving the rest of the scene
+                lines = []
+                buffer = ""
+                try:
+                    async for chunk in stream:
+                        if not chunk.choices or not chunk.choices[0].delta.content:
+                            continue
+                        
+                        buffer += chunk.choices[0].delta.content
+                        if "\n\n" in buffer:
+                            *paragraphs, buffer = _PARAGRAPH_SPLIT.split(buffer)
+                            lines.extend(self._parse_script_paragraphs(paragraphs))
+                finally:
+                    await stream.close()
+                
+                lines.extend(self._parse_script_paragraphs([buffer]))
+                return lines
             
-            # Parse the generated content
-            logger.info("Parsing generated content...")
-            new_content = response.choices[0].message.content
-            new_lines = self._parse_script_lines(new_content)
+            logger.debug("Streaming and parsing generated content...")
+            new_lines = await _with_retry(request)
             
             # Create scene script
-            logger.info("Creating final scene script...")
+            logger.debug("Creating final scene script...")
             scene_script = {
                 "scene_number": scene.get('scene_number'),
                 "beat": scene.get('beat'),
@@ -901,7 +1909,7 @@ class StoryStructure:
                 "lines": new_lines
             }
             
-            logger.info(f"Successfully generated script for scene: {scene.get('beat', 'Unknown beat')}")
+            logger.info("Successfully generated script for scene: %s", scene.get('beat', 'Unknown beat'))
             return scene_script
             
         except Exception as e:
@@ -922,12 +1930,22 @@ class StoryStructure:
         Returns:
             List of line dictionaries
         """
-        lines = []
-        
         # Split script into paragraphs
-        paragraphs = re.split(r'\n{2,}', script_content)
+        return self._parse_script_paragraphs(_PARAGRAPH_SPLIT.split(script_content))
+    
+    def _parse_script_paragraphs(self, paragraphs: List[str]) -> List[Dict[str, Any]]:
+        """Parse script paragraphs into structured lines.
+        
+        Each paragraph is parsed on its own, so a streamed script can be
+        parsed as its paragraphs arrive.
         
-        scene_description = ""
+        Args:
+            paragraphs: Script paragraphs
+        
+        Returns:
+            List of line dictionaries
+        """
+        lines = []
         
         for paragraph in paragraphs:
             paragraph = paragraph.strip()
@@ -935,11 +1953,11 @@ class StoryStructure:
                 continue
             
             # Check for scene description in brackets
-            description_match = re.search(r'\[(.*?)\]', paragraph)
+            description_match = _BRACKETED.search(paragraph) if '[' in paragraph else None
             if description_match:
                 scene_description = description_match.group(1).strip()
                 # Check if there's content after the description
-                remaining = re.sub(r'\[(.*?)\]', '', paragraph).strip()
+                remaining = _BRACKETED.sub('', paragraph).strip()
                 if not remaining:
                     lines.append({
                         "type": "description",
@@ -949,7 +1967,7 @@ class StoryStructure:
                 paragraph = remaining
             
             # Check for sound effect in parentheses
-            sound_effect_match = re.search(r'\((.*?)\)', paragraph)
+            sound_effect_match = _PARENTHESIZED.search(paragraph) if '(' in paragraph else None
             if sound_effect_match and len(sound_effect_match.group(0)) > len(paragraph) * 0.7:
                 lines.append({
                     "type": "sound_effect",
@@ -958,7 +1976,10 @@ class StoryStructure:
                 continue
             
             # Check for character dialogue
-            dialogue_match = re.search(r'^([A-Z][A-Z\s]+)(?:\s*\(.*?\))?\:\s*(.*)', paragraph)
+            # Dialogue starts with an uppercase name and always has a colon
+            dialogue_match = None
+            if 'A' <= paragraph[0] <= 'Z' and ':' in paragraph:
+                dialogue_match = _DIALOGUE.match(paragraph)
             if dialogue_match:
                 character = dialogue_match.group(1).strip()
                 dialogue = dialogue_match.group(2).strip()
@@ -985,27 +2006,54 @@ class StoryStructure:
         
         return lines
     
-    def _save_script(self, episode_id: str, script: Dict[str, Any]) -> None:
-        """Save script to a separate file.
+    def _save_script(self, episode_id: str, script: Dict[str, Any],
+                     serialized: Optional[str] = None) -> None:
+        """Atomically save script to a separate file.
         
         Args:
             episode_id: Episode ID
             script: Script data
+            serialized: Script data already encoded as JSON, if available
         """
         episode_dir = self.episodes_dir / episode_id
         episode_dir.mkdir(exist_ok=True)
         
         script_file = episode_dir / "script.json"
+        tmp_file = script_file.with_suffix('.json.tmp')
         
         try:
-            with open(script_file, 'w') as f:
-                json.dump(script, f, indent=2)
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                f.write(serialized or json.dumps(script, indent=SAVE_JSON_INDENT))
+            os.replace(tmp_file, script_file)
             
             logger.info(f"Saved script to {script_file}")
         
         except Exception as e:
             logger.error(f"Error saving script: {e}")
     
+    def _save_episode_script(self, episode: Dict[str, Any]) -> None:
+        """Save an episode and its script file, encoding the script once.
+        
+        The script JSON written to script.json is spliced into the episode
+        structure in place of its "script" key rather than encoded again.
+        
+        Args:
+            episode: Episode data, including its script
+        """
+        script = episode["script"]
+        script_json = json.dumps(script, indent=SAVE_JSON_INDENT)
+        
+        rest = {key: value for key, value in episode.items() if key != "script"}
+        rest_json = json.dumps(rest, indent=SAVE_JSON_INDENT)
+        if SAVE_JSON_INDENT:
+            separator, closing = ",\n" + " " * SAVE_JSON_INDENT, "\n}"
+        else:
+            separator, closing = ", ", "}"
+        episode_json = f'{rest_json[:-1].rstrip()}{separator}"script": {script_json}{closing}'
+        
+        self._save_episode(episode, episode_json)
+        self._save_script(episode["episode_id"], script, script_json)
+    
     def get_episode(self, episode_id: str) -> Optional[Dict[str, Any]]:
         """Get episode data by ID.
         
@@ -1023,8 +2071,9 @@ class StoryStructure:
             return None
         
         try:
-            with open(structure_file, 'r') as f:
-                return json.load(f)
+            # One read of the raw bytes; json decodes them while parsing
+            with open(structure_file, 'rb') as f:
+                return json.loads(f.read())
         
         except Exception as e:
             logger.error(f"Error reading episode structure: {e}")
@@ -1033,49 +2082,23 @@ class StoryStructure:
     def list_episodes(self, series: Optional[str] = None) -> List[Dict[str, Any]]:
         """List all episodes, optionally filtered by series.
         
+        Summaries come from the episode index, so listing reads one file
+        rather than every episode structure.
+        
         Args:
             series: Optional series name to filter by
         
         Returns:
             List of episode summary dictionaries
         """
-        episodes = []
+        episodes = [
+            dict(summary) for summary in self._load_index().values()
+            if not series or summary.get("series") == series
+        ]
         
-        for episode_dir in self.episodes_dir.iterdir():
-            if not episode_dir.is_dir():
-                continue
-            
-            structure_file = episode_dir / "structure.json"
-            if not structure_file.exists():
-                continue
-            
-            try:
-                with open(structure_file, 'r') as f:
-                    episode = json.load(f)
-                
-                # Apply series filter if specified
-                if series and episode.get("series") != series:
-                    continue
-                
-                # Create summary
-                summary = {
-                    "episode_id": episode.get("episode_id"),
-                    "title": episode.get("title"),
-                    "series": episode.get("series"),
-                    "episode_number": episode.get("episode_number"),
-                    "status": episode.get("status", "draft"),
-                    "created_at": episode.get("created_at"),
-                    "has_script": bool(episode.get("script")),
-                    "has_audio": bool(episode.get("audio"))
-                }
-                
-                episodes.append(summary)
-            
-            except Exception as e:
-                logger.error(f"Error reading episode structure from {structure_file}: {e}")
-        
-        # Sort by series and episode number
-        episodes.sort(key=lambda ep: (ep.get("series", ""), ep.get("episode_number", 0)))
+        # Sort by series and episode number; index summaries always carry
+        # both keys, so a C-level itemgetter can build the sort keys
+        episodes.sort(key=operator.itemgetter("series", "episode_number"))
         
         return episodes
 
@@ -1115,6 +2138,18 @@ def generate_characters(episode_id: str) -> List[Dict[str, Any]]:
     story_structure = get_story_structure()
     return story_structure.generate_character_cast(episode_id)
 
+async def generate_character_casts(episode_ids: List[str]) -> Dict[str, List[Dict[str, Any]]]:
+    """Generate characters for several episodes concurrently.
+    
+    Args:
+        episode_ids: IDs of the episodes
+    
+    Returns:
+        Dictionary mapping episode IDs to their character lists
+    """
+    story_structure = get_story_structure()
+    return await story_structure.generate_character_casts(episode_ids)
+
 async def generate_scenes(episode_id: str) -> List[Dict[str, Any]]:
     """Generate scenes for an episode.
     
@@ -1127,6 +2162,18 @@ async def generate_scenes(episode_id: str) -> List[Dict[str, Any]]:
     story_structure = get_story_structure()
     return await story_structure.generate_scenes(episode_id)
 
+async def generate_scenes_batch(episode_id: str) -> List[Dict[str, Any]]:
+    """Generate scenes for an episode through the OpenAI Batch API.
+    
+    Args:
+        episode_id: ID of the episode
+    
+    Returns:
+        List of scene dictionaries
+    """
+    story_structure = get_story_structure()
+    return await story_structure.generate_scenes_batch(episode_id)
+
 def generate_script(episode_id: str) -> Dict[str, Any]:
     """Generate script for an episode.
     
@@ -1151,6 +2198,15 @@ def get_episode(episode_id: str) -> Optional[Dict[str, Any]]:
     story_structure = get_story_structure()
     return story_structure.get_episode(episode_id)
 
+def save_episode(episode: Dict[str, Any]) -> None:
+    """Save episode data and update the episode index.
+    
+    Args:
+        episode: Episode data
+    """
+    story_structure = get_story_structure()
+    story_structure._save_episode(episode)
+
 def list_episodes(series: Optional[str] = None) -> List[Dict[str, Any]]:
     """List all episodes, optionally filtered by series.
     
@@ -0,0 +1,111 @@
+#!/usr/bin/env python
+"""
+Tests for script_editor module.
+
+These tests verify the script revision history, including delta revisions
+that reference unchanged scenes of their base revision.
+"""
+
+import os
+import sys
+import copy
+import json
+import unittest
+from unittest.mock import patch
+from pathlib import Path
+import tempfile
+import shutil
+
+# Add parent directory to path to import modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Import module to test
+from script_editor import ScriptEditor, _read_revision
+
+class TestScriptRevisions(unittest.TestCase):
+    """Test cases for script revision history."""
+    
+    @classmethod
+    def setUpClass(cls):
+        """Start the patchers shared by all tests."""
+        cls.env_patcher = patch.dict('os.environ', {'OPENAI_API_KEY': 'fake_key'})
+        cls.openai_patcher = patch('script_editor.OpenAI')
+        cls.story_structure_patcher = patch('script_editor.get_story_structure')
+        
+        cls.env_patcher.start()
+        cls.openai_patcher.start()
+        cls.story_structure_patcher.start()
+    
+    @classmethod
+    def tearDownClass(cls):
+        """Stop the shared patchers."""
+        cls.env_patcher.stop()
+        cls.openai_patcher.stop()
+        cls.story_structure_patcher.stop()
+    
+    def setUp(self):
+        """Set up test environment."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.episode_id = "test_episode"
+        (Path(self.temp_dir) / self.episode_id).mkdir()
+        
+        _read_revision.cache_clear()
+        self.editor = ScriptEditor(episodes_dir=self.temp_dir)
+    
+    def tearDown(self):
+        """Clean up after tests."""
+        shutil.rmtree(self.temp_dir)
+    
+    def _make_script(self, version: int) -> dict:
+        """Build a script whose last scene changes with each version."""
+        scenes = [
+            {"scene_number": i + 1, "lines": [{"type": "narration", "content": f"Scene {i + 1}"}]}
+            for i in range(3)
+        ]
+        scenes[-1]["lines"][0]["content"] = f"Final scene, version {version}"
+        return {"episode_id": self.episode_id, "title": "Test Episode", "scenes": scenes}
+    
+    def _save_versions(self, count: int) -> list:
+        """Save several versions of the script, returning each saved script."""
+        saved = []
+        for version in range(count):
+            script = self._make_script(version)
+            self.assertTrue(self.editor.save_script(script))
+            saved.append(copy.deepcopy(script))
+        return saved
+    
+    def test_delta_revision_round_trip(self):
+        """Test that every revision in a delta chain loads as the script it snapshotted."""
+        saved = self._save_versions(5)
+        
+        # Each save after the first snapshots the previous script
+        revisions = sorted(self.editor.get_revisions(self.episode_id), key=lambda r: r["timestamp"])
+        self.assertEqual(len(revisions), len(saved) - 1)
+        
+        revisions_dir = Path(self.temp_dir) / self.episode_id / "revisions"
+        for depth, (revision, expected) in enumerate(zip(revisions, saved)):
+            with open(revisions_dir / revision["file"]) as f:
+                stored = json.load(f)
+            
+            # Later revisions store unchanged scenes as references to their base
+            if depth:
+                self.assertEqual(stored["depth"], depth)
+                self.assertEqual(stored["script"]["scenes"][0], {"$base": 0})
+            else:
+                self.assertNotIn("base_revision", stored)
+            
+            self.assertEqual(self.editor.load_revision(self.episode_id, revision["revision_id"]), expected)
+    
+    def test_load_revision_returns_independent_copy(self):
+        """Test that editing a loaded revision doesn't change later loads."""
+        saved = self._save_versions(3)
+        revisions = sorted(self.editor.get_revisions(self.episode_id), key=lambda r: r["timestamp"])
+        
+        loaded = self.editor.load_revision(self.episode_id, revisions[0]["revision_id"])
+        loaded["scenes"][0]["lines"].append({"type": "narration", "content": "Edited"})
+        
+        for revision, expected in zip(revisions, saved):
+            self.assertEqual(self.editor.load_revision(self.episode_id, revision["revision_id"]), expected)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -10,7 +10,7 @@ import os
 import sys
 import json
 import unittest
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch, MagicMock, AsyncMock
 from pathlib import Path
 import tempfile
 import shutil
@@ -23,37 +23,58 @@ from story_structure import (
     StoryStructure, 
     generate_episode, 
     get_episode,
-    list_episodes
+    list_episodes,
+    SCENE_SCRIPT_TOKEN_BINS,
+    SCENE_SCRIPT_TOKENS_PER_SECOND
 )
 
 class TestStoryStructure(unittest.TestCase):
     """Test cases for story_structure module."""
     
-    def setUp(self):
-        """Set up test environment."""
-        # Create temporary directory for episodes
-        self.temp_dir = tempfile.mkdtemp()
-        
+    @classmethod
+    def setUpClass(cls):
+        """Start the patchers shared by all tests."""
         # Mock environment variables
-        self.env_patcher = patch.dict('os.environ', {
+        cls.env_patcher = patch.dict('os.environ', {
             'OPENAI_API_KEY': 'fake_key',
-            'MEM0_API_KEY': 'fake_key'
+            'MEM0_API_KEY': 'fake_key',
+            'NO_LLM_CACHE': '1'
         })
-        self.env_patcher.start()
+        cls.env_patcher.start()
         
         # Create patchers for external dependencies
-        self.mem0_patcher = patch('story_structure.get_mem0_client')
-        self.openai_patcher = patch('story_structure.OpenAI')
-        self.async_openai_patcher = patch('story_structure.AsyncOpenAI')
-        self.search_refs_patcher = patch('story_structure.search_references')
+        cls.mem0_patcher = patch('story_structure.get_mem0_client')
+        cls.openai_patcher = patch('story_structure.OpenAI')
+        cls.async_openai_patcher = patch('story_structure.AsyncOpenAI')
+        cls.search_refs_patcher = patch('story_structure.search_references')
         
         # Start patchers
-        self.mock_mem0 = self.mem0_patcher.start()
-        self.mock_openai = self.openai_patcher.start()
-        self.mock_async_openai = self.async_openai_patcher.start()
-        self.mock_search_refs = self.search_refs_patcher.start()
+        cls.mock_mem0 = cls.mem0_patcher.start()
+        cls.mock_openai = cls.openai_patcher.start()
+        cls.mock_async_openai = cls.async_openai_patcher.start()
+        cls.mock_search_refs = cls.search_refs_patcher.start()
+    
+    @classmethod
+    def tearDownClass(cls):
+        """Stop the shared patchers."""
+        cls.env_patcher.stop()
+        cls.mem0_patcher.stop()
+        cls.openai_patcher.stop()
+        cls.async_openai_patcher.stop()
+        cls.search_refs_patcher.stop()
+    
+    def setUp(self):
+        """Set up test environment."""
+        # Create temporary directory for episodes
+        self.temp_dir = tempfile.mkdtemp()
         
-        # Configure mocks
+        # Clear calls recorded by earlier tests
+        self.mock_mem0.reset_mock()
+        self.mock_openai.reset_mock()
+        self.mock_async_openai.reset_mock()
+        self.mock_search_refs.reset_mock()
+        
+        # Configure fresh client mocks, since tests replace their attributes
         self.mock_mem0_client = MagicMock()
         self.mock_mem0_client.add_story_structure.return_value = True
         self.mock_mem0_client.search_memory.return_value = []
@@ -79,13 +100,6 @@ class TestStoryStructure(unittest.TestCase):
     
     def tearDown(self):
         """Clean up after tests."""
-        # Stop patchers
-        self.env_patcher.stop()
-        self.mem0_patcher.stop()
-        self.openai_patcher.stop()
-        self.async_openai_patcher.stop()
-        self.search_refs_patcher.stop()
-        
         # Remove temporary directory
         shutil.rmtree(self.temp_dir)
     
@@ -169,7 +183,7 @@ class TestStoryStructure(unittest.TestCase):
         mock_message.content = "The Temporal Paradox"
         mock_choice.message = mock_message
         mock_response.choices = [mock_choice]
-        self.mock_openai_client.chat.completions.create.return_value = mock_response
+        self.mock_async_openai_client.chat.completions.create = AsyncMock(return_value=mock_response)
         
         # Generate title
         title = self.story_structure._generate_title(
@@ -182,10 +196,10 @@ class TestStoryStructure(unittest.TestCase):
         self.assertEqual(title, "The Temporal Paradox")
         
         # Check OpenAI was called
-        self.mock_openai_client.chat.completions.create.assert_called_once()
+        self.mock_async_openai_client.chat.completions.create.assert_awaited_once()
         
         # Test fallback when API fails
-        self.mock_openai_client.chat.completions.create.side_effect = Exception("API Error")
+        self.mock_async_openai_client.chat.completions.create.side_effect = Exception("API Error")
         
         # Generate title - should use fallback
         title = self.story_structure._generate_title(
@@ -283,6 +297,66 @@ class TestStoryStructure(unittest.TestCase):
         # Test non-existent series
         results = self.story_structure.list_episodes(series="Nonexistent Series")
         self.assertEqual(len(results), 0)
+    
+    def test_index_rebuilt_after_external_changes(self):
+        """Test that episode directories added or removed outside the module are listed correctly."""
+        self.story_structure._save_episode({
+            'episode_id': 'test_episode_1',
+            'title': 'Test Episode 1',
+            'series': 'Test Series A',
+            'episode_number': 1
+        })
+        self.assertEqual(len(self.story_structure.list_episodes()), 1)
+        
+        # Age the index, as if it was written before the changes below
+        index_file = Path(self.temp_dir) / "_index.json"
+        index_mtime = os.stat(index_file).st_mtime - 10
+        os.utime(index_file, (index_mtime, index_mtime))
+        
+        # Add an episode directory without going through _save_episode
+        episode_dir = Path(self.temp_dir) / 'test_episode_2'
+        episode_dir.mkdir()
+        with open(episode_dir / "structure.json", 'w') as f:
+            json.dump({
+                'episode_id': 'test_episode_2',
+                'title': 'Test Episode 2',
+                'series': 'Test Series A',
+                'episode_number': 2
+            }, f)
+        
+        results = self.story_structure.list_episodes()
+        self.assertEqual([r['episode_id'] for r in results], ['test_episode_1', 'test_episode_2'])
+        
+        # Remove the first episode's directory
+        index_mtime = os.stat(index_file).st_mtime - 10
+        os.utime(index_file, (index_mtime, index_mtime))
+        shutil.rmtree(Path(self.temp_dir) / 'test_episode_1')
+        
+        results = self.story_structure.list_episodes()
+        self.assertEqual([r['episode_id'] for r in results], ['test_episode_2'])
+        
+        # A fresh instance reads the rebuilt index
+        self.assertEqual(StoryStructure(episodes_dir=self.temp_dir).list_episodes(), results)
+    
+    def test_scene_script_max_tokens_covers_target_length(self):
+        """Test that a scene's max_tokens covers its target length, whatever its beat."""
+        for target_minutes, total_scenes in [(30, 20), (30, 8), (60, 10), (90, 12)]:
+            episode = {'target_duration_minutes': target_minutes}
+            duration_seconds = self.story_structure._scene_duration(episode, total_scenes)
+            
+            budgets = set()
+            for beat in self.story_structure.BEAT_SHEET:
+                scene = {'beat': beat['name'], 'duration_seconds': duration_seconds}
+                budgets.add(self.story_structure._scene_script_max_tokens(scene))
+            
+            # Scenes share a target length, so short beats get the same budget
+            self.assertEqual(len(budgets), 1)
+            max_tokens = budgets.pop()
+            self.assertGreaterEqual(max_tokens, SCENE_SCRIPT_TOKEN_BINS[0])
+            self.assertGreaterEqual(
+                max_tokens,
+                min(duration_seconds * SCENE_SCRIPT_TOKENS_PER_SECOND, SCENE_SCRIPT_TOKEN_BINS[-1])
+            )
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,116 @@
+#!/usr/bin/env python
+"""
+Tests for voice_registry module.
+
+These tests verify how the voice registry is persisted: a JSON snapshot
+plus an append-only change log that is replayed on load and compacted
+back into the snapshot.
+"""
+
+import os
+import sys
+import json
+import unittest
+from unittest.mock import patch, MagicMock
+from pathlib import Path
+import tempfile
+import shutil
+
+# Add parent directory to path to import modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Import module to test
+from voice_registry import VoiceRegistry
+
+class TestVoiceRegistryPersistence(unittest.TestCase):
+    """Test cases for the voice registry snapshot and change log."""
+    
+    @classmethod
+    def setUpClass(cls):
+        """Start the patchers shared by all tests."""
+        cls.env_patcher = patch.dict('os.environ', {'ELEVENLABS_API_KEY': ''})
+        cls.mem0_patcher = patch('voice_registry.get_mem0_client', return_value=MagicMock())
+        
+        cls.env_patcher.start()
+        cls.mem0_patcher.start()
+    
+    @classmethod
+    def tearDownClass(cls):
+        """Stop the shared patchers."""
+        cls.env_patcher.stop()
+        cls.mem0_patcher.stop()
+    
+    def setUp(self):
+        """Set up test environment."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.registry_file = Path(self.temp_dir) / "registry.json"
+        self.log_file = Path(self.temp_dir) / "registry.log.jsonl"
+    
+    def tearDown(self):
+        """Clean up after tests."""
+        shutil.rmtree(self.temp_dir)
+    
+    def _voice(self, voice_registry_id: str, name: str) -> dict:
+        """Build a minimal voice entry."""
+        return {"voice_registry_id": voice_registry_id, "name": name, "voice_id": f"el_{name.lower()}"}
+    
+    def test_log_replay_skips_truncated_last_line(self):
+        """Test that the log is replayed onto the snapshot, ignoring a partial last line."""
+        with open(self.registry_file, 'w') as f:
+            json.dump({"voice_a": self._voice("voice_a", "Alpha")}, f)
+        
+        with open(self.log_file, 'w') as f:
+            f.write(json.dumps({"op": "put", "id": "voice_b", "entry": self._voice("voice_b", "Beta")}) + "\n")
+            f.write(json.dumps({"op": "delete", "id": "voice_a"}) + "\n")
+            f.write('{"op": "put", "id": "voice_c", "en')
+        
+        registry = VoiceRegistry(voices_dir=self.temp_dir)
+        self.assertEqual(registry.registry, {"voice_b": self._voice("voice_b", "Beta")})
+        self.assertEqual(registry.get_voice("beta")["voice_registry_id"], "voice_b")
+        
+        # The log was compacted at load, so later changes aren't appended after the partial line
+        self.assertFalse(self.log_file.exists())
+        registry.update_voice("voice_b", {"description": "Calm"})
+        
+        reloaded = VoiceRegistry(voices_dir=self.temp_dir)
+        self.assertEqual(reloaded.registry["voice_b"]["description"], "Calm")
+    
+    def test_flush_compacts_log_into_snapshot(self):
+        """Test that flush writes logged changes to the snapshot and clears the log."""
+        with open(self.registry_file, 'w') as f:
+            json.dump({
+                "voice_a": self._voice("voice_a", "Alpha"),
+                "voice_b": self._voice("voice_b", "Beta")
+            }, f)
+        
+        registry = VoiceRegistry(voices_dir=self.temp_dir)
+        registry.update_voice("voice_a", {"name": "Aleph"})
+        registry.delete_voice("voice_b")
+        
+        # Small changes are only appended to the log
+        with open(self.log_file) as f:
+            operations = [json.loads(line) for line in f]
+        self.assertEqual([(op["op"], op["id"]) for op in operations], [("put", "voice_a"), ("delete", "voice_b")])
+        
+        registry.flush()
+        self.assertFalse(self.log_file.exists())
+        
+        with open(self.registry_file) as f:
+            snapshot = json.load(f)
+        self.assertEqual(list(snapshot), ["voice_a"])
+        self.assertEqual(snapshot["voice_a"]["name"], "Aleph")
+    
+    def test_log_compacted_once_it_outgrows_snapshot(self):
+        """Test that logging a change compacts the log once it passes the size limit."""
+        registry = VoiceRegistry(voices_dir=self.temp_dir)
+        registry.registry["voice_a"] = self._voice("voice_a", "Alpha")
+        
+        with patch('voice_registry.REGISTRY_LOG_MIN_COMPACT_BYTES', 0):
+            registry._log_change("voice_a", registry.registry["voice_a"])
+        
+        self.assertFalse(self.log_file.exists())
+        with open(self.registry_file) as f:
+            self.assertEqual(json.load(f), {"voice_a": self._voice("voice_a", "Alpha")})
+
+if __name__ == '__main__':
+    unittest.main()
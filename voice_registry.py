@@ -7,17 +7,30 @@ voices using the ElevenLabs API. It maintains persistent voice metadata
 to ensure character voice consistency across episodes.
 """
 
+from __future__ import annotations
+
+import io
 import os
 import json
 import logging
 import time
 import uuid
+import hashlib
+import shutil
+import threading
+import atexit
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Union
+from types import MappingProxyType
+from typing import TYPE_CHECKING
+
+# Annotations are not evaluated at runtime (PEP 563), so the typing names
+# are only needed by type checkers
+if TYPE_CHECKING:
+    from typing import Dict, List, Any, Optional, Union
 
 # Try to import ElevenLabs
 try:
-    from elevenlabs import ElevenLabs, VoiceSettings
+    from elevenlabs import VoiceSettings
     from elevenlabs.client import ElevenLabs as ElevenLabsClient
 except ImportError:
     logging.error("ElevenLabs not found. Please install it with: pip install elevenlabs")
@@ -29,9 +42,32 @@ from mem0_client import get_mem0_client
 # Setup logging
 logger = logging.getLogger(__name__)
 
+# The registry change log is compacted into the snapshot once it grows past
+# this many times the snapshot's size (and at least the minimum)
+REGISTRY_LOG_COMPACT_RATIO = 2
+REGISTRY_LOG_MIN_COMPACT_BYTES = 64 * 1024
+
+# ElevenLabs model used for speech generation
+SPEECH_MODEL = "eleven_monolingual_v1"
+
+# Generated speech is cached on disk up to this many bytes, evicting the
+# least recently used clips beyond it
+SPEECH_CACHE_MAX_BYTES = int(os.environ.get("SPEECH_CACHE_MAX_MB", "500")) * 1024 * 1024
+
+# Seconds the ElevenLabs voice list is reused before being fetched again
+REMOTE_VOICES_TTL = 60.0
+
 class VoiceRegistry:
     """Manages voice registration and retrieval for characters."""
     
+    # Settings registered with newly created voices unless overridden
+    DEFAULT_VOICE_SETTINGS = MappingProxyType({
+        "stability": 0.5,
+        "similarity_boost": 0.75,
+        "style": 0.0,
+        "use_speaker_boost": True
+    })
+    
     def __init__(self, voices_dir: str = "voices"):
         """Initialize the voice registry.
         
@@ -46,55 +82,218 @@ class VoiceRegistry:
         if not self.api_key:
             logger.warning("ELEVENLABS_API_KEY not found in environment variables")
         
-        # Initialize ElevenLabs client if API key is available
-        if self.api_key:
-            self.client = ElevenLabsClient(api_key=self.api_key)
-            self.elevenlabs = ElevenLabs(api_key=self.api_key)
-        else:
-            self.client = None
-            self.elevenlabs = None
-        
-        # Initialize mem0 client
-        self.mem0_client = get_mem0_client()
+        # The ElevenLabs and mem0 clients are created on first use, so
+        # registry lookups don't pay for their setup
+        self._client = None
+        self._mem0_client = None
+        
+        # Guards registry mutation and saving when voices are registered concurrently
+        self._lock = threading.RLock()
+        
+        # Changes are appended to a log, which is compacted into the registry
+        # snapshot when it grows large, by flush(), and at exit for the
+        # singleton (see get_voice_registry); a log left behind is replayed
+        # and compacted on the next load
+        self.registry_file = self.voices_dir / "registry.json"
+        self.registry_log_file = self.voices_dir / "registry.log.jsonl"
+        self._log_fh = None
+        self._log_bytes = 0
+        self._snapshot_bytes = 0
+        
+        # Content-addressed cache of generated speech clips
+        self.audio_cache_dir = self.voices_dir / "audio_cache"
+        self._speech_cache_lock = threading.Lock()
+        self._speech_cache_bytes: Optional[int] = None
+        
+        # ElevenLabs voice IDs from the last voice list fetch
+        self._voice_ids_cache: Optional[set] = None
+        self._voice_ids_fetched_at = 0.0
         
         # Load registry
         self.registry = self._load_registry()
+        self._rebuild_name_index()
+        
+        # A log left behind (normally compacted at exit) may end in a partial
+        # line, so compact it before appending anything after it
+        self.flush()
+    
+    @property
+    def client(self) -> Optional[ElevenLabsClient]:
+        """ElevenLabs client, or None without an API key.
+        
+        A single client is shared so every request reuses the same pooled
+        keep-alive connections.
+        """
+        if self._client is None and self.api_key:
+            self._client = ElevenLabsClient(api_key=self.api_key)
+        
+        return self._client
+    
+    @property
+    def elevenlabs(self) -> Optional[ElevenLabsClient]:
+        """ElevenLabs client used for speech generation (same as client)."""
+        return self.client
+    
+    @property
+    def mem0_client(self):
+        """mem0 client used for voice search."""
+        if self._mem0_client is None:
+            self._mem0_client = get_mem0_client()
+        
+        return self._mem0_client
     
     def _load_registry(self) -> Dict[str, Dict[str, Any]]:
-        """Load the voice registry from file.
+        """Load the voice registry snapshot and replay the change log on it.
         
         Returns:
             Dictionary of voice registry entries
         """
-        registry_file = self.voices_dir / "registry.json"
+        registry = {}
         
-        if registry_file.exists():
-            try:
-                with open(registry_file, 'r') as f:
-                    return json.load(f)
-            except Exception as e:
-                logger.error(f"Error loading voice registry: {e}")
+        try:
+            with open(self.registry_file, 'rb') as f:
+                data = f.read()
+            registry = json.loads(data)
+            self._snapshot_bytes = len(data)
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.error(f"Error loading voice registry: {e}")
         
-        # Return empty registry if file doesn't exist or loading fails
-        return {}
+        try:
+            with open(self.registry_log_file, 'rb') as f:
+                for line in f:
+                    self._log_bytes += len(line)
+                    try:
+                        operation = json.loads(line)
+                    except ValueError:
+                        # A crash can leave a partial last line
+                        logger.warning("Skipping unreadable voice registry log line")
+                        continue
+                    
+                    if operation["op"] == "put":
+                        registry[operation["id"]] = operation["entry"]
+                    else:
+                        registry.pop(operation["id"], None)
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.error(f"Error replaying voice registry log: {e}")
+        
+        return registry
+    
+    def _rebuild_name_index(self) -> None:
+        """Rebuild the lowercased voice name to registry ID index.
+        
+        When several voices share a name, the first one in the registry wins,
+        as with a linear scan.
+        """
+        name_index = {}
+        for voice_registry_id, voice in self.registry.items():
+            if voice.get('name'):
+                name_index.setdefault(voice['name'].lower(), voice_registry_id)
+        
+        self._name_index = name_index
     
     def _save_registry(self) -> None:
-        """Save the voice registry to file."""
-        registry_file = self.voices_dir / "registry.json"
+        """Atomically save the voice registry snapshot and clear the change log.
+        
+        The registry is encoded compactly (json's C encoder) in one write to
+        a temporary file that is synced to disk and then replaces the target,
+        so neither an interrupted save nor a crash leaves a truncated
+        registry behind. The log is only cleared once the snapshot holding
+        its changes is in place; replaying it again would be harmless.
+        """
+        tmp_file = self.registry_file.with_suffix('.json.tmp')
         
         try:
-            with open(registry_file, 'w') as f:
-                json.dump(self.registry, f, indent=2)
+            with self._lock:
+                data = json.dumps(self.registry, separators=(',', ':'))
+                with open(tmp_file, 'w', encoding='utf-8') as f:
+                    f.write(data)
+                    # Make the new contents durable before they replace the old file
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_file, self.registry_file)
+                self._snapshot_bytes = len(data)
+                
+                if self._log_fh is not None:
+                    self._log_fh.close()
+                    self._log_fh = None
+                if self._log_bytes:
+                    try:
+                        os.remove(self.registry_log_file)
+                    except FileNotFoundError:
+                        pass
+                    self._log_bytes = 0
             
             logger.info("Voice registry saved successfully")
         except Exception as e:
             logger.error(f"Error saving voice registry: {e}")
     
-    def register_voice(self, voice_data: Dict[str, Any]) -> Dict[str, Any]:
+    def _log_change(self, voice_registry_id: str, voice_entry: Optional[Dict[str, Any]] = None) -> None:
+        """Append a registry change to the change log.
+        
+        Each change costs one short append rather than a rewrite of the whole
+        registry. The log is compacted into the snapshot once it outgrows it.
+        
+        Args:
+            voice_registry_id: ID of the changed voice
+            voice_entry: New voice entry, or None if the voice was deleted
+        """
+        if voice_entry is None:
+            operation = {"op": "delete", "id": voice_registry_id}
+        else:
+            operation = {"op": "put", "id": voice_registry_id, "entry": voice_entry}
+        line = (json.dumps(operation, separators=(',', ':')) + "\n").encode('utf-8')
+        
+        with self._lock:
+            try:
+                if self._log_fh is None:
+                    self._log_fh = open(self.registry_log_file, 'ab')
+                self._log_fh.write(line)
+                self._log_fh.flush()
+                self._log_bytes += len(line)
+            except Exception as e:
+                logger.error(f"Error logging voice registry change, saving registry: {e}")
+                self._save_registry()
+                return
+            
+            if self._log_bytes > max(REGISTRY_LOG_COMPACT_RATIO * self._snapshot_bytes,
+                                     REGISTRY_LOG_MIN_COMPACT_BYTES):
+                self._save_registry()
+    
+    def _get_remote_voice_ids(self, ttl: float = REMOTE_VOICES_TTL) -> set:
+        """Get the IDs of the voices available in ElevenLabs.
+        
+        The voice list is fetched at most once per ttl seconds, so
+        verifying or health-checking many voices costs one request.
+        
+        Args:
+            ttl: Maximum age in seconds of a cached voice list
+        
+        Returns:
+            Set of ElevenLabs voice IDs
+        """
+        if self._voice_ids_cache is None or time.time() - self._voice_ids_fetched_at >= ttl:
+            voices = self.client.voices.get_all()
+            self._voice_ids_cache = {voice.voice_id for voice in voices.voices}
+            self._voice_ids_fetched_at = time.time()
+        
+        return self._voice_ids_cache
+    
+    def flush(self) -> None:
+        """Compact the change log into the registry snapshot if it has changes."""
+        with self._lock:
+            if self._log_bytes:
+                self._save_registry()
+    
+    def register_voice(self, voice_data: Dict[str, Any], verify: bool = True) -> Dict[str, Any]:
         """Register a new voice in the registry.
         
         Args:
             voice_data: Voice data including name, voice_id, and description
+            verify: Whether to check the voice ID exists with ElevenLabs
         
         Returns:
             Registered voice data with ID
@@ -108,13 +307,13 @@ class VoiceRegistry:
                 return {"error": error_msg}
         
         # Check if voice exists with ElevenLabs if client is available
-        if self.client and 'voice_id' in voice_data:
+        if verify and self.client:
             try:
-                # Check if voice ID exists
-                voices = self.client.voices.get_all()
-                voice_ids = [voice.voice_id for voice in voices.voices]
-                
-                if voice_data['voice_id'] not in voice_ids:
+                # Check if voice ID exists, refetching once in case the voice
+                # was added to ElevenLabs after the cached list was fetched
+                voice_id = voice_data['voice_id']
+                if (voice_id not in self._get_remote_voice_ids() and
+                        voice_id not in self._get_remote_voice_ids(ttl=0)):
                     error_msg = f"Voice ID not found in ElevenLabs: {voice_data['voice_id']}"
                     logger.error(error_msg)
                     return {"error": error_msg}
@@ -122,25 +321,26 @@ class VoiceRegistry:
                 logger.warning(f"Couldn't verify voice ID with ElevenLabs: {e}")
         
         # Generate a unique voice registry ID
-        voice_registry_id = voice_data.get('voice_registry_id', f"voice_{uuid.uuid4().hex[:8]}")
+        voice_registry_id = voice_data.get('voice_registry_id') or f"voice_{uuid.uuid4().hex[:8]}"
         
         # Prepare voice entry
+        now = time.time()
         voice_entry = {
             "voice_registry_id": voice_registry_id,
             "name": voice_data['name'],
             "voice_id": voice_data['voice_id'],
             "description": voice_data.get('description', ''),
             "character_bio": voice_data.get('character_bio', ''),
-            "created_at": time.time(),
-            "updated_at": time.time(),
+            "created_at": now,
+            "updated_at": now,
             "settings": voice_data.get('settings', {})
         }
         
-        # Add to registry
-        self.registry[voice_registry_id] = voice_entry
-        
-        # Save registry
-        self._save_registry()
+        # Add to registry and save
+        with self._lock:
+            self.registry[voice_registry_id] = voice_entry
+            self._name_index.setdefault(voice_entry['name'].lower(), voice_registry_id)
+            self._log_change(voice_registry_id, voice_entry)
         
         # Add to memory
         self._add_voice_to_memory(voice_entry)
@@ -161,9 +361,9 @@ class VoiceRegistry:
             return self.registry[identifier]
         
         # Check for character name match
-        for voice_id, voice in self.registry.items():
-            if voice.get('name', '').lower() == identifier.lower():
-                return voice
+        voice_registry_id = self._name_index.get(identifier.lower())
+        if voice_registry_id is not None:
+            return self.registry[voice_registry_id]
         
         # No match found
         return None
@@ -178,26 +378,34 @@ class VoiceRegistry:
         Returns:
             Updated voice data
         """
-        # Check if voice exists
-        if voice_registry_id not in self.registry:
-            error_msg = f"Voice not found in registry: {voice_registry_id}"
-            logger.error(error_msg)
-            return {"error": error_msg}
-        
-        # Create a copy of the current entry
-        voice_entry = self.registry[voice_registry_id].copy()
-        
-        # Update fields
-        for key, value in updates.items():
-            if key != 'voice_registry_id':  # Don't allow changing the ID
-                voice_entry[key] = value
-        
-        # Update timestamp
-        voice_entry['updated_at'] = time.time()
-        
-        # Save to registry
-        self.registry[voice_registry_id] = voice_entry
-        self._save_registry()
+        with self._lock:
+            # Check if voice exists
+            if voice_registry_id not in self.registry:
+                error_msg = f"Voice not found in registry: {voice_registry_id}"
+                logger.error(error_msg)
+                return {"error": error_msg}
+            
+            voice_entry = self.registry[voice_registry_id]
+            
+            # Collect the fields that actually change
+            changes = {
+                key: value for key, value in updates.items()
+                if key != 'voice_registry_id'  # Don't allow changing the ID
+                and (key not in voice_entry or voice_entry[key] != value)
+            }
+            
+            # Nothing changed, so skip the save and memory round trip
+            if not changes:
+                return voice_entry
+            
+            # Update the entry in place, with a new timestamp
+            renamed = 'name' in changes
+            voice_entry.update(changes)
+            voice_entry['updated_at'] = time.time()
+            
+            if renamed:
+                self._rebuild_name_index()
+            self._log_change(voice_registry_id, voice_entry)
         
         # Update in memory
         self._add_voice_to_memory(voice_entry)
@@ -213,17 +421,20 @@ class VoiceRegistry:
         Returns:
             Status of the delete operation
         """
-        # Check if voice exists
-        if voice_registry_id not in self.registry:
-            error_msg = f"Voice not found in registry: {voice_registry_id}"
-            logger.error(error_msg)
-            return {"error": error_msg, "success": False}
-        
-        # Remove from registry
-        deleted_voice = self.registry.pop(voice_registry_id)
-        
-        # Save registry
-        self._save_registry()
+        with self._lock:
+            # Check if voice exists
+            if voice_registry_id not in self.registry:
+                error_msg = f"Voice not found in registry: {voice_registry_id}"
+                logger.error(error_msg)
+                return {"error": error_msg, "success": False}
+            
+            # Remove from registry
+            deleted_voice = self.registry.pop(voice_registry_id)
+            if deleted_voice.get('name'):
+                self._rebuild_name_index()
+            
+            # Log the deletion
+            self._log_change(voice_registry_id)
         
         return {"success": True, "deleted": deleted_voice}
     
@@ -241,11 +452,17 @@ class VoiceRegistry:
         Args:
             voice_entry: Voice entry to add to memory
         """
+        if self.mem0_client is None:
+            return
+        
         try:
+            name = voice_entry.get('name')
+            voice_id = voice_entry.get('voice_id')
+            
             # Create memory-friendly representation
             voice_info = (
-                f"Voice Registry Entry - Character: {voice_entry.get('name', '')}\n"
-                f"Voice ID: {voice_entry.get('voice_id', '')}\n"
+                f"Voice Registry Entry - Character: {name or ''}\n"
+                f"Voice ID: {voice_id or ''}\n"
                 f"Description: {voice_entry.get('description', '')}\n"
                 f"Character Bio: {voice_entry.get('character_bio', '')}"
             )
@@ -257,12 +474,12 @@ class VoiceRegistry:
                 memory_type=self.mem0_client.VOICE_METADATA,
                 metadata={
                     "voice_registry_id": voice_entry.get("voice_registry_id"),
-                    "name": voice_entry.get("name"),
-                    "voice_id": voice_entry.get("voice_id")
+                    "name": name,
+                    "voice_id": voice_id
                 }
             )
             
-            logger.debug(f"Added voice to memory: {voice_entry.get('name')}")
+            logger.debug(f"Added voice to memory: {name}")
         except Exception as e:
             logger.error(f"Error adding voice to memory: {e}")
     
@@ -287,20 +504,20 @@ class VoiceRegistry:
         # Convert to voice entries
         voices = []
         for result in results:
-            metadata = result.get('metadata', {})
-            voice_id = metadata.get('voice_registry_id')
-            
-            if voice_id and voice_id in self.registry:
-                voices.append(self.registry[voice_id])
+            voice = self.registry.get((result.get('metadata') or {}).get('voice_registry_id'))
+            if voice is not None:
+                voices.append(voice)
         
         return voices
     
-    def create_voice_from_description(self, name: str, description: str) -> Dict[str, Any]:
+    def create_voice_from_description(self, name: str, description: str,
+                                      settings: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Create a new ElevenLabs voice from a text description.
         
         Args:
             name: Name of the character/voice
             description: Detailed voice description
+            settings: Optional voice settings to register with the voice
         
         Returns:
             Created voice data
@@ -334,15 +551,15 @@ class VoiceRegistry:
                 "name": name,
                 "voice_id": voice.voice_id,
                 "description": description,
-                "settings": {
-                    "stability": 0.5,
-                    "similarity_boost": 0.75,
-                    "style": 0.0,
-                    "use_speaker_boost": True
-                }
+                "settings": dict(settings or self.DEFAULT_VOICE_SETTINGS)
             }
             
-            return self.register_voice(voice_data)
+            # Keep a cached voice list current with the new voice
+            if self._voice_ids_cache is not None:
+                self._voice_ids_cache.add(voice.voice_id)
+            
+            # The voice ID was just returned by ElevenLabs, so skip re-verifying it
+            return self.register_voice(voice_data, verify=False)
         
         except Exception as e:
             error_msg = f"Error creating voice: {e}"
@@ -350,16 +567,21 @@ class VoiceRegistry:
             return {"error": error_msg}
     
     def generate_speech(self, text: str, voice_identifier: str, 
-                      output_path: Optional[str] = None) -> bytes:
+                      output_path: Optional[str] = None,
+                      return_bytes: bool = True) -> bytes:
         """Generate speech audio for a given text and voice.
         
+        The audio is streamed to output_path chunk by chunk, so callers that
+        only need the file can skip holding the whole clip in memory.
+        
         Args:
             text: Text to convert to speech
             voice_identifier: Voice registry ID or character name
             output_path: Optional path to save the audio file
+            return_bytes: Whether to also collect and return the audio data
         
         Returns:
-            Audio data as bytes
+            Audio data as bytes, or empty bytes if return_bytes is False
         """
         if not self.elevenlabs:
             raise RuntimeError("ElevenLabs client not initialized")
@@ -370,13 +592,26 @@ class VoiceRegistry:
             raise ValueError(f"Voice not found: {voice_identifier}")
         
         voice_id = voice_data['voice_id']
-        settings = voice_data.get('settings', {})
+        settings = {**self.DEFAULT_VOICE_SETTINGS, **voice_data.get('settings', {})}
+        
+        # Reuse the clip generated earlier for the same line, voice and settings
+        payload = json.dumps([voice_id, SPEECH_MODEL, settings, text], sort_keys=True)
+        cache_file = self.audio_cache_dir / f"{hashlib.sha256(payload.encode('utf-8')).hexdigest()}.mp3"
+        use_cache = os.getenv("NO_SPEECH_CACHE") != "1"
+        
+        if use_cache:
+            try:
+                audio = self._read_cached_speech(cache_file, output_path, return_bytes)
+                logger.debug(f"Reused cached speech for {voice_identifier}")
+                return audio
+            except FileNotFoundError:
+                pass
         
         voice_settings = VoiceSettings(
-            stability=settings.get('stability', 0.5),
-            similarity_boost=settings.get('similarity_boost', 0.75),
-            style=settings.get('style', 0.0),
-            use_speaker_boost=settings.get('use_speaker_boost', True)
+            stability=settings['stability'],
+            similarity_boost=settings['similarity_boost'],
+            style=settings['style'],
+            use_speaker_boost=settings['use_speaker_boost']
         )
         
         try:
@@ -384,27 +619,135 @@ class VoiceRegistry:
             audio_data = self.elevenlabs.generate(
                 text=text,
                 voice=voice_id,
-                model="eleven_monolingual_v1",
+                model=SPEECH_MODEL,
                 voice_settings=voice_settings
             )
             
-            # Convert generator to bytes if needed
-            if hasattr(audio_data, '__iter__'):
-                audio_data = b''.join(chunk for chunk in audio_data)
+            # The client may return the audio whole or as a generator of chunks
+            chunks = [audio_data] if isinstance(audio_data, (bytes, bytearray)) else audio_data
+            
+            if use_cache:
+                # Stream into the cache, then copy the finished clip out
+                self.audio_cache_dir.mkdir(exist_ok=True)
+                tmp_file = cache_file.with_name(f"{cache_file.name}.{uuid.uuid4().hex}.tmp")
+                try:
+                    audio = self._write_speech(chunks, tmp_file, return_bytes)
+                    os.replace(tmp_file, cache_file)
+                except Exception:
+                    # Don't leave a partial clip behind in the cache
+                    tmp_file.unlink(missing_ok=True)
+                    raise
+                
+                if output_path:
+                    shutil.copyfile(cache_file, output_path)
+                self._add_to_speech_cache(cache_file)
+            else:
+                audio = self._write_speech(chunks, output_path, return_bytes or not output_path)
             
-            # Save to file if output path is specified
             if output_path:
-                with open(output_path, 'wb') as f:
-                    f.write(audio_data)
                 logger.info(f"Audio saved to {output_path}")
             
-            return audio_data
+            return audio
         
         except Exception as e:
             error_msg = f"Error generating speech: {e}"
             logger.error(error_msg)
             raise RuntimeError(error_msg)
     
+    @staticmethod
+    def _write_speech(chunks: Any, path: Optional[Union[str, Path]], collect: bool) -> bytes:
+        """Write audio chunks to a file as they arrive.
+        
+        Args:
+            chunks: Iterable of audio byte chunks
+            path: Optional path of the file to write
+            collect: Whether to also collect and return the audio data
+        
+        Returns:
+            Audio data as bytes, or empty bytes if collect is False
+        """
+        buffer = io.BytesIO() if collect else None
+        
+        if path:
+            with open(path, 'wb') as f:
+                for chunk in chunks:
+                    f.write(chunk)
+                    if buffer is not None:
+                        buffer.write(chunk)
+        else:
+            for chunk in chunks:
+                buffer.write(chunk)
+        
+        return buffer.getvalue() if buffer is not None else b''
+    
+    def _read_cached_speech(self, cache_file: Path, output_path: Optional[str],
+                            return_bytes: bool) -> bytes:
+        """Serve a generated speech clip from the cache.
+        
+        Args:
+            cache_file: Path of the cached clip
+            output_path: Optional path to copy the clip to
+            return_bytes: Whether to return the audio data
+        
+        Returns:
+            Audio data as bytes, or empty bytes if return_bytes is False
+        
+        Raises:
+            FileNotFoundError: If the clip is not cached
+        """
+        # Touch the clip so eviction sees it as recently used
+        os.utime(cache_file)
+        
+        if output_path:
+            shutil.copyfile(cache_file, output_path)
+            if not return_bytes:
+                return b''
+        
+        with open(cache_file, 'rb') as f:
+            return f.read()
+    
+    def _add_to_speech_cache(self, cache_file: Path) -> None:
+        """Account for a newly cached clip, evicting old clips over the size cap.
+        
+        Args:
+            cache_file: Path of the newly cached clip
+        """
+        with self._speech_cache_lock:
+            try:
+                if self._speech_cache_bytes is None:
+                    with os.scandir(self.audio_cache_dir) as entries:
+                        self._speech_cache_bytes = sum(
+                            entry.stat().st_size for entry in entries if entry.name.endswith('.mp3')
+                        )
+                else:
+                    self._speech_cache_bytes += cache_file.stat().st_size
+                
+                if self._speech_cache_bytes > SPEECH_CACHE_MAX_BYTES:
+                    self._evict_speech_cache()
+            except OSError as e:
+                logger.error(f"Error updating speech cache: {e}")
+    
+    def _evict_speech_cache(self) -> None:
+        """Delete the least recently used cached clips down to 90% of the size cap."""
+        with os.scandir(self.audio_cache_dir) as entries:
+            clips = sorted(
+                (entry.stat().st_mtime, entry.stat().st_size, entry.path)
+                for entry in entries if entry.name.endswith('.mp3')
+            )
+        
+        total = sum(size for _, size, _ in clips)
+        for _, size, path in clips:
+            if total <= SPEECH_CACHE_MAX_BYTES * 0.9:
+                break
+            try:
+                os.remove(path)
+                total -= size
+            except FileNotFoundError:
+                total -= size
+        
+        self._speech_cache_bytes = total
+        logger.info(f"Evicted speech cache down to {total} bytes")
+    
     def check_voice_health(self, voice_registry_id: str) -> Dict[str, Any]:
         """Check if a voice is still available in ElevenLabs.
         
@@ -426,10 +769,7 @@ class VoiceRegistry:
         
         try:
             # Check if voice ID exists
-            voices = self.client.voices.get_all()
-            voice_ids = [voice.voice_id for voice in voices.voices]
-            
-            if voice_id in voice_ids:
+            if voice_id in self._get_remote_voice_ids():
                 return {"status": "healthy", "message": "Voice available in ElevenLabs"}
             else:
                 return {"status": "missing", "message": "Voice not found in ElevenLabs"}
@@ -443,12 +783,25 @@ class VoiceRegistry:
         Returns:
             Health status for all registered voices
         """
-        health_status = {}
-        
-        for voice_id in self.registry:
-            health_status[voice_id] = self.check_voice_health(voice_id)
+        if not self.client:
+            status = {"status": "unknown", "message": "ElevenLabs client not initialized"}
+            return {voice_registry_id: dict(status) for voice_registry_id in self.registry}
         
-        return health_status
+        # One voice list fetch covers every registered voice
+        try:
+            remote_voice_ids = self._get_remote_voice_ids()
+        except Exception as e:
+            status = {"status": "error", "message": f"Error checking voice health: {e}"}
+            return {voice_registry_id: dict(status) for voice_registry_id in self.registry}
+        
+        return {
+            voice_registry_id: (
+                {"status": "healthy", "message": "Voice available in ElevenLabs"}
+                if voice['voice_id'] in remote_voice_ids else
+                {"status": "missing", "message": "Voice not found in ElevenLabs"}
+            )
+            for voice_registry_id, voice in self.registry.items()
+        }
     
     def map_characters_to_voices(self, characters: List[Dict[str, Any]]) -> Dict[str, str]:
         """Map character names to voice IDs based on descriptions.
@@ -461,20 +814,33 @@ class VoiceRegistry:
         """
         character_voices = {}
         
+        try:
+            self._map_characters(characters, character_voices)
+        finally:
+            # Compact the cast's registry changes into the snapshot
+            self.flush()
+        
+        return character_voices
+    
+    def _map_characters(self, characters: List[Dict[str, Any]],
+                        character_voices: Dict[str, str]) -> None:
+        """Map each character to a voice, filling character_voices.
+        
+        Args:
+            characters: List of character dictionaries
+            character_voices: Dictionary to add character name to voice
+                registry ID mappings to
+        """
         for character in characters:
             character_name = character.get('name', '')
             if not character_name:
                 continue
             
-            # Check if character already has a voice
-            existing_voice = None
-            for voice in self.registry.values():
-                if voice.get('name', '').lower() == character_name.lower():
-                    existing_voice = voice
-                    break
-            
-            if existing_voice:
-                character_voices[character_name] = existing_voice['voice_registry_id']
+            # Check if character already has a voice (by name only, so a
+            # character name never matches a registry ID)
+            existing_id = self._name_index.get(character_name.lower())
+            if existing_id:
+                character_voices[character_name] = existing_id
                 continue
             
             # Try to find a matching voice based on description
@@ -496,23 +862,30 @@ class VoiceRegistry:
                     if self.client:
                         new_voice = self.create_voice_from_description(
                             name=character_name,
-                            description=voice_description
+                            description=voice_description,
+                            settings=character.get('voice_settings')
                         )
                         
                         if 'voice_registry_id' in new_voice:
                             character_voices[character_name] = new_voice['voice_registry_id']
-        
-        return character_voices
 
 # Singleton instance
 _voice_registry = None
+_voice_registry_lock = threading.Lock()
 
 def get_voice_registry() -> VoiceRegistry:
-    """Get the VoiceRegistry singleton instance."""
+    """Get the VoiceRegistry singleton instance.
+    
+    Construction is locked so concurrent first calls (e.g. from audio
+    generation threads) share one registry instead of each loading their own.
+    """
     global _voice_registry
     
     if _voice_registry is None:
-        _voice_registry = VoiceRegistry()
+        with _voice_registry_lock:
+            if _voice_registry is None:
+                _voice_registry = VoiceRegistry()
+                atexit.register(_voice_registry.flush)
     
     return _voice_registry
 
@@ -564,18 +937,20 @@ def generate_speech(text: str, voice_identifier: str,
     registry = get_voice_registry()
     return registry.generate_speech(text, voice_identifier, output_path)
 
-def create_voice_from_description(name: str, description: str) -> Dict[str, Any]:
+def create_voice_from_description(name: str, description: str,
+                                  settings: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
     """Create a new ElevenLabs voice from a text description.
     
     Args:
         name: Name of the character/voice
         description: Detailed voice description
+        settings: Optional voice settings to register with the voice
     
     Returns:
         Created voice data
     """
     registry = get_voice_registry()
-    return registry.create_voice_from_description(name, description)
+    return registry.create_voice_from_description(name, description, settings)
 
 def map_characters_to_voices(characters: List[Dict[str, Any]]) -> Dict[str, str]:
     """Map character names to voice IDs based on descriptions.